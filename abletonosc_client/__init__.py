@@ -1,25 +1,28 @@
 """OSC client wrapper for AbletonOSC.
 
 Provides a Pythonic interface to control Ableton Live via OSC.
+
+One AbletonOSCClient owns the UDP send socket and receive server for a
+session. The wrapper classes (Song, Track, Clip, ...) are lightweight
+facades that hold a reference to that client and never open sockets of
+their own, so any number of wrappers share a single socket pair and the
+client-level bundling and caching work across all of them.
+
+Submodules are imported lazily (PEP 562): a script that only touches
+Song and Track doesn't pay import time for the rest of the package.
 """
 
-from abletonosc_client.application import Application
-from abletonosc_client.browser import Browser
-from abletonosc_client.client import AbletonOSCClient
-from abletonosc_client.clip import Clip
-from abletonosc_client.clip_slot import ClipSlot
-from abletonosc_client.device import Device
-from abletonosc_client.midimap import MidiMap
-from abletonosc_client.scene import Scene
-from abletonosc_client.song import Song
-from abletonosc_client.track import Track
-from abletonosc_client.view import View
-from abletonosc_client import scales
-from abletonosc_client import chords
+import importlib
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from abletonosc_client.async_client import AsyncAbletonOSCClient
+    from abletonosc_client.client import AbletonOSCClient
 
 __all__ = [
     "AbletonOSCClient",
     "Application",
+    "AsyncAbletonOSCClient",
     "Browser",
     "Clip",
     "ClipSlot",
@@ -30,17 +33,56 @@ __all__ = [
     "Track",
     "View",
     "connect",
+    "connect_async",
     "scales",
     "chords",
 ]
 
+# name -> (module, attribute); a None attribute means the module itself
+_LAZY = {
+    "AbletonOSCClient": ("abletonosc_client.client", "AbletonOSCClient"),
+    "Application": ("abletonosc_client.application", "Application"),
+    "AsyncAbletonOSCClient": ("abletonosc_client.async_client", "AsyncAbletonOSCClient"),
+    "Browser": ("abletonosc_client.browser", "Browser"),
+    "Clip": ("abletonosc_client.clip", "Clip"),
+    "ClipSlot": ("abletonosc_client.clip_slot", "ClipSlot"),
+    "Device": ("abletonosc_client.device", "Device"),
+    "MidiMap": ("abletonosc_client.midimap", "MidiMap"),
+    "Scene": ("abletonosc_client.scene", "Scene"),
+    "Song": ("abletonosc_client.song", "Song"),
+    "Track": ("abletonosc_client.track", "Track"),
+    "View": ("abletonosc_client.view", "View"),
+    "scales": ("abletonosc_client.scales", None),
+    "chords": ("abletonosc_client.chords", None),
+}
+
+
+def __getattr__(name: str):
+    try:
+        module_name, attr = _LAZY[name]
+    except KeyError:
+        raise AttributeError(
+            f"module {__name__!r} has no attribute {name!r}"
+        ) from None
+    module = importlib.import_module(module_name)
+    value = module if attr is None else getattr(module, attr)
+    # Cache in the module namespace so __getattr__ runs once per name
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    return sorted(__all__)
+
 
 def connect(
     host: str = "127.0.0.1",
     send_port: int = 11000,
     receive_port: int = 11001,
     listen_host: str | None = None,
-) -> AbletonOSCClient:
+    cache: bool = False,
+    cache_ttl: float | None = None,
+) -> "AbletonOSCClient":
     """Create and return an AbletonOSC client.
 
     Convenience function to create a client with default settings.
@@ -51,8 +93,42 @@ def connect(
         receive_port: Port to receive OSC responses (default: 11001)
         listen_host: Address to bind for receiving responses (default: same as host).
                      Set to "0.0.0.0" for WSL2->Windows connections.
+        cache: Enable the client-side query cache (default: off)
+        cache_ttl: Maximum age in seconds for cached entries; implies
+                   cache (default: entries live until invalidated)
 
     Returns:
         Connected AbletonOSCClient instance
     """
-    return AbletonOSCClient(host, send_port, receive_port, listen_host)
+    from abletonosc_client.client import AbletonOSCClient
+
+    return AbletonOSCClient(
+        host, send_port, receive_port, listen_host, cache=cache, cache_ttl=cache_ttl
+    )
+
+
+async def connect_async(
+    host: str = "127.0.0.1",
+    send_port: int = 11000,
+    receive_port: int = 11001,
+    listen_host: str | None = None,
+) -> "AsyncAbletonOSCClient":
+    """Create, start, and return an asyncio AbletonOSC client.
+
+    Convenience coroutine mirroring connect() for asyncio code.
+
+    Args:
+        host: Ableton host address (default: localhost)
+        send_port: Port to send OSC messages (default: 11000)
+        receive_port: Port to receive OSC responses (default: 11001)
+        listen_host: Address to bind for receiving responses (default: same as host).
+                     Set to "0.0.0.0" for WSL2->Windows connections.
+
+    Returns:
+        Started AsyncAbletonOSCClient instance
+    """
+    from abletonosc_client.async_client import AsyncAbletonOSCClient
+
+    client = AsyncAbletonOSCClient(host, send_port, receive_port, listen_host)
+    await client.start()
+    return client
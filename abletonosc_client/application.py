@@ -9,6 +9,8 @@ from abletonosc_client.client import AbletonOSCClient
 class Application:
     """Application-level operations like version info and connection testing."""
 
+    __slots__ = ("_client",)
+
     def __init__(self, client: AbletonOSCClient):
         self._client = client
 
@@ -0,0 +1,184 @@
+"""Asyncio OSC transport for AbletonOSC communication.
+
+Non-blocking counterpart to AbletonOSCClient: sends never block the
+event loop, and queries return awaitables, so independent requests can
+be pipelined with asyncio.gather() instead of paced with sleeps.
+"""
+
+import asyncio
+from collections import deque
+from typing import Any, Callable
+
+from pythonosc import osc_message_builder
+from pythonosc.osc_packet import OscPacket
+
+
+class _OSCProtocol(asyncio.DatagramProtocol):
+    """Datagram protocol that routes incoming OSC messages to the client."""
+
+    def __init__(self, client: "AsyncAbletonOSCClient"):
+        self._client = client
+
+    def datagram_received(self, data: bytes, addr: tuple) -> None:
+        try:
+            packet = OscPacket(data)
+        except Exception:
+            return  # Ignore malformed packets
+        for timed_msg in packet.messages:
+            msg = timed_msg.message
+            self._client._handle_response(msg.address, *msg.params)
+
+
+class AsyncAbletonOSCClient:
+    """Asyncio OSC client for communicating with AbletonOSC.
+
+    Same wire protocol and default ports as AbletonOSCClient, but sends
+    are non-blocking and query() is a coroutine, so several independent
+    queries can overlap their round trips via asyncio.gather().
+
+    Call start() (or use connect_async()) before sending.
+    """
+
+    def __init__(
+        self,
+        host: str = "127.0.0.1",
+        send_port: int = 11000,
+        receive_port: int = 11001,
+        listen_host: str | None = None,
+    ):
+        self.host = host
+        self.send_port = send_port
+        self.receive_port = receive_port
+        # For WSL2->Windows: send to remote host, listen on local interface
+        self.listen_host = listen_host if listen_host is not None else host
+
+        self._transport: asyncio.DatagramTransport | None = None
+        # FIFO of futures per address, so several in-flight queries to
+        # the same address resolve in send order instead of colliding
+        self._pending_responses: dict[str, deque[asyncio.Future]] = {}
+        self._listeners: dict[str, Callable] = {}
+
+    async def start(self) -> None:
+        """Bind the receive socket and prepare to send."""
+        loop = asyncio.get_running_loop()
+        self._transport, _ = await loop.create_datagram_endpoint(
+            lambda: _OSCProtocol(self),
+            local_addr=(self.listen_host, self.receive_port),
+        )
+
+    def _handle_response(self, address: str, *args: Any) -> None:
+        """Handle incoming OSC messages.
+
+        Resolves pending query futures and calls registered listeners.
+        """
+        queue = self._pending_responses.get(address)
+        if queue:
+            future = queue.popleft()
+            if not future.done():
+                future.set_result(tuple(args))
+
+        if address in self._listeners:
+            self._listeners[address](address, *args)
+
+    def send(self, address: str, *args: Any) -> None:
+        """Send an OSC message (fire-and-forget, never blocks).
+
+        Args:
+            address: OSC address pattern (e.g., "/live/song/set/tempo")
+            *args: Arguments to send with the message
+        """
+        if self._transport is None:
+            raise RuntimeError("Client not started - call start() first")
+        msg = osc_message_builder.OscMessageBuilder(address=address)
+        for arg in args:
+            msg.add_arg(arg)
+        self._transport.sendto(msg.build().dgram, (self.host, self.send_port))
+
+    async def query(self, address: str, *args: Any, timeout: float = 2.0) -> tuple:
+        """Send an OSC message and await the response.
+
+        Args:
+            address: OSC address pattern (e.g., "/live/song/get/tempo")
+            *args: Arguments to send with the message
+            timeout: How long to wait for response in seconds
+
+        Returns:
+            Tuple of response arguments
+
+        Raises:
+            TimeoutError: If no response received within timeout
+        """
+        loop = asyncio.get_running_loop()
+        future: asyncio.Future = loop.create_future()
+
+        # Register for response (FIFO per address)
+        queue = self._pending_responses.setdefault(address, deque())
+        queue.append(future)
+
+        try:
+            self.send(address, *args)
+            try:
+                return await asyncio.wait_for(future, timeout)
+            except asyncio.TimeoutError:
+                raise TimeoutError(
+                    f"No response for {address} within {timeout}s"
+                ) from None
+        finally:
+            # Cleanup: drop the future if it's still queued (timeout)
+            try:
+                queue.remove(future)
+            except ValueError:
+                pass
+            if not queue:
+                self._pending_responses.pop(address, None)
+
+    async def query_many(
+        self, queries: list[tuple[str, tuple]], timeout: float = 2.0
+    ) -> list[tuple]:
+        """Overlap several queries' round trips.
+
+        All requests go out without waiting on each other, so N
+        queries cost roughly max(RTT) instead of sum(RTT). Duplicate
+        addresses are safe: responses resolve in send order.
+
+        Args:
+            queries: (address, args) pairs to send
+            timeout: Per-query timeout in seconds
+
+        Returns:
+            Response tuples in the same order as the queries
+
+        Raises:
+            TimeoutError: If any response is missing within timeout
+        """
+        return list(
+            await asyncio.gather(
+                *(
+                    self.query(address, *args, timeout=timeout)
+                    for address, args in queries
+                )
+            )
+        )
+
+    def start_listener(self, address: str, callback: Callable) -> None:
+        """Register a callback for messages at an address.
+
+        Args:
+            address: OSC address to listen for
+            callback: Function(address, *args) to call on message
+        """
+        self._listeners[address] = callback
+
+    def stop_listener(self, address: str) -> None:
+        """Unregister a callback for an address.
+
+        Args:
+            address: OSC address to stop listening for
+        """
+        self._listeners.pop(address, None)
+
+    def close(self) -> None:
+        """Cleanup resources and close the transport."""
+        if self._transport is not None:
+            self._transport.close()
+            self._transport = None
@@ -12,6 +12,8 @@ from abletonosc_client.client import AbletonOSCClient
 class Browser:
     """Browser operations for exploring packs and loading devices."""
 
+    __slots__ = ("_client",)
+
     def __init__(self, client: AbletonOSCClient):
         self._client = client
 
@@ -3,6 +3,9 @@
 Build chords from roots, get chord tones, create voicings.
 """
 
+from functools import lru_cache
+
+from abletonosc_client.clip import Note
 from abletonosc_client.scales import note_to_midi, NOTE_OFFSETS
 
 # Chord formulas as semitone intervals from root
@@ -58,6 +61,14 @@ PROGRESSIONS = {
 # Major scale intervals for chord root calculation
 MAJOR_SCALE = [0, 2, 4, 5, 7, 9, 11]
 
+# Common pad voicings as MIDI note tuples, shared across song scripts
+# so each one doesn't rebuild identical chord lists
+AM_TRIAD_VOICED = (57, 60, 64, 69)  # Am: A3, C4, E4, A4
+F_TRIAD_VOICED = (53, 57, 60, 65)   # F: F3, A3, C4, F4
+C_TRIAD_VOICED = (48, 55, 60, 64)   # C: C3, G3, C4, E4
+G_TRIAD_VOICED = (55, 59, 62, 67)   # G: G3, B3, D4, G4
+FM7_VOICED = (53, 60, 63, 68)       # Fm7: F3, C4, Eb4, Ab4
+
 
 def get_chord(root: str, chord_type: str = 'major', octave: int = 4) -> list[int]:
     """Get MIDI notes for a chord.
@@ -76,12 +87,24 @@ def get_chord(root: str, chord_type: str = 'major', octave: int = 4) -> list[int
         >>> get_chord('A', 'minor', 3)
         [57, 60, 64]
     """
+    return list(_chord_tones(root, chord_type, octave))
+
+
+@lru_cache(maxsize=256)
+def _chord_tones(root: str, chord_type: str, octave: int) -> tuple[int, ...]:
+    """Memoized chord math behind get_chord.
+
+    Pure in its arguments, so repeated lookups (a long song reuses a
+    handful of chord types heavily) hit the cache. Returns a tuple so
+    the cached value stays immutable; get_chord hands callers a fresh
+    list.
+    """
     if chord_type not in CHORD_FORMULAS:
         available = ', '.join(sorted(CHORD_FORMULAS.keys()))
         raise ValueError(f"Unknown chord type: {chord_type}. Available: {available}")
 
     root_midi = note_to_midi(root, octave)
-    return [root_midi + interval for interval in CHORD_FORMULAS[chord_type]]
+    return tuple(root_midi + interval for interval in CHORD_FORMULAS[chord_type])
 
 
 def get_chord_in_key(key: str, degree: int, chord_type: str = 'major',
@@ -228,15 +251,21 @@ def spread(chord: list[int], spread_amount: int = 12) -> list[int]:
         >>> spread([60, 64, 67])  # C major
         [60, 64, 79]  # Root, 3rd, 5th up octave
     """
+    return list(_spread_tones(tuple(chord), spread_amount))
+
+
+@lru_cache(maxsize=256)
+def _spread_tones(chord: tuple[int, ...], spread_amount: int) -> tuple[int, ...]:
+    """Memoized spread math; keyed on an immutable tuple of the chord."""
     if len(chord) <= 2:
-        return chord.copy()
+        return chord
 
-    result = chord.copy()
+    result = list(chord)
     # Move every other note up
     for i in range(2, len(result), 2):
         result[i] += spread_amount
 
-    return result
+    return tuple(result)
 
 
 def drop2(chord: list[int]) -> list[int]:
@@ -263,6 +292,28 @@ def drop2(chord: list[int]) -> list[int]:
     return sorted(result)
 
 
+def chord_notes_at(voicing: tuple[int, ...], start_beat: float,
+                   duration: float, velocity: int) -> tuple[Note, ...]:
+    """Turn a chord voicing into clip notes at a position.
+
+    Args:
+        voicing: MIDI notes of the chord (e.g., AM_TRIAD_VOICED)
+        start_beat: Beat position for all chord tones
+        duration: Duration in beats
+        velocity: MIDI velocity (0-127)
+
+    Returns:
+        Tuple of Note instances, one per chord tone
+
+    Example:
+        >>> chord_notes_at((60, 64, 67), 0.0, 4.0, 80)
+        (Note(pitch=60, ...), Note(pitch=64, ...), Note(pitch=67, ...))
+    """
+    return tuple(
+        Note(pitch, start_beat, duration, velocity) for pitch in voicing
+    )
+
+
 def list_chord_types() -> list[str]:
     """List all available chord types."""
     return sorted(CHORD_FORMULAS.keys())
@@ -1,18 +1,453 @@
 """Core OSC transport layer for AbletonOSC communication."""
 
+import queue
+import socket
+import struct
 import threading
-from typing import Any, Callable
+import time
+from collections import deque
+from functools import lru_cache
+from contextlib import contextmanager
+from typing import TYPE_CHECKING, Any, Callable, Iterator
 
-from pythonosc import udp_client
+from pythonosc import osc_bundle_builder, osc_message_builder
 from pythonosc.dispatcher import Dispatcher
+from pythonosc.osc_message import OscMessage
 from pythonosc.osc_server import ThreadingOSCUDPServer
 
+if TYPE_CHECKING:
+    from abletonosc_client.clip import Clip
+    from abletonosc_client.clip_slot import ClipSlot
+    from abletonosc_client.scene import Scene
+    from abletonosc_client.song import Song
+    from abletonosc_client.track import Track
+
+
+_tls = threading.local()
+
+
+def _build_message(address: str, args: tuple) -> OscMessage:
+    """Serialize one OSC message.
+
+    Single serialization path for sends and bundle flushes; skips the
+    per-call list wrapping that send_message() would do. One builder
+    per thread is pooled and reset between calls (its state is just
+    the address and an args list), so the fallback path for arguments
+    outside the fast encoder's set doesn't allocate a builder per
+    message.
+    """
+    builder = getattr(_tls, "builder", None)
+    if builder is None:
+        builder = _tls.builder = osc_message_builder.OscMessageBuilder()
+    builder._address = address
+    builder._args.clear()
+    for arg in args:
+        builder.add_arg(arg)
+    return builder.build()
+
+
+@lru_cache(maxsize=1024)
+def _address_bytes(address: str) -> bytes:
+    """Padded wire bytes for an OSC address, computed once per address."""
+    encoded = address.encode("ascii") + b"\x00"
+    return encoded + b"\x00" * (-len(encoded) % 4)
+
+
+def _encode_fast(address: str, args: tuple) -> bytes | None:
+    """Encode an int/float/str message with the address bytes cached.
+
+    The common AbletonOSC argument types are packed directly, so the
+    address encode+pad happens once per address instead of once per
+    call. Returns None for anything outside the fast set (bools, blobs,
+    out-of-range ints) so callers fall back to the full builder.
+    """
+    tags = ","
+    payload = b""
+    pack = struct.pack  # Hoisted out of the per-arg loop
+    try:
+        for arg in args:
+            kind = type(arg)
+            if kind is int:
+                tags += "i"
+                payload += pack(">i", arg)
+            elif kind is float:
+                tags += "f"
+                payload += pack(">f", arg)
+            elif kind is str:
+                encoded = arg.encode("utf-8") + b"\x00"
+                tags += "s"
+                payload += encoded + b"\x00" * (-len(encoded) % 4)
+            else:
+                return None
+    except struct.error:
+        return None
+    tag_bytes = tags.encode("ascii") + b"\x00"
+    tag_bytes += b"\x00" * (-len(tag_bytes) % 4)
+    return _address_bytes(address) + tag_bytes + payload
+
+
+@lru_cache(maxsize=256)
+def _zero_arg_dgram(address: str) -> bytes:
+    """Complete wire bytes for an argument-less message, cached.
+
+    A zero-arg message is entirely constant (address plus the empty
+    "," typetag), so every send of it after the first is a dict hit.
+    """
+    return _address_bytes(address) + b",\x00\x00\x00"
+
+
+def _encode(address: str, args: tuple) -> bytes:
+    """Encode one outgoing message, preferring the fast path."""
+    if not args:
+        return _zero_arg_dgram(address)
+    dgram = _encode_fast(address, args)
+    return dgram if dgram is not None else _build_message(address, args).dgram
+
+
+def encode_message(address: str, *args: Any) -> bytes:
+    """Encode an OSC message to its wire bytes.
+
+    Lets callers precompute invariant messages once (e.g., at import)
+    and replay them with AbletonOSCClient.send_raw().
+
+    Args:
+        address: OSC address pattern
+        *args: Arguments to encode with the message
+
+    Returns:
+        The encoded datagram
+    """
+    return _encode(address, args)
+
+
+def message_template(address: str, tags: str) -> bytes:
+    """Precompute the fixed header of an OSC message.
+
+    For messages whose argument shape never changes (fire, stop, ...),
+    the address and type-tag sections are constant; callers append
+    struct-packed argument bytes to this template and hand the result
+    to send_raw(), skipping the message builder entirely.
+
+    Args:
+        address: OSC address pattern
+        tags: OSC type tags without the leading comma (e.g., "ii")
+
+    Returns:
+        Address and type-tag bytes, padded to 4-byte boundaries
+    """
+    encoded = address.encode("ascii") + b"\x00"
+    encoded += b"\x00" * (-len(encoded) % 4)
+    tag_bytes = ("," + tags).encode("ascii") + b"\x00"
+    tag_bytes += b"\x00" * (-len(tag_bytes) % 4)
+    return encoded + tag_bytes
+
+
+def _scalar_from_dgram(dgram: bytes, index: int, cast: Callable, default: Any):
+    """Extract one scalar straight from an OSC datagram's bytes.
+
+    Reads the type-tag string and unpacks just the wanted position
+    with struct.unpack_from, skipping full message parsing. Falls back
+    to the parsed path when a variable-width argument (string/blob)
+    precedes the wanted position.
+    """
+    # Type tags follow the padded address; payload follows the padded
+    # tag string
+    end = dgram.index(b"\x00")
+    pos = (end + 4) & ~3
+    end = dgram.index(b"\x00", pos)
+    tags = dgram[pos + 1 : end]
+    pos = (end + 4) & ~3
+
+    if index < 0:
+        index += len(tags)
+    if not 0 <= index < len(tags):
+        return default
+    tag = tags[index : index + 1]
+    if tag not in (b"i", b"f") or not tags[:index].strip(b"if") == b"":
+        # Variable-width argument in the way: parse normally
+        return tail(OscMessage(dgram).params, index, cast, default)
+    value = struct.unpack_from(">i" if tag == b"i" else ">f", dgram, pos + 4 * index)[0]
+    return cast(value)
+
+
+def tail(result: tuple, index: int, cast: Callable = float, default: Any = 0):
+    """Pull one value out of a query response, casting it.
+
+    AbletonOSC responses echo the query indices before the value, so
+    getters read a fixed position past the prefix. try/except costs
+    nothing on the (overwhelmingly common) hit path, unlike the
+    len()-compare branch it replaces in every getter.
+
+    pythonosc already decodes values per the OSC type tags, so most
+    arrive correctly typed; an exact type check skips the redundant
+    constructor call and only coerces at real boundaries (e.g., int
+    0/1 -> bool).
+
+    Args:
+        result: Response tuple from query()
+        index: Position of the wanted value
+        cast: Type to apply to the value
+        default: Returned when the position is missing or None
+
+    Returns:
+        The cast value, or default
+    """
+    try:
+        value = result[index]
+    except IndexError:
+        return default
+    if value is None:
+        return default
+    return value if type(value) is cast else cast(value)
+
+
+def _make_getter(name: str, address: str, keys: int, cast: Callable, default: Any):
+    """Build one generated getter (see osc_properties())."""
+    # Closure cell, so the generated body loads it with LOAD_DEREF
+    # instead of a global lookup per call
+    _tail = tail
+
+    def getter(self, *indices):
+        return _tail(self._client.query(address, *indices), keys, cast, default)
+
+    getter.__name__ = f"get_{name}"
+    getter.__qualname__ = getter.__name__
+    getter.__doc__ = (
+        f"Get the {name} property ({address}).\n\n"
+        "        Args:\n"
+        "            *indices: Object key indices (0-based)\n\n"
+        "        Returns:\n"
+        f"            Value as {cast.__name__}, or {default!r} when missing\n"
+        "        "
+    )
+    return getter
+
+
+def _make_setter(name: str, address: str, cast: Callable):
+    """Build one generated setter (see osc_properties())."""
+
+    def setter(self, *args):
+        *indices, value = args
+        self._client.send(address, *indices, cast(value))
+
+    setter.__name__ = f"set_{name}"
+    setter.__qualname__ = setter.__name__
+    setter.__doc__ = (
+        f"Set the {name} property ({address}).\n\n"
+        "        Args:\n"
+        "            *args: Object key indices (0-based), then the new value\n"
+        "        "
+    )
+    return setter
+
+
+def osc_properties(prefix: str, keys: int, props: tuple):
+    """Class decorator generating uniform getter/setter pairs.
+
+    The wrapper classes contain dozens of methods that differ only in
+    OSC address and result cast; each one is a separately compiled
+    bytecode body. Generating them from a spec leaves two shared code
+    objects (one getter shape, one setter shape) closed over the
+    varying parts, shrinking the import footprint without changing the
+    public API. Names already defined on the class are left alone, so
+    methods with bespoke behavior simply keep their handwritten body.
+
+    Args:
+        prefix: OSC address prefix (e.g., "/live/scene")
+        keys: Number of index arguments identifying the object
+        props: (name, cast, default, writable) tuples; each generates
+            get_<name> and, when writable, set_<name>
+
+    Returns:
+        The class decorator
+    """
+
+    def decorate(cls):
+        for name, cast, default, writable in props:
+            if f"get_{name}" not in cls.__dict__:
+                setattr(
+                    cls,
+                    f"get_{name}",
+                    _make_getter(name, f"{prefix}/get/{name}", keys, cast, default),
+                )
+            if writable and f"set_{name}" not in cls.__dict__:
+                # Booleans go over the wire as int32 0/1
+                set_cast = int if cast is bool else cast
+                setattr(
+                    cls,
+                    f"set_{name}",
+                    _make_setter(name, f"{prefix}/set/{name}", set_cast),
+                )
+        return cls
+
+    return decorate
+
+
+class Subscription:
+    """Handle for an active listen subscription (see subscribe()).
+
+    Pairs the Live-side listener with the client-side callback so
+    teardown can't leave one half behind; unsubscribe() is idempotent.
+    """
+
+    __slots__ = ("_client", "listen_address", "reply_address", "_active")
+
+    def __init__(
+        self, client: "AbletonOSCClient", listen_address: str, reply_address: str
+    ):
+        self._client = client
+        self.listen_address = listen_address
+        self.reply_address = reply_address
+        self._active = True
+
+    def unsubscribe(self) -> None:
+        """Stop Live's listener and remove the callback."""
+        if not self._active:
+            return
+        self._active = False
+        self._client.send(
+            self.listen_address.replace("/start_listen/", "/stop_listen/")
+        )
+        self._client.stop_listener(self.reply_address)
+
+
+class Pipeline:
+    """One burst of interleaved sends and queries (see pipeline()).
+
+    Collects operations while the with-block runs, ships them in a
+    single send_many() burst on exit, then fills .results with the
+    reply tuples for the queries, in query order.
+    """
+
+    __slots__ = ("_client", "_timeout", "_ops", "results")
+
+    def __init__(self, client: "AbletonOSCClient", timeout: float):
+        self._client = client
+        self._timeout = timeout
+        # (datagram, reply address for queries / None for sends)
+        self._ops: list[tuple[bytes, str | None]] = []
+        self.results: list[tuple] = []
+
+    def send(self, address: str, *args: Any) -> None:
+        """Queue a fire-and-forget message for the burst.
+
+        Args:
+            address: OSC address pattern
+            *args: Arguments to send with the message
+        """
+        if self._client._cache_enabled:
+            self._client._invalidate(address)
+        self._ops.append((_encode(address, args), None))
+
+    def query(self, address: str, *args: Any) -> None:
+        """Queue a query whose reply lands in .results.
+
+        Args:
+            address: OSC address pattern (reply comes back on it)
+            *args: Arguments to send with the query
+        """
+        self._ops.append((_encode(address, args), address))
+
+    def __enter__(self) -> "Pipeline":
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        if exc_type is not None:
+            return  # Ship nothing if the block raised
+        client = self._client
+        waiters: list[tuple[str, tuple[threading.Event, list]]] = []
+        # Register every waiter before the burst so no reply can race
+        # past its slot; FIFO deques keep duplicate addresses in order
+        for _, reply_address in self._ops:
+            if reply_address is not None:
+                waiter: tuple[threading.Event, list] = (threading.Event(), [])
+                client._pending_responses.setdefault(
+                    reply_address, deque()
+                ).append(waiter)
+                waiters.append((reply_address, waiter))
+        try:
+            client.send_many([dgram for dgram, _ in self._ops])
+            deadline = time.monotonic() + self._timeout
+            for reply_address, (event, result) in waiters:
+                if not event.wait(max(deadline - time.monotonic(), 0)):
+                    raise TimeoutError(f"No response from {reply_address}")
+                self.results.append(tuple(result))
+        finally:
+            for reply_address, waiter in waiters:
+                client._discard_waiter(reply_address, waiter)
+
+
+class _RawCaptureServer(ThreadingOSCUDPServer):
+    """OSC UDP server with raw-datagram capture and queued dispatch.
+
+    verify_request() is the one pythonosc seam that sees the incoming
+    bytes before parse_message builds Python objects for every
+    argument; the hook lets query_raw() grab the datagram for awaited
+    addresses while normal dispatch continues untouched.
+
+    Parsing and listener callbacks are handed to one dedicated worker
+    thread via a queue, so the receive loop only dequeues datagrams
+    from the socket. When Live floods accumulated listener updates
+    (e.g., after its main menu closes), the kernel buffer drains fast
+    enough that updates aren't dropped, and dispatch stays in arrival
+    order - unlike the per-datagram threads the mixin would spawn.
+    """
+
+    raw_hook: "Callable[[bytes], None] | None" = None
+
+    def __init__(self, server_address, dispatcher):
+        super().__init__(server_address, dispatcher)
+        # Room for a burst of pushed updates while Python catches up
+        self.socket.setsockopt(socket.SOL_SOCKET, socket.SO_RCVBUF, 1 << 20)
+        self._dispatch_queue: queue.SimpleQueue = queue.SimpleQueue()
+        self._dispatch_thread = threading.Thread(
+            target=self._dispatch_loop, daemon=True
+        )
+        self._dispatch_thread.start()
+
+    def verify_request(self, request, client_address) -> bool:
+        valid = super().verify_request(request, client_address)
+        hook = self.raw_hook
+        if valid and hook is not None and request[0][:1] == b"/":
+            hook(request[0])
+        return valid
+
+    def process_request(self, request, client_address) -> None:
+        # Enqueue and return to the socket immediately; the worker
+        # does the parse and callback work
+        self._dispatch_queue.put((request, client_address))
+
+    def _dispatch_loop(self) -> None:
+        while True:
+            item = self._dispatch_queue.get()
+            if item is None:
+                return
+            try:
+                self.finish_request(*item)
+            except Exception:
+                pass  # Ignore malformed packets / handler errors
+
+    def server_close(self) -> None:
+        self._dispatch_queue.put(None)
+        super().server_close()
+
 
 class AbletonOSCClient:
     """OSC client for communicating with AbletonOSC.
 
     Handles sending messages and receiving responses via UDP.
     Default ports: send to 11000, receive on 11001.
+
+    With cache=True, query() results for /get/ addresses are cached
+    keyed by (address, args) and served without a round trip until a
+    write to the same property (or any non-getter command) invalidates
+    them. Leave caching off when external changes in Live (other
+    controllers, the UI) must be visible between reads.
+
+    cache_ttl bounds how long entries are served (and implies
+    caching): expired entries count as misses and re-query. A short
+    TTL (e.g., 0.05) absorbs repeated reads inside a tight loop while
+    still noticing external changes within one TTL.
     """
 
     def __init__(
@@ -21,6 +456,8 @@ class AbletonOSCClient:
         send_port: int = 11000,
         receive_port: int = 11001,
         listen_host: str | None = None,
+        cache: bool = False,
+        cache_ttl: float | None = None,
     ):
         self.host = host
         self.send_port = send_port
@@ -28,21 +465,62 @@ class AbletonOSCClient:
         # For WSL2->Windows: send to remote host, listen on local interface
         self.listen_host = listen_host if listen_host is not None else host
 
-        # Outbound client
-        self._client = udp_client.SimpleUDPClient(host, send_port)
-
-        # Response handling
-        self._pending_responses: dict[str, tuple[threading.Event, list]] = {}
+        # Response handling. Waiters are FIFO per address, so several
+        # in-flight queries to the same address - from one batch or
+        # from different threads - resolve in send order instead of
+        # colliding on a single slot.
+        self._pending_responses: dict[str, deque[tuple[threading.Event, list]]] = {}
+        self._pending_raw: dict[str, deque[tuple[threading.Event, list]]] = {}
         self._listeners: dict[str, Callable] = {}
+        # Scalar listeners keyed on the exact address bytes from the
+        # wire: {addr_bytes: (cast, callback, index)}. Dispatched from
+        # the raw hook with no address decode and no full parse.
+        self._scalar_listeners: dict[bytes, tuple[Callable, Callable, int]] = {}
+
+        # Outgoing bundle buffer (None when not inside a bundle() block)
+        self._bundle_buffer: list[tuple[str, tuple] | bytes] | None = None
+
+        # Staged datagrams for stage()/flush()
+        self._staged: list[bytes] = []
+
+        # Lazily created wrapper facades, shared for the client's lifetime
+        self._wrappers: dict[str, Any] = {}
+
+        # Watched properties: address -> number of key args, and
+        # {(address, key_args): (response, monotonic timestamp)}
+        self._watch_key_len: dict[str, int] = {}
+        self._watch_store: dict[tuple[str, tuple], tuple[tuple, float]] = {}
+
+        # Read-through query cache: {(address, args): result}, or
+        # {(address, args): (result, deadline)} when a TTL is set
+        self._cache_enabled = cache or cache_ttl is not None
+        self._cache_ttl = cache_ttl
+        self._cache: dict[tuple[str, tuple], Any] = {}
 
         # Set up dispatcher and server for receiving
         self._dispatcher = Dispatcher()
         self._dispatcher.set_default_handler(self._handle_response)
 
-        self._server = ThreadingOSCUDPServer(
+        self._server = _RawCaptureServer(
             (self.listen_host, receive_port),
             self._dispatcher,
         )
+        self._server.raw_hook = self._handle_raw
+
+        # Outbound sends share the server's bound socket, so replies
+        # addressed to our source port land on the same fd AbletonOSC
+        # targets (11001) - one socket for both directions. The socket
+        # stays unconnected: AbletonOSC replies from an ephemeral port,
+        # and connect() would make the kernel drop those. Raise
+        # SO_SNDBUF so large note bundles queue without drops (the
+        # kernel may cap the requested size).
+        sock = self._server.socket
+        sock.setsockopt(socket.SOL_SOCKET, socket.SO_SNDBUF, 1 << 20)
+        dest = (host, send_port)
+        self._send_dgram = lambda dgram, _sendto=sock.sendto, _dest=dest: _sendto(
+            dgram, _dest
+        )
+
         self._server_thread = threading.Thread(target=self._server.serve_forever)
         self._server_thread.daemon = True
         self._server_thread.start()
@@ -52,24 +530,245 @@ class AbletonOSCClient:
 
         Routes to pending query responses or registered listeners.
         """
-        # Check if this is a response to a pending query
-        if address in self._pending_responses:
-            event, result = self._pending_responses[address]
-            result.extend(args)
-            event.set()
+        # Check if this is a response to a pending query (FIFO per
+        # address; dispatch is single-threaded, so popleft can only
+        # race a timed-out waiter's cleanup)
+        waiters = self._pending_responses.get(address)
+        if waiters:
+            try:
+                event, result = waiters.popleft()
+            except IndexError:
+                pass
+            else:
+                result.extend(args)
+                event.set()
+        elif self._cache_enabled and "/get/" in address:
+            # Unsolicited property update pushed by Live (e.g., the user
+            # changed it in the UI): the cached value is stale
+            for key in [k for k in self._cache if k[0] == address]:
+                del self._cache[key]
+
+        # Record pushes for watched properties (single dict assignment,
+        # atomic under the GIL, so readers never see a torn entry)
+        key_len = self._watch_key_len.get(address)
+        if key_len is not None:
+            self._watch_store[(address, args[:key_len])] = (args, time.monotonic())
 
         # Check if there's a listener registered
         if address in self._listeners:
             self._listeners[address](address, *args)
 
+    def _handle_raw(self, dgram: bytes) -> None:
+        """Capture raw datagrams for query_raw() and scalar listeners.
+
+        Runs in the server thread before dispatch; the empty-dict check
+        keeps the cost of the hook near zero for normal traffic. Scalar
+        listeners hash the address bytes straight from the wire - no
+        decode, no full message parse - which matters when Live floods
+        accumulated listener updates.
+        """
+        if not self._pending_raw and not self._scalar_listeners:
+            return
+        addr_bytes = dgram[: dgram.index(b"\x00")]
+
+        handler = self._scalar_listeners.get(addr_bytes)
+        if handler is not None:
+            cast, callback, index = handler
+            callback(_scalar_from_dgram(dgram, index, cast, None))
+
+        if self._pending_raw:
+            waiters = self._pending_raw.get(addr_bytes.decode("ascii", "replace"))
+            if waiters:
+                event, holder = waiters.popleft()
+                holder.append(dgram)
+                event.set()
+
     def send(self, address: str, *args: Any) -> None:
         """Send an OSC message (fire-and-forget).
 
+        Inside a bundle() block the message is buffered and sent as part
+        of the bundle instead of immediately.
+
         Args:
             address: OSC address pattern (e.g., "/live/song/set/tempo")
             *args: Arguments to send with the message
         """
-        self._client.send_message(address, list(args) if args else [])
+        if self._cache_enabled:
+            self._invalidate(address)
+        if self._bundle_buffer is not None:
+            self._bundle_buffer.append((address, args))
+            return
+        self._send_dgram(_encode(address, args))
+
+    def send_raw(self, dgram: bytes) -> None:
+        """Send a pre-encoded OSC message (see encode_message()).
+
+        Skips serialization entirely for messages whose bytes never
+        change between runs. Honors bundle() blocks and cache
+        invalidation just like send().
+
+        Args:
+            dgram: Encoded datagram from encode_message()
+        """
+        if self._cache_enabled:
+            # The OSC address is the leading NUL-terminated string
+            self._invalidate(dgram.split(b"\x00", 1)[0].decode("ascii", "replace"))
+        if self._bundle_buffer is not None:
+            self._bundle_buffer.append(dgram)
+            return
+        self._send_dgram(dgram)
+
+    def _invalidate(self, address: str) -> None:
+        """Drop cache entries made stale by a write to an address.
+
+        A /set/ write invalidates the matching /get/ entries; any other
+        command (create_midi_track, fire, ...) may change arbitrary
+        state, so it clears the whole cache.
+        """
+        if "/get/" in address:
+            return  # Getters don't change state
+        if "/set/" in address:
+            getter = address.replace("/set/", "/get/")
+            for key in [k for k in self._cache if k[0] == getter]:
+                del self._cache[key]
+        else:
+            self._cache.clear()
+
+    def _cache_get(self, key: tuple) -> tuple | None:
+        """Look up a cache entry, treating expired entries as misses."""
+        entry = self._cache.get(key)
+        if entry is None or self._cache_ttl is None:
+            return entry
+        response, deadline = entry
+        if time.monotonic() >= deadline:
+            self._cache.pop(key, None)
+            return None
+        return response
+
+    def _cache_put(self, key: tuple, response: tuple) -> None:
+        """Store a cache entry, stamped with a deadline when TTL is set."""
+        if self._cache_ttl is None:
+            self._cache[key] = response
+        else:
+            self._cache[key] = (response, time.monotonic() + self._cache_ttl)
+
+    def prime_cache(self, address: str, args: tuple, result: tuple) -> None:
+        """Store a known result in the query cache.
+
+        Lets bulk queries pre-populate entries for the equivalent
+        per-item getters. No-op when caching is disabled.
+
+        Args:
+            address: Getter OSC address (e.g., "/live/track/get/name")
+            args: Query arguments the entry is keyed on
+            result: Response tuple to serve for that query
+        """
+        if self._cache_enabled:
+            self._cache_put((address, tuple(args)), tuple(result))
+
+    def send_many(self, datagrams: list[bytes]) -> None:
+        """Send several pre-built OSC datagrams back-to-back.
+
+        CPython's socket module has no sendmmsg(), so this is a tight
+        sendto() loop on the shared socket with the send callable
+        hoisted out of it - the per-packet Python overhead is what
+        dominates here, not the syscall itself.
+
+        Args:
+            datagrams: Encoded OSC messages (e.g., OscMessage.dgram)
+        """
+        send = self._send_dgram
+        for dgram in datagrams:
+            send(dgram)
+
+    def pipeline(self, timeout: float = 2.0) -> "Pipeline":
+        """Batch interleaved sends and queries into one wire burst.
+
+        Mutation-then-readback sequences otherwise serialize on one
+        RTT per message; inside a pipeline the whole sequence goes out
+        back-to-back and the replies are collected afterwards, so a
+        set/get pair costs roughly one RTT. Messages are processed by
+        Live in send order (UDP from localhost keeps ordering), so a
+        query placed after a send observes its effect.
+
+        Args:
+            timeout: Total time to wait for all replies in seconds
+
+        Returns:
+            Pipeline context manager; query replies land in .results
+
+        Example:
+            with client.pipeline() as p:
+                p.send("/live/track/set/volume", 0, 0.5)
+                p.query("/live/track/get/volume", 0)
+            (_, volume), = p.results
+        """
+        return Pipeline(self, timeout)
+
+    def stage(self, address: str, *args: Any) -> None:
+        """Serialize a message now and queue it for the next flush().
+
+        Unlike bundle(), each staged message goes out as its own packet,
+        so AbletonOSC handlers that reply per-message still see separate
+        datagrams.
+
+        Args:
+            address: OSC address pattern
+            *args: Arguments to send with the message
+        """
+        if self._cache_enabled:
+            self._invalidate(address)
+        self._staged.append(_encode(address, args))
+
+    def flush(self) -> None:
+        """Send all staged messages in one pass and clear the queue."""
+        staged, self._staged = self._staged, []
+        if staged:
+            self.send_many(staged)
+
+    @contextmanager
+    def bundle(self) -> Iterator["AbletonOSCClient"]:
+        """Batch outgoing messages into a single OSC bundle.
+
+        All send() calls made inside the block are buffered and sent as
+        one OSC bundle (a single UDP datagram) when the block exits.
+        This collapses N packets into 1 for command sequences that don't
+        depend on each other's side effects.
+
+        query() calls are not buffered - they still send immediately,
+        since they need a response.
+
+        Example:
+            with client.bundle():
+                client.send("/live/clip/set/name", 0, 0, "Drums")
+                client.send("/live/scene/set/name", 0, "Main Loop")
+
+        Yields:
+            This client (so the block can use the same instance)
+        """
+        if self._bundle_buffer is not None:
+            # Nested bundle: let the outermost block do the send
+            yield self
+            return
+
+        self._bundle_buffer = []
+        try:
+            yield self
+            buffered = self._bundle_buffer
+        finally:
+            self._bundle_buffer = None
+
+        if buffered:
+            builder = osc_bundle_builder.OscBundleBuilder(
+                osc_bundle_builder.IMMEDIATELY
+            )
+            for entry in buffered:
+                if isinstance(entry, bytes):
+                    # Raw sends: rehydrate so the builder accepts them
+                    builder.add_content(OscMessage(entry))
+                else:
+                    builder.add_content(_build_message(*entry))
+            self._send_dgram(builder.build().dgram)
 
     def query(self, address: str, *args: Any, timeout: float = 2.0) -> tuple:
         """Send an OSC message and wait for response.
@@ -85,33 +784,446 @@ class AbletonOSCClient:
         Raises:
             TimeoutError: If no response received within timeout
         """
+        cache_key = (address, args)
+        if self._cache_enabled and "/get/" in address:
+            cached = self._cache_get(cache_key)
+            if cached is not None:
+                return cached
+
         event = threading.Event()
         result: list = []
+        waiter = (event, result)
 
-        # Register for response
-        self._pending_responses[address] = (event, result)
+        # Register for response (FIFO per address)
+        self._pending_responses.setdefault(address, deque()).append(waiter)
 
         try:
             # Send the query
-            self._client.send_message(address, list(args) if args else [])
+            self._send_dgram(_encode(address, args))
 
             # Wait for response
             if not event.wait(timeout):
                 raise TimeoutError(f"No response for {address} within {timeout}s")
 
-            return tuple(result)
+            response = tuple(result)
+            if self._cache_enabled and "/get/" in address:
+                self._cache_put(cache_key, response)
+            return response
+        finally:
+            self._discard_waiter(address, waiter)
+
+    def _discard_waiter(
+        self, address: str, waiter: tuple[threading.Event, list]
+    ) -> None:
+        """Drop a waiter that resolved or timed out from the FIFO."""
+        waiters = self._pending_responses.get(address)
+        if waiters is not None:
+            try:
+                waiters.remove(waiter)
+            except ValueError:
+                pass  # Already popped by the dispatcher
+            if not waiters:
+                self._pending_responses.pop(address, None)
+
+    def query_raw(
+        self, address: str, *args: Any, timeout: float = 2.0
+    ) -> memoryview:
+        """Send a query and return the raw response datagram.
+
+        Captures the response bytes before pythonosc parses them, so no
+        Python object is built per response argument. Bypasses the
+        query cache (which stores parsed tuples). Concurrent queries to
+        the same address resolve in send order via a FIFO of waiters,
+        like query().
+
+        Args:
+            address: OSC address pattern (e.g., "/live/clip/get/length")
+            *args: Arguments to send with the query
+            timeout: How long to wait for response in seconds
+
+        Returns:
+            Read-only view of the response datagram (address, type
+            tags, and payload)
+
+        Raises:
+            TimeoutError: If no response received within timeout
+        """
+        event = threading.Event()
+        holder: list = []
+        waiter = (event, holder)
+        self._pending_raw.setdefault(address, deque()).append(waiter)
+        try:
+            self._send_dgram(_encode(address, args))
+            if not event.wait(timeout):
+                raise TimeoutError(f"No response for {address} within {timeout}s")
+        finally:
+            self._discard_raw_waiter(address, waiter)
+        return memoryview(holder[0])
+
+    def _discard_raw_waiter(
+        self, address: str, waiter: tuple[threading.Event, list]
+    ) -> None:
+        """Drop a raw waiter that resolved or timed out from the FIFO."""
+        waiters = self._pending_raw.get(address)
+        if waiters is not None:
+            try:
+                waiters.remove(waiter)
+            except ValueError:
+                pass  # Already popped by the capture hook
+            if not waiters:
+                self._pending_raw.pop(address, None)
+
+    def query_scalar(
+        self,
+        address: str,
+        *args: Any,
+        index: int = -1,
+        cast: Callable = float,
+        default: Any = 0,
+        timeout: float = 2.0,
+    ):
+        """Query and extract one scalar straight from the response bytes.
+
+        For getters that only want a single value past the echoed query
+        indices, parsing the whole response is wasted work: this reads
+        the type-tag string from the raw datagram and unpacks just the
+        wanted position with struct.unpack_from. Falls back to the
+        parsed path when caching is on (the cache stores tuples) or
+        when a string argument precedes the wanted position.
+
+        Args:
+            address: OSC address pattern (e.g., "/live/clip/get/length")
+            *args: Arguments to send with the query
+            index: Position of the wanted value (negative from the end)
+            cast: Type to apply to the value
+            default: Returned when the position is missing
+            timeout: How long to wait for response in seconds
+
+        Returns:
+            The cast value, or default
+
+        Raises:
+            TimeoutError: If no response received within timeout
+        """
+        if self._cache_enabled and "/get/" in address:
+            return tail(self.query(address, *args, timeout=timeout), index, cast, default)
+
+        dgram = self.query_raw(address, *args, timeout=timeout).obj
+        return _scalar_from_dgram(dgram, index, cast, default)
+
+    def query_many(
+        self,
+        queries: list[tuple[str, tuple]],
+        timeout: float = 2.0,
+    ) -> list[tuple]:
+        """Pipeline several queries over one round trip.
+
+        Sends every request back-to-back, then collects the responses,
+        so N queries cost roughly one RTT plus server processing
+        instead of N sequential RTTs. Waiters are FIFO per address, so
+        duplicate addresses within a batch resolve in send order - the
+        whole batch goes out in one burst.
+
+        Args:
+            queries: (address, args) pairs to send
+            timeout: Total time to wait for all responses in seconds
+
+        Returns:
+            Response tuples in the same order as the queries
+
+        Raises:
+            TimeoutError: If any response is missing within timeout
+        """
+        results: list[tuple | None] = [None] * len(queries)
+        deadline = time.monotonic() + timeout
+
+        pending: list[tuple[int, str, tuple, tuple[threading.Event, list]]] = []
+        dgrams = []
+        for index, (address, args) in enumerate(queries):
+            args = tuple(args)
+            if self._cache_enabled and "/get/" in address:
+                cached = self._cache_get((address, args))
+                if cached is not None:
+                    results[index] = cached
+                    continue
+            waiter = (threading.Event(), [])
+            self._pending_responses.setdefault(address, deque()).append(waiter)
+            pending.append((index, address, args, waiter))
+            dgrams.append(_encode(address, args))
+
+        try:
+            if dgrams:
+                self.send_many(dgrams)
+            for index, address, args, (event, result) in pending:
+                if not event.wait(max(deadline - time.monotonic(), 0)):
+                    raise TimeoutError(
+                        f"No response for {address} within {timeout}s"
+                    )
+                response = tuple(result)
+                if self._cache_enabled and "/get/" in address:
+                    self._cache_put((address, args), response)
+                results[index] = response
         finally:
-            # Cleanup
-            self._pending_responses.pop(address, None)
+            for _index, address, _args, waiter in pending:
+                self._discard_waiter(address, waiter)
+        return results
 
-    def start_listener(self, address: str, callback: Callable) -> None:
+    def watch(self, address: str, *args: Any) -> None:
+        """Subscribe to push updates for a getter address.
+
+        Sends the matching /start_listen/ message; AbletonOSC then
+        pushes the current value immediately and again on every change.
+        Pushes land in a timestamped store read by peek() and
+        query_fresh(), so high-frequency polling (transport UIs
+        checking is_playing hundreds of times a second) stops issuing
+        network round trips entirely.
+
+        Args:
+            address: Getter address (e.g., "/live/clip_slot/get/is_playing")
+            *args: Key arguments identifying the object (track, scene, ...)
+        """
+        self._watch_key_len[address] = len(args)
+        self.send(address.replace("/get/", "/start_listen/"), *args)
+
+    def unwatch(self, address: str, *args: Any) -> None:
+        """Cancel a watch() subscription and drop its stored value.
+
+        Args:
+            address: Getter address passed to watch()
+            *args: Key arguments passed to watch()
+        """
+        self.send(address.replace("/get/", "/stop_listen/"), *args)
+        self._watch_store.pop((address, args), None)
+
+    def peek(
+        self, address: str, *args: Any, max_age: float | None = None
+    ) -> tuple | None:
+        """Return the latest pushed value for a watched property.
+
+        Never touches the network - a miss (nothing watched, no push
+        yet, or the entry is older than max_age) returns None.
+
+        Args:
+            address: Getter address passed to watch()
+            *args: Key arguments passed to watch()
+            max_age: Maximum entry age in seconds, or None for any age
+
+        Returns:
+            The latest pushed response tuple, or None
+        """
+        entry = self._watch_store.get((address, args))
+        if entry is None:
+            return None
+        response, stamp = entry
+        if max_age is not None and time.monotonic() - stamp > max_age:
+            return None
+        return response
+
+    def query_fresh(
+        self, address: str, *args: Any, max_age: float = 0.05, timeout: float = 2.0
+    ) -> tuple:
+        """Query a property, served from the watch store when fresh.
+
+        The fast path is a dict lookup; only when the property isn't
+        watched or the last push is older than max_age does this fall
+        back to a full query() round trip.
+
+        Args:
+            address: Getter address (e.g., "/live/clip_slot/get/is_playing")
+            *args: Arguments for the query
+            max_age: Maximum acceptable push age in seconds
+            timeout: How long to wait for a fallback response in seconds
+
+        Returns:
+            Tuple of response arguments
+
+        Raises:
+            TimeoutError: If the fallback query gets no response
+        """
+        cached = self.peek(address, *args, max_age=max_age)
+        if cached is not None:
+            return cached
+        return self.query(address, *args, timeout=timeout)
+
+    def wait_until(
+        self,
+        address: str,
+        *args: Any,
+        predicate: Callable[[tuple], bool],
+        timeout: float = 5.0,
+    ) -> tuple:
+        """Poll a getter until its response satisfies a predicate.
+
+        Replaces fixed sleeps after writes with a real acknowledgement:
+        polls with exponential backoff (1ms doubling to 100ms) so the
+        wait ends as soon as Ableton has applied the change.
+
+        Bypasses the query cache, since the polled value is expected
+        to be changing.
+
+        Args:
+            address: OSC address to poll (e.g., "/live/song/get/num_tracks")
+            *args: Arguments for the query
+            predicate: Function(response) returning True once satisfied
+            timeout: Total time to keep polling in seconds
+
+        Returns:
+            The first response that satisfied the predicate
+
+        Raises:
+            TimeoutError: If the predicate never held within timeout
+        """
+        deadline = time.monotonic() + timeout
+        delay = 0.001
+        while True:
+            self._cache.pop((address, args), None)
+            response = self.query(address, *args)
+            if predicate(response):
+                return response
+            if time.monotonic() >= deadline:
+                raise TimeoutError(
+                    f"Condition on {address} not met within {timeout}s"
+                )
+            time.sleep(delay)
+            delay = min(delay * 2, 0.1)
+
+    def send_and_wait(
+        self,
+        address: str,
+        args: tuple = (),
+        verify_address: str = "",
+        verify_args: tuple = (),
+        predicate: Callable[[tuple], bool] = bool,
+        timeout: float = 5.0,
+    ) -> tuple:
+        """Send a write and wait until a verification query confirms it.
+
+        Args:
+            address: OSC address to send (e.g., "/live/song/create_midi_track")
+            args: Arguments for the write
+            verify_address: Getter address to poll for confirmation
+            verify_args: Arguments for the verification query
+            predicate: Function(response) returning True once confirmed
+            timeout: Total time to keep polling in seconds
+
+        Returns:
+            The first verification response that satisfied the predicate
+
+        Raises:
+            TimeoutError: If the predicate never held within timeout
+        """
+        self.send(address, *args)
+        return self.wait_until(
+            verify_address, *verify_args, predicate=predicate, timeout=timeout
+        )
+
+    # Shared wrapper facades. The wrappers are stateless apart from the
+    # client reference, so one instance each is enough; creating them
+    # here (lazily, to avoid import cycles) saves callers from
+    # re-instantiating Song(client) etc. in every function.
+
+    @property
+    def song(self) -> "Song":
+        """Shared Song wrapper for this client."""
+        if "song" not in self._wrappers:
+            from abletonosc_client.song import Song
+
+            self._wrappers["song"] = Song(self)
+        return self._wrappers["song"]
+
+    @property
+    def track(self) -> "Track":
+        """Shared Track wrapper for this client."""
+        if "track" not in self._wrappers:
+            from abletonosc_client.track import Track
+
+            self._wrappers["track"] = Track(self)
+        return self._wrappers["track"]
+
+    @property
+    def clip(self) -> "Clip":
+        """Shared Clip wrapper for this client."""
+        if "clip" not in self._wrappers:
+            from abletonosc_client.clip import Clip
+
+            self._wrappers["clip"] = Clip(self)
+        return self._wrappers["clip"]
+
+    @property
+    def clip_slot(self) -> "ClipSlot":
+        """Shared ClipSlot wrapper for this client."""
+        if "clip_slot" not in self._wrappers:
+            from abletonosc_client.clip_slot import ClipSlot
+
+            self._wrappers["clip_slot"] = ClipSlot(self)
+        return self._wrappers["clip_slot"]
+
+    @property
+    def scene(self) -> "Scene":
+        """Shared Scene wrapper for this client."""
+        if "scene" not in self._wrappers:
+            from abletonosc_client.scene import Scene
+
+            self._wrappers["scene"] = Scene(self)
+        return self._wrappers["scene"]
+
+    def start_listener(
+        self,
+        address: str,
+        callback: Callable,
+        cast: Callable | None = None,
+        index: int = -1,
+    ) -> None:
         """Register a callback for messages at an address.
 
+        With cast set, the callback takes the single cast value and is
+        dispatched straight from the raw datagram: the address bytes
+        are hashed as they arrive on the wire and only the wanted
+        scalar is unpacked, so no decode, no full parse, and no varargs
+        repacking happens per event. Use this form for high-rate
+        scalar pushes (tempo automation, playing position).
+
         Args:
             address: OSC address to listen for
-            callback: Function(address, *args) to call on message
+            callback: Function(address, *args) to call on message, or
+                      Function(value) when cast is given
+            cast: Type of the pushed value for the scalar fast path
+            index: Position of the value in the message (scalar path)
         """
-        self._listeners[address] = callback
+        if cast is None:
+            self._listeners[address] = callback
+        else:
+            self._scalar_listeners[address.encode("ascii")] = (cast, callback, index)
+
+    def subscribe(
+        self,
+        listen_address: str,
+        reply_address: str,
+        callback: Callable,
+        cast: Callable | None = None,
+        index: int = -1,
+    ) -> Subscription:
+        """Start a Live listener and its callback as one operation.
+
+        The callback is registered before the start_listen message
+        goes out, so the immediate push AbletonOSC sends on
+        subscription can't arrive unhandled; the returned handle tears
+        both halves down together.
+
+        Args:
+            listen_address: /start_listen/ address to send
+            reply_address: /get/ address the pushes arrive on
+            callback: Function(address, *args), or Function(value)
+                      when cast is given (see start_listener())
+            cast: Type of the pushed value for the scalar fast path
+            index: Position of the value in the message (scalar path)
+
+        Returns:
+            Subscription whose unsubscribe() reverses both steps
+        """
+        self.start_listener(reply_address, callback, cast=cast, index=index)
+        self.send(listen_address)
+        return Subscription(self, listen_address, reply_address)
 
     def stop_listener(self, address: str) -> None:
         """Unregister a callback for an address.
@@ -120,8 +1232,16 @@ class AbletonOSCClient:
             address: OSC address to stop listening for
         """
         self._listeners.pop(address, None)
+        self._scalar_listeners.pop(address.encode("ascii"), None)
+
+    def __enter__(self) -> "AbletonOSCClient":
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        self.close()
 
     def close(self) -> None:
         """Cleanup resources and stop the server."""
         self._server.shutdown()
         self._server_thread.join(timeout=1.0)
+        self._server.server_close()
@@ -3,9 +3,87 @@
 Covers /live/clip/* endpoints for individual clip control and note editing.
 """
 
+import array
+import struct
 from typing import Callable, NamedTuple
 
-from abletonosc_client.client import AbletonOSCClient
+from abletonosc_client.client import AbletonOSCClient, message_template, tail
+
+# Pre-padded OSC address for the note-add hot path
+_ADD_NOTES_ADDRESS = b"/live/clip/add/notes" + b"\x00" * 4
+
+# Fixed-shape message headers: fire()/stop() only ever append two int32s
+_FIRE_HEADER = message_template("/live/clip/fire", "ii")
+_STOP_HEADER = message_template("/live/clip/stop", "ii")
+
+
+def _encode_add_notes(
+    track_index: int, clip_index: int, rows, n: int | None = None
+) -> bytes:
+    """Pack an /live/clip/add/notes datagram directly.
+
+    Serializes the whole message with struct.pack_into into one
+    pre-sized buffer - no per-argument builder dispatch and no
+    intermediate flat list, which dominates at large note counts.
+
+    Args:
+        track_index: Track index (0-based)
+        clip_index: Clip/scene index (0-based)
+        rows: (pitch, start_time, duration, velocity, mute) rows; may
+            be any iterable (e.g., a zip over columns) when n is given
+        n: Number of rows, defaulting to len(rows)
+
+    Returns:
+        The encoded datagram
+    """
+    if n is None:
+        n = len(rows)
+    tags = b"," + b"ii" + b"iffii" * n + b"\x00"
+    tags += b"\x00" * (-len(tags) % 4)
+    header = _ADD_NOTES_ADDRESS + tags
+    offset = len(header)
+    buf = bytearray(offset + 4 * (2 + 5 * n))
+    buf[:offset] = header
+    pack = struct.pack_into
+    pack(">ii", buf, offset, track_index, clip_index)
+    offset += 8
+    for pitch, start_time, duration, velocity, mute in rows:
+        pack(
+            ">iffii", buf, offset,
+            int(pitch), start_time, duration, int(velocity), int(mute),
+        )
+        offset += 20
+    return bytes(buf)
+
+
+def _split_note_columns(
+    values: tuple,
+    _int=int,
+    _float=float,
+    _bool=bool,
+    _tuple=tuple,
+    _map=map,
+) -> tuple[tuple, tuple, tuple, tuple, tuple]:
+    """Split a flat (pitch, start, duration, velocity, mute, ...) run.
+
+    Strided slices plus one map() per column - no per-note Python loop
+    or object construction. Any trailing partial record is dropped.
+    The builtins arrive pre-bound as default args (fast locals).
+
+    Args:
+        values: Flat note values, 5 per note
+
+    Returns:
+        (pitches, start_times, durations, velocities, mutes) tuples
+    """
+    end = len(values) - len(values) % 5
+    return (
+        _tuple(_map(_int, values[0:end:5])),
+        _tuple(_map(_float, values[1:end:5])),
+        _tuple(_map(_float, values[2:end:5])),
+        _tuple(_map(_int, values[3:end:5])),
+        _tuple(_map(_bool, values[4:end:5])),
+    )
 
 
 class Note(NamedTuple):
@@ -26,9 +104,102 @@ class Note(NamedTuple):
     mute: bool = False
 
 
+class NoteSequence:
+    """Lazy, column-backed sequence of notes.
+
+    Holds the parallel columns from get_notes_columns() and only
+    materializes a Note when an index is touched - no per-note
+    allocations for callers that just read columns or check len().
+
+    Attributes:
+        pitches: MIDI pitches (0-127)
+        start_times: Start positions in beats
+        durations: Durations in beats
+        velocities: Velocities (0-127)
+        mutes: Per-note mute flags
+    """
+
+    __slots__ = ("pitches", "start_times", "durations", "velocities", "mutes")
+
+    def __init__(self, pitches, start_times, durations, velocities, mutes):
+        self.pitches = pitches
+        self.start_times = start_times
+        self.durations = durations
+        self.velocities = velocities
+        self.mutes = mutes
+
+    def __len__(self) -> int:
+        return len(self.pitches)
+
+    def __getitem__(self, index: int) -> Note:
+        return Note(
+            self.pitches[index],
+            self.start_times[index],
+            self.durations[index],
+            self.velocities[index],
+            self.mutes[index],
+        )
+
+    def __iter__(self):
+        return map(
+            Note,
+            self.pitches,
+            self.start_times,
+            self.durations,
+            self.velocities,
+            self.mutes,
+        )
+
+    def _like(self, column, values):
+        """Build a column of the same storage type as an existing one."""
+        if isinstance(column, array.array):
+            return array.array(column.typecode, values)
+        return tuple(values)
+
+    def transposed(self, semitones: int) -> "NoteSequence":
+        """Copy with every pitch shifted by semitones, clamped to 0-127.
+
+        Only the pitch column is rebuilt; the other columns are shared
+        with this sequence, not copied. Shifts that leave the MIDI
+        range clamp rather than overflow the signed-byte pitch column.
+
+        Args:
+            semitones: Shift amount (positive = up)
+
+        Returns:
+            New NoteSequence with shifted pitches
+        """
+        pitches = self._like(
+            self.pitches,
+            (min(127, max(0, p + semitones)) for p in self.pitches),
+        )
+        return NoteSequence(
+            pitches, self.start_times, self.durations, self.velocities, self.mutes
+        )
+
+    def scaled_velocities(self, factor: float) -> "NoteSequence":
+        """Copy with every velocity scaled and clamped to 1-127.
+
+        Args:
+            factor: Multiplier applied to each velocity
+
+        Returns:
+            New NoteSequence with scaled velocities
+        """
+        velocities = self._like(
+            self.velocities,
+            (min(127, max(1, int(v * factor))) for v in self.velocities),
+        )
+        return NoteSequence(
+            self.pitches, self.start_times, self.durations, velocities, self.mutes
+        )
+
+
 class Clip:
     """Clip operations like notes, properties, and playback."""
 
+    __slots__ = ("_client", "_clip_callbacks", "_dispatcher_registered")
+
     def __init__(self, client: AbletonOSCClient):
         self._client = client
         # Listener callbacks: {"property": {(track_idx, clip_idx): callback}}
@@ -50,7 +221,7 @@ class Clip:
         """
         result = self._client.query("/live/clip/get/name", track_index, clip_index)
         # Response format: (track_index, clip_index, name)
-        return str(result[2]) if len(result) > 2 else ""
+        return tail(result, 2, str, "")
 
     def set_name(self, track_index: int, clip_index: int, name: str) -> None:
         """Set the clip name.
@@ -71,7 +242,22 @@ class Clip:
             track_index: Track index (0-based)
             clip_index: Clip/scene index (0-based)
         """
-        self._client.send("/live/clip/fire", track_index, clip_index)
+        self._client.send_raw(
+            _FIRE_HEADER + struct.pack(">ii", track_index, clip_index)
+        )
+
+    def fire_many(self, slots: list[tuple[int, int]]) -> None:
+        """Fire several clips in one OSC bundle.
+
+        All fires arrive in a single datagram, so Live launches the
+        clips together instead of one round of message handling apart.
+
+        Args:
+            slots: List of (track_index, clip_index) pairs to fire
+        """
+        with self._client.bundle():
+            for track_index, clip_index in slots:
+                self.fire(track_index, clip_index)
 
     def stop(self, track_index: int, clip_index: int) -> None:
         """Stop a clip.
@@ -80,7 +266,9 @@ class Clip:
             track_index: Track index (0-based)
             clip_index: Clip/scene index (0-based)
         """
-        self._client.send("/live/clip/stop", track_index, clip_index)
+        self._client.send_raw(
+            _STOP_HEADER + struct.pack(">ii", track_index, clip_index)
+        )
 
     # Clip properties
 
@@ -94,9 +282,10 @@ class Clip:
         Returns:
             Clip length in beats
         """
-        result = self._client.query("/live/clip/get/length", track_index, clip_index)
         # Response format: (track_index, clip_index, length)
-        return float(result[2])
+        return self._client.query_scalar(
+            "/live/clip/get/length", track_index, clip_index, index=2
+        )
 
     def get_is_midi_clip(self, track_index: int, clip_index: int) -> bool:
         """Check if clip is a MIDI clip.
@@ -112,7 +301,7 @@ class Clip:
             "/live/clip/get/is_midi_clip", track_index, clip_index
         )
         # Response format: (track_index, clip_index, is_midi_clip)
-        return bool(result[2])
+        return tail(result, 2, bool, False)
 
     def get_is_audio_clip(self, track_index: int, clip_index: int) -> bool:
         """Check if clip is an audio clip.
@@ -128,7 +317,7 @@ class Clip:
             "/live/clip/get/is_audio_clip", track_index, clip_index
         )
         # Response format: (track_index, clip_index, is_audio_clip)
-        return bool(result[2])
+        return tail(result, 2, bool, False)
 
     def get_is_playing(self, track_index: int, clip_index: int) -> bool:
         """Check if clip is currently playing.
@@ -144,7 +333,7 @@ class Clip:
             "/live/clip/get/is_playing", track_index, clip_index
         )
         # Response format: (track_index, clip_index, is_playing)
-        return bool(result[2])
+        return tail(result, 2, bool, False)
 
     def get_color(self, track_index: int, clip_index: int) -> int:
         """Get the clip color.
@@ -158,7 +347,7 @@ class Clip:
         """
         result = self._client.query("/live/clip/get/color", track_index, clip_index)
         # Response format: (track_index, clip_index, color)
-        return int(result[2])
+        return tail(result, 2, int, 0)
 
     def set_color(self, track_index: int, clip_index: int, color: int) -> None:
         """Set the clip color.
@@ -182,25 +371,156 @@ class Clip:
         Returns:
             List of Note objects
         """
+        pitches, starts, durations, velocities, mutes = self.get_notes_columns(
+            track_index, clip_index
+        )
+        return [
+            Note(p, s, d, v, m)
+            for p, s, d, v, m in zip(pitches, starts, durations, velocities, mutes)
+        ]
+
+    def get_note_sequence(
+        self, track_index: int, clip_index: int
+    ) -> NoteSequence:
+        """Get notes as a lazy NoteSequence.
+
+        One query, no per-note objects up front: Note tuples are
+        materialized only for the indices the caller touches.
+
+        Args:
+            track_index: Track index (0-based)
+            clip_index: Clip/scene index (0-based)
+
+        Returns:
+            NoteSequence over the clip's notes
+        """
+        return NoteSequence(*self.get_notes_columns(track_index, clip_index))
+
+    def get_notes_array(
+        self, track_index: int, clip_index: int
+    ) -> NoteSequence:
+        """Get notes as a NoteSequence over typed array columns.
+
+        Same shape as get_note_sequence(), but the columns are
+        array.array buffers with narrow element types (signed byte
+        pitches/mutes, unsigned byte velocities, 32-bit floats), so a
+        10k-note clip stays in a few flat C buffers instead of 50k
+        boxed Python numbers. Mute flags read back as 0/1 ints.
+
+        Args:
+            track_index: Track index (0-based)
+            clip_index: Clip/scene index (0-based)
+
+        Returns:
+            NoteSequence backed by typed arrays
+        """
         result = self._client.query("/live/clip/get/notes", track_index, clip_index)
-        notes = []
-
-        # Result format: (track_index, scene_index, pitch, start_time, duration, velocity, mute, ...)
-        # Skip first 2 values (indices), then each note is 5 values
-        if result and len(result) > 2:
-            values = list(result)[2:]  # Skip track_index, scene_index
-            for i in range(0, len(values), 5):
-                if i + 4 < len(values):
-                    notes.append(
-                        Note(
-                            pitch=int(values[i]),
-                            start_time=float(values[i + 1]),
-                            duration=float(values[i + 2]),
-                            velocity=int(values[i + 3]),
-                            mute=bool(values[i + 4]),
-                        )
+        values = result[2:]
+        end = len(values) - len(values) % 5
+        return NoteSequence(
+            array.array("b", map(int, values[0:end:5])),
+            array.array("f", map(float, values[1:end:5])),
+            array.array("f", map(float, values[2:end:5])),
+            array.array("B", map(int, values[3:end:5])),
+            array.array("b", map(int, values[4:end:5])),
+        )
+
+    def get_notes_columns(
+        self, track_index: int, clip_index: int
+    ) -> tuple[tuple, tuple, tuple, tuple, tuple]:
+        """Get notes as parallel columns instead of Note objects.
+
+        Fast path for bulk reads: the flat OSC response is split with
+        strided slices and each column is cast with a single map(),
+        so no per-note Python loop or object construction runs.
+
+        Args:
+            track_index: Track index (0-based)
+            clip_index: Clip/scene index (0-based)
+
+        Returns:
+            (pitches, start_times, durations, velocities, mutes) tuples
+        """
+        result = self._client.query("/live/clip/get/notes", track_index, clip_index)
+        # Result format: (track_index, scene_index, pitch, start_time,
+        # duration, velocity, mute, ...) - skip the 2 indices, then each
+        # note is 5 values
+        return _split_note_columns(result[2:])
+
+    def watch_notes(
+        self,
+        track_index: int,
+        clip_index: int,
+        callback: "Callable[[int, int, NoteSequence], None] | None" = None,
+    ) -> None:
+        """Subscribe to note pushes for a clip.
+
+        AbletonOSC pushes the clip's note list whenever it changes, so
+        a UI loop polling at 60 Hz can read get_notes_cached() - a
+        dict lookup - instead of re-shipping the whole note blob with
+        a get_notes() query per frame. Note data only crosses the wire
+        when it actually changes.
+
+        Args:
+            track_index: Track index (0-based)
+            clip_index: Clip/scene index (0-based)
+            callback: Optional Function(track_index, clip_index, notes)
+                called with a NoteSequence on each push
+        """
+        self._client.watch("/live/clip/get/notes", track_index, clip_index)
+        if callback is None:
+            return
+        self._clip_callbacks.setdefault("notes", {})[
+            (track_index, clip_index)
+        ] = callback
+        if "notes" not in self._dispatcher_registered:
+            # _make_dispatcher() only converts a single value; notes
+            # arrive as a flat run of rows, so split columns here
+            def dispatcher(addr, *args):
+                key = (int(args[0]), int(args[1]))
+                registered = self._clip_callbacks["notes"].get(key)
+                if registered is not None:
+                    registered(
+                        key[0], key[1], NoteSequence(*_split_note_columns(args[2:]))
                     )
-        return notes
+
+            self._client.start_listener("/live/clip/get/notes", dispatcher)
+            self._dispatcher_registered.add("notes")
+
+    def unwatch_notes(self, track_index: int, clip_index: int) -> None:
+        """Cancel a watch_notes() subscription for a clip.
+
+        Args:
+            track_index: Track index (0-based)
+            clip_index: Clip/scene index (0-based)
+        """
+        self._client.unwatch("/live/clip/get/notes", track_index, clip_index)
+        callbacks = self._clip_callbacks.get("notes")
+        if callbacks is not None:
+            callbacks.pop((track_index, clip_index), None)
+            if not callbacks:
+                self._client.stop_listener("/live/clip/get/notes")
+                self._dispatcher_registered.discard("notes")
+
+    def get_notes_cached(
+        self, track_index: int, clip_index: int
+    ) -> NoteSequence | None:
+        """Get the latest pushed notes for a watched clip.
+
+        Never touches the network; returns None when the clip isn't
+        watched (see watch_notes()) or nothing has been pushed yet.
+
+        Args:
+            track_index: Track index (0-based)
+            clip_index: Clip/scene index (0-based)
+
+        Returns:
+            NoteSequence over the last pushed state, or None
+        """
+        pushed = self._client.peek("/live/clip/get/notes", track_index, clip_index)
+        if pushed is None:
+            return None
+        return NoteSequence(*_split_note_columns(pushed[2:]))
 
     def add_notes(self, track_index: int, clip_index: int, notes: list[Note]) -> None:
         """Add notes to a MIDI clip.
@@ -208,15 +528,223 @@ class Clip:
         Args:
             track_index: Track index (0-based)
             clip_index: Clip/scene index (0-based)
-            notes: List of Note objects to add
+            notes: Note objects to add. Any iterable of
+                (pitch, start_time, duration, velocity, mute) rows works.
+        """
+        # The datagram is packed directly (see _encode_add_notes), so no
+        # flat argument list is built and pythonosc's per-arg dispatch
+        # never runs. Notes unpack positionally (Note is a NamedTuple),
+        # which also accepts plain tuples.
+        self._client.send_raw(
+            _encode_add_notes(track_index, clip_index, list(notes))
+        )
+
+    def add_notes_batch(
+        self, entries: "list[tuple[int, int, list[Note]]]"
+    ) -> None:
+        """Add notes to several clips in one OSC bundle.
+
+        All per-clip payloads ship in a single datagram, so Live
+        schedules the inserts in one tick instead of one dispatch per
+        clip. Each payload is packed directly like add_notes().
+
+        Args:
+            entries: (track_index, clip_index, notes) per clip
+        """
+        with self._client.bundle():
+            for track_index, clip_index, notes in entries:
+                self.add_notes(track_index, clip_index, notes)
+
+    # Field name -> (OSC address, coercion) for configure()
+    _SETTERS = {
+        "name": ("/live/clip/set/name", str),
+        "color": ("/live/clip/set/color", int),
+        "color_index": ("/live/clip/set/color_index", int),
+        "looping": ("/live/clip/set/looping", int),
+        "loop_start": ("/live/clip/set/loop_start", float),
+        "loop_end": ("/live/clip/set/loop_end", float),
+        "start_marker": ("/live/clip/set/start_marker", float),
+        "end_marker": ("/live/clip/set/end_marker", float),
+        "muted": ("/live/clip/set/muted", int),
+        "warping": ("/live/clip/set/warping", int),
+        "warp_mode": ("/live/clip/set/warp_mode", int),
+        "gain": ("/live/clip/set/gain", float),
+        "pitch_coarse": ("/live/clip/set/pitch_coarse", int),
+        "pitch_fine": ("/live/clip/set/pitch_fine", float),
+        "launch_mode": ("/live/clip/set/launch_mode", int),
+        "launch_quantization": ("/live/clip/set/launch_quantization", int),
+        "legato": ("/live/clip/set/legato", int),
+        "ram_mode": ("/live/clip/set/ram_mode", int),
+        "velocity_amount": ("/live/clip/set/velocity_amount", float),
+        "position": ("/live/clip/set/position", float),
+        "start_time": ("/live/clip/set/start_time", float),
+        "end_time": ("/live/clip/set/end_time", float),
+    }
+
+    def configure(self, track_index: int, clip_index: int, **fields) -> None:
+        """Set several clip properties in one OSC bundle.
+
+        Configuring a clip usually means a handful of setters in a row;
+        this coalesces them into a single packet instead of one per
+        property. Field names match the individual set_* methods.
+
+        Example:
+            clip.configure(0, 0, looping=True, loop_start=0.0,
+                           loop_end=8.0, color=0xFF0000)
+
+        Args:
+            track_index: Track index (0-based)
+            clip_index: Clip/scene index (0-based)
+            **fields: Property values, keyed by property name
+
+        Raises:
+            ValueError: If a field name has no known setter
+        """
+        unknown = set(fields) - set(self._SETTERS)
+        if unknown:
+            available = ", ".join(sorted(self._SETTERS))
+            raise ValueError(
+                f"Unknown clip fields: {sorted(unknown)}. Available: {available}"
+            )
+        with self._client.bundle():
+            for field, value in fields.items():
+                address, coerce = self._SETTERS[field]
+                self._client.send(address, track_index, clip_index, coerce(value))
+
+    # Properties fetched by snapshot(), with their result casts
+    _SNAPSHOT_FIELDS = (
+        ("name", str),
+        ("length", float),
+        ("color", int),
+        ("looping", bool),
+        ("muted", bool),
+        ("is_playing", bool),
+        ("start_marker", float),
+        ("end_marker", float),
+    )
+
+    def snapshot(self, track_index: int, clip_index: int) -> dict:
+        """Fetch the common clip properties in one pipelined round trip.
+
+        Uses the client's query_many(), so the eight per-property
+        queries go out back-to-back instead of serializing eight RTTs.
+
+        Args:
+            track_index: Track index (0-based)
+            clip_index: Clip/scene index (0-based)
+
+        Returns:
+            Dict mapping property name to its value (name, length,
+            color, looping, muted, is_playing, start_marker, end_marker)
+        """
+        responses = self._client.query_many(
+            [
+                (f"/live/clip/get/{prop}", (track_index, clip_index))
+                for prop, _ in self._SNAPSHOT_FIELDS
+            ]
+        )
+        return {
+            prop: cast(response[2])
+            for (prop, cast), response in zip(self._SNAPSHOT_FIELDS, responses)
+        }
+
+    def batch(self):
+        """Batch this clip's sends into one OSC bundle.
+
+        Thin alias for the owning client's bundle(); exists so clip-heavy
+        code can write `with clip.batch():` without reaching for the
+        client. Every wrapper sharing the client participates in the
+        same bundle.
+
+        Returns:
+            The client's bundle() context manager
+        """
+        return self._client.bundle()
+
+    def add_notes_columns(
+        self,
+        track_index: int,
+        clip_index: int,
+        pitches,
+        start_times,
+        durations,
+        velocities,
+        mutes=None,
+    ) -> None:
+        """Add notes from parallel columns instead of Note objects.
+
+        Bulk-friendly alternative to add_notes(): the flat OSC payload is
+        built straight from the columns, skipping per-note object
+        construction. Columns can be any equal-length sequences (lists,
+        tuples, array.array, NumPy arrays).
+
+        Args:
+            track_index: Track index (0-based)
+            clip_index: Clip/scene index (0-based)
+            pitches: MIDI pitches (0-127)
+            start_times: Start positions in beats
+            durations: Durations in beats
+            velocities: Velocities (0-127)
+            mutes: Per-note mute flags (default: all unmuted)
         """
-        # Build flat list: pitch, start_time, duration, velocity, mute for each note
-        args = [track_index, clip_index]
-        for note in notes:
-            args.extend(
-                [note.pitch, note.start_time, note.duration, note.velocity, int(note.mute)]
+        n = len(pitches)
+        if mutes is None:
+            mutes = (0,) * n
+        # Feed the encoder from a zip iterator: rows are consumed as
+        # they're packed, never materialized as a list of tuples
+        self._client.send_raw(
+            _encode_add_notes(
+                track_index,
+                clip_index,
+                zip(pitches, start_times, durations, velocities, mutes),
+                n=n,
             )
-        self._client.send("/live/clip/add/notes", *args)
+        )
+
+    def add_pattern(
+        self,
+        track_index: int,
+        clip_index: int,
+        pitch: int,
+        start: float,
+        stride: float,
+        count: int,
+        duration: float,
+        vel_even: int,
+        vel_odd: int,
+    ) -> None:
+        """Add a periodic single-pitch pattern (e.g., hi-hats) to a clip.
+
+        Describes the pattern compactly - one pitch, a stride, a repeat
+        count, alternating velocities - instead of materializing every
+        note at the call site. AbletonOSC has no server-side pattern
+        expansion, so the client expands locally into one
+        /live/clip/add/notes message; the signature is ready for a
+        server that accepts strides directly.
+
+        Args:
+            track_index: Track index (0-based)
+            clip_index: Clip/scene index (0-based)
+            pitch: MIDI pitch for every hit (0-127)
+            start: Beat position of the first hit
+            stride: Beats between consecutive hits
+            count: Number of hits
+            duration: Duration of each hit in beats
+            vel_even: Velocity for even-numbered hits (0, 2, ...)
+            vel_odd: Velocity for odd-numbered hits (1, 3, ...)
+        """
+        # array.array columns keep the expanded pattern unboxed (4
+        # bytes per value instead of a boxed object per value)
+        self.add_notes_columns(
+            track_index,
+            clip_index,
+            (pitch,) * count,
+            array.array("f", (start + i * stride for i in range(count))),
+            (duration,) * count,
+            array.array(
+                "i", (vel_even if i % 2 == 0 else vel_odd for i in range(count))
+            ),
+        )
 
     def remove_notes(
         self,
@@ -247,6 +775,48 @@ class Clip:
             pitch_end - pitch_start + 1,  # pitch span
         )
 
+    def remove_pitches(
+        self,
+        track_index: int,
+        clip_index: int,
+        pitch_mask: int,
+        start_time: float = 0.0,
+        end_time: float = 128.0,
+    ) -> None:
+        """Remove a non-contiguous set of pitches in one call.
+
+        Bit p of pitch_mask selects MIDI pitch p (a Python int holds
+        all 128 bits). The mask is segmented into maximal contiguous
+        runs with bit arithmetic - no 128-iteration pitch scan - and
+        one remove message per run goes out inside a single bundle.
+
+        Example:
+            # Remove all C's and the F#1 hi-hat lane
+            mask = sum(1 << p for p in range(0, 128, 12)) | (1 << 42)
+            clip.remove_pitches(0, 0, mask)
+
+        Args:
+            track_index: Track index (0-based)
+            clip_index: Clip/scene index (0-based)
+            pitch_mask: Bitmap of pitches to remove (bit p = pitch p)
+            start_time: Start of time range in beats
+            end_time: End of time range in beats
+        """
+        mask = pitch_mask & ((1 << 128) - 1)
+        with self._client.bundle():
+            while mask:
+                low = mask & -mask  # Lowest set bit
+                run = ((mask + low) ^ mask) & mask  # Contiguous run from it
+                self.remove_notes(
+                    track_index,
+                    clip_index,
+                    start_time,
+                    end_time,
+                    low.bit_length() - 1,
+                    run.bit_length() - 1,
+                )
+                mask ^= run
+
     # Loop settings
 
     def get_loop_start(self, track_index: int, clip_index: int) -> float:
@@ -259,11 +829,10 @@ class Clip:
         Returns:
             Loop start position in beats
         """
-        result = self._client.query(
-            "/live/clip/get/loop_start", track_index, clip_index
-        )
         # Response format: (track_index, clip_index, loop_start)
-        return float(result[2])
+        return self._client.query_scalar(
+            "/live/clip/get/loop_start", track_index, clip_index, index=2
+        )
 
     def set_loop_start(
         self, track_index: int, clip_index: int, start: float
@@ -289,9 +858,10 @@ class Clip:
         Returns:
             Loop end position in beats
         """
-        result = self._client.query("/live/clip/get/loop_end", track_index, clip_index)
         # Response format: (track_index, clip_index, loop_end)
-        return float(result[2])
+        return self._client.query_scalar(
+            "/live/clip/get/loop_end", track_index, clip_index, index=2
+        )
 
     def set_loop_end(self, track_index: int, clip_index: int, end: float) -> None:
         """Set the loop end position.
@@ -320,7 +890,7 @@ class Clip:
         result = self._client.query(
             "/live/clip/get/start_time", track_index, clip_index
         )
-        return float(result[2])
+        return tail(result, 2, float, 0.0)
 
     def set_start_time(
         self, track_index: int, clip_index: int, time: float
@@ -349,7 +919,7 @@ class Clip:
         result = self._client.query(
             "/live/clip/get/end_time", track_index, clip_index
         )
-        return float(result[2])
+        return tail(result, 2, float, 0.0)
 
     def set_end_time(
         self, track_index: int, clip_index: int, time: float
@@ -380,7 +950,7 @@ class Clip:
         result = self._client.query(
             "/live/clip/get/looping", track_index, clip_index
         )
-        return bool(result[2])
+        return tail(result, 2, bool, False)
 
     def set_looping(
         self, track_index: int, clip_index: int, enabled: bool
@@ -420,7 +990,7 @@ class Clip:
         result = self._client.query(
             "/live/clip/get/warp_mode", track_index, clip_index
         )
-        return int(result[2])
+        return tail(result, 2, int, 0)
 
     def set_warp_mode(
         self, track_index: int, clip_index: int, mode: int
@@ -451,7 +1021,7 @@ class Clip:
         result = self._client.query(
             "/live/clip/get/pitch_coarse", track_index, clip_index
         )
-        return int(result[2]) if len(result) > 2 and result[2] is not None else 0
+        return tail(result, 2, int, 0)
 
     def set_pitch_coarse(
         self, track_index: int, clip_index: int, pitch: int
@@ -480,7 +1050,7 @@ class Clip:
         result = self._client.query(
             "/live/clip/get/pitch_fine", track_index, clip_index
         )
-        return float(result[2]) if len(result) > 2 and result[2] is not None else 0.0
+        return tail(result, 2, float, 0.0)
 
     def set_pitch_fine(
         self, track_index: int, clip_index: int, cents: float
@@ -511,7 +1081,7 @@ class Clip:
         result = self._client.query(
             "/live/clip/get/gain", track_index, clip_index
         )
-        return float(result[2]) if len(result) > 2 else 1.0
+        return tail(result, 2, float, 1.0)
 
     def set_gain(self, track_index: int, clip_index: int, gain: float) -> None:
         """Set the gain for an audio clip.
@@ -540,7 +1110,7 @@ class Clip:
         result = self._client.query(
             "/live/clip/get/warping", track_index, clip_index
         )
-        return bool(result[2]) if len(result) > 2 else False
+        return tail(result, 2, bool, False)
 
     def set_warping(
         self, track_index: int, clip_index: int, enabled: bool
@@ -571,7 +1141,7 @@ class Clip:
         result = self._client.query(
             "/live/clip/get/muted", track_index, clip_index
         )
-        return bool(result[2]) if len(result) > 2 else False
+        return tail(result, 2, bool, False)
 
     def set_muted(
         self, track_index: int, clip_index: int, muted: bool
@@ -599,10 +1169,9 @@ class Clip:
         Returns:
             Playhead position in beats
         """
-        result = self._client.query(
-            "/live/clip/get/playing_position", track_index, clip_index
+        return self._client.query_scalar(
+            "/live/clip/get/playing_position", track_index, clip_index, index=2
         )
-        return float(result[2]) if len(result) > 2 else 0.0
 
     # Color index
 
@@ -619,7 +1188,7 @@ class Clip:
         result = self._client.query(
             "/live/clip/get/color_index", track_index, clip_index
         )
-        return int(result[2]) if len(result) > 2 else 0
+        return tail(result, 2, int, 0)
 
     def set_color_index(
         self, track_index: int, clip_index: int, color_index: int
@@ -650,7 +1219,7 @@ class Clip:
         result = self._client.query(
             "/live/clip/get/start_marker", track_index, clip_index
         )
-        return float(result[2]) if len(result) > 2 else 0.0
+        return tail(result, 2, float, 0.0)
 
     def set_start_marker(
         self, track_index: int, clip_index: int, position: float
@@ -679,7 +1248,7 @@ class Clip:
         result = self._client.query(
             "/live/clip/get/end_marker", track_index, clip_index
         )
-        return float(result[2]) if len(result) > 2 else 0.0
+        return tail(result, 2, float, 0.0)
 
     def set_end_marker(
         self, track_index: int, clip_index: int, position: float
@@ -710,7 +1279,7 @@ class Clip:
         result = self._client.query(
             "/live/clip/get/sample_length", track_index, clip_index
         )
-        return float(result[2]) if len(result) > 2 else 0.0
+        return tail(result, 2, float, 0.0)
 
     # Recording state
 
@@ -727,7 +1296,7 @@ class Clip:
         result = self._client.query(
             "/live/clip/get/is_overdubbing", track_index, clip_index
         )
-        return bool(result[2]) if len(result) > 2 else False
+        return tail(result, 2, bool, False)
 
     def get_is_recording(self, track_index: int, clip_index: int) -> bool:
         """Check if clip is currently recording.
@@ -742,7 +1311,7 @@ class Clip:
         result = self._client.query(
             "/live/clip/get/is_recording", track_index, clip_index
         )
-        return bool(result[2]) if len(result) > 2 else False
+        return tail(result, 2, bool, False)
 
     def get_will_record_on_start(self, track_index: int, clip_index: int) -> bool:
         """Check if clip will start recording when launched.
@@ -757,7 +1326,7 @@ class Clip:
         result = self._client.query(
             "/live/clip/get/will_record_on_start", track_index, clip_index
         )
-        return bool(result[2]) if len(result) > 2 else False
+        return tail(result, 2, bool, False)
 
     # Launch mode
 
@@ -774,7 +1343,7 @@ class Clip:
         result = self._client.query(
             "/live/clip/get/launch_mode", track_index, clip_index
         )
-        return int(result[2]) if len(result) > 2 else 0
+        return tail(result, 2, int, 0)
 
     def set_launch_mode(
         self, track_index: int, clip_index: int, mode: int
@@ -805,7 +1374,7 @@ class Clip:
         result = self._client.query(
             "/live/clip/get/launch_quantization", track_index, clip_index
         )
-        return int(result[2]) if len(result) > 2 else 0
+        return tail(result, 2, int, 0)
 
     def set_launch_quantization(
         self, track_index: int, clip_index: int, quantization: int
@@ -836,7 +1405,7 @@ class Clip:
         result = self._client.query(
             "/live/clip/get/file_path", track_index, clip_index
         )
-        return str(result[2]) if len(result) > 2 else ""
+        return tail(result, 2, str, "")
 
     # Velocity amount (MIDI clips)
 
@@ -853,7 +1422,7 @@ class Clip:
         result = self._client.query(
             "/live/clip/get/velocity_amount", track_index, clip_index
         )
-        return float(result[2]) if len(result) > 2 else 1.0
+        return tail(result, 2, float, 1.0)
 
     def set_velocity_amount(
         self, track_index: int, clip_index: int, amount: float
@@ -884,7 +1453,7 @@ class Clip:
         result = self._client.query(
             "/live/clip/get/legato", track_index, clip_index
         )
-        return bool(result[2]) if len(result) > 2 else False
+        return tail(result, 2, bool, False)
 
     def set_legato(
         self, track_index: int, clip_index: int, enabled: bool
@@ -915,7 +1484,7 @@ class Clip:
         result = self._client.query(
             "/live/clip/get/position", track_index, clip_index
         )
-        return float(result[2]) if len(result) > 2 else 0.0
+        return tail(result, 2, float, 0.0)
 
     def set_position(
         self, track_index: int, clip_index: int, position: float
@@ -949,7 +1518,7 @@ class Clip:
         result = self._client.query(
             "/live/clip/get/ram_mode", track_index, clip_index
         )
-        return bool(result[2]) if len(result) > 2 else False
+        return tail(result, 2, bool, False)
 
     def set_ram_mode(
         self, track_index: int, clip_index: int, enabled: bool
@@ -980,7 +1549,7 @@ class Clip:
         result = self._client.query(
             "/live/clip/get/has_groove", track_index, clip_index
         )
-        return bool(result[2]) if len(result) > 2 else False
+        return tail(result, 2, bool, False)
 
     # Listener infrastructure
 
@@ -3,11 +3,38 @@
 Covers /live/clip_slot/* endpoints for clip slot management.
 """
 
-from abletonosc_client.client import AbletonOSCClient
+import struct
+
+from abletonosc_client.client import (
+    AbletonOSCClient,
+    message_template,
+    osc_properties,
+    tail,
+)
+
+# Fixed-shape message headers: fire()/stop() only ever append two int32s
+_FIRE_HEADER = message_template("/live/clip_slot/fire", "ii")
+_STOP_HEADER = message_template("/live/clip_slot/stop", "ii")
+
+
+@osc_properties(
+    "/live/clip_slot",
+    keys=2,
+    props=(
+        # (name, cast, default, writable)
+        ("has_clip", bool, False, False),
+        ("has_stop_button", bool, True, True),
+    ),
+)
+class ClipSlot:
+    """Clip slot operations like creating/deleting clips and checking status.
 
+    The uniform property accessors are generated from the
+    osc_properties() spec above; the playing-state getters keep
+    handwritten bodies because they read through query_fresh().
+    """
 
-class ClipSlot:
-    """Clip slot operations like creating/deleting clips and checking status."""
+    __slots__ = ("_client",)
 
     def __init__(self, client: AbletonOSCClient):
         self._client = client
@@ -22,11 +49,7 @@ class ClipSlot:
         Returns:
             True if the slot contains a clip
         """
-        result = self._client.query(
-            "/live/clip_slot/get/has_clip", track_index, scene_index
-        )
-        # Response format: (track_index, scene_index, has_clip)
-        return bool(result[2])
+        return self.get_has_clip(track_index, scene_index)
 
     def create_clip(
         self, track_index: int, scene_index: int, length: float = 4.0
@@ -58,7 +81,9 @@ class ClipSlot:
             track_index: Track index (0-based)
             scene_index: Scene index (0-based)
         """
-        self._client.send("/live/clip_slot/fire", track_index, scene_index)
+        self._client.send_raw(
+            _FIRE_HEADER + struct.pack(">ii", track_index, scene_index)
+        )
 
     def stop(self, track_index: int, scene_index: int) -> None:
         """Stop the clip in the slot.
@@ -67,7 +92,43 @@ class ClipSlot:
             track_index: Track index (0-based)
             scene_index: Scene index (0-based)
         """
-        self._client.send("/live/clip_slot/stop", track_index, scene_index)
+        self._client.send_raw(
+            _STOP_HEADER + struct.pack(">ii", track_index, scene_index)
+        )
+
+    # Playing state. These are the getters transport UIs poll at high
+    # frequency, so they read through query_fresh(): after watch(),
+    # pushed updates answer them from memory with no round trip.
+
+    _STATE_PROPS = ("is_playing", "is_triggered", "is_recording")
+
+    def watch(self, track_index: int, scene_index: int) -> None:
+        """Subscribe to playing-state pushes for a slot.
+
+        After this, get_is_playing()/get_is_triggered()/
+        get_is_recording() for the slot are served from pushed values
+        instead of issuing a query per call.
+
+        Args:
+            track_index: Track index (0-based)
+            scene_index: Scene index (0-based)
+        """
+        for prop in self._STATE_PROPS:
+            self._client.watch(
+                f"/live/clip_slot/get/{prop}", track_index, scene_index
+            )
+
+    def unwatch(self, track_index: int, scene_index: int) -> None:
+        """Cancel playing-state subscriptions for a slot.
+
+        Args:
+            track_index: Track index (0-based)
+            scene_index: Scene index (0-based)
+        """
+        for prop in self._STATE_PROPS:
+            self._client.unwatch(
+                f"/live/clip_slot/get/{prop}", track_index, scene_index
+            )
 
     def get_is_playing(self, track_index: int, scene_index: int) -> bool:
         """Check if the clip in the slot is playing.
@@ -79,11 +140,11 @@ class ClipSlot:
         Returns:
             True if playing
         """
-        result = self._client.query(
+        result = self._client.query_fresh(
             "/live/clip_slot/get/is_playing", track_index, scene_index
         )
         # Response format: (track_index, scene_index, is_playing)
-        return bool(result[2])
+        return tail(result, 2, bool, False)
 
     def get_is_triggered(self, track_index: int, scene_index: int) -> bool:
         """Check if the clip slot is triggered (about to play).
@@ -95,11 +156,11 @@ class ClipSlot:
         Returns:
             True if triggered
         """
-        result = self._client.query(
+        result = self._client.query_fresh(
             "/live/clip_slot/get/is_triggered", track_index, scene_index
         )
         # Response format: (track_index, scene_index, is_triggered)
-        return bool(result[2])
+        return tail(result, 2, bool, False)
 
     def get_is_recording(self, track_index: int, scene_index: int) -> bool:
         """Check if the clip slot is recording.
@@ -111,45 +172,11 @@ class ClipSlot:
         Returns:
             True if recording
         """
-        result = self._client.query(
+        result = self._client.query_fresh(
             "/live/clip_slot/get/is_recording", track_index, scene_index
         )
         # Response format: (track_index, scene_index, is_recording)
-        return bool(result[2])
-
-    # Stop button
-
-    def get_has_stop_button(self, track_index: int, scene_index: int) -> bool:
-        """Check if the clip slot has a stop button.
-
-        Args:
-            track_index: Track index (0-based)
-            scene_index: Scene index (0-based)
-
-        Returns:
-            True if slot has a stop button
-        """
-        result = self._client.query(
-            "/live/clip_slot/get/has_stop_button", track_index, scene_index
-        )
-        return bool(result[2]) if len(result) > 2 else True
-
-    def set_has_stop_button(
-        self, track_index: int, scene_index: int, has_button: bool
-    ) -> None:
-        """Set whether the clip slot has a stop button.
-
-        Args:
-            track_index: Track index (0-based)
-            scene_index: Scene index (0-based)
-            has_button: True to show stop button
-        """
-        self._client.send(
-            "/live/clip_slot/set/has_stop_button",
-            track_index,
-            scene_index,
-            int(has_button),
-        )
+        return tail(result, 2, bool, False)
 
     # Duplicate clip
 
@@ -5,7 +5,7 @@ Covers /live/device/* endpoints for device and parameter control.
 
 from typing import Callable, NamedTuple
 
-from abletonosc_client.client import AbletonOSCClient
+from abletonosc_client.client import AbletonOSCClient, tail
 
 
 class Parameter(NamedTuple):
@@ -26,14 +26,114 @@ class Parameter(NamedTuple):
     max: float
 
 
+class ParameterTable:
+    """Struct-of-arrays view of a device's parameter table.
+
+    Stores the columns (names, values, mins, maxs) as parallel tuples
+    instead of one Parameter object per row, which keeps bulk math on
+    the columns and avoids materializing objects for parameters that
+    are never looked at individually.
+
+    Attributes:
+        names: Parameter names
+        values: Current values
+        mins: Minimum values
+        maxs: Maximum values
+    """
+
+    __slots__ = ("names", "values", "mins", "maxs")
+
+    def __init__(self, names, values, mins, maxs):
+        self.names = tuple(str(n) for n in names)
+        self.values = tuple(float(v) for v in values)
+        self.mins = tuple(float(v) for v in mins)
+        self.maxs = tuple(float(v) for v in maxs)
+
+    def __len__(self) -> int:
+        return len(self.names)
+
+    def __getitem__(self, index: int) -> Parameter:
+        """Materialize one row as a Parameter (compatibility accessor)."""
+        return Parameter(
+            index=index,
+            name=self.names[index],
+            value=self.values[index],
+            min=self.mins[index],
+            max=self.maxs[index],
+        )
+
+    def normalized_values(self) -> tuple[float, ...]:
+        """Values rescaled to 0..1 within each parameter's range."""
+        return tuple(
+            (v - lo) / (hi - lo) if hi != lo else 0.0
+            for v, lo, hi in zip(self.values, self.mins, self.maxs)
+        )
+
+    def changed_mask(
+        self, reference, threshold: float = 1e-6
+    ) -> tuple[bool, ...]:
+        """Flag parameters whose value moved from a reference snapshot.
+
+        Args:
+            reference: Previous values (same length as this table)
+            threshold: Minimum absolute change that counts
+
+        Returns:
+            One bool per parameter
+        """
+        return tuple(
+            abs(v - r) > threshold for v, r in zip(self.values, reference)
+        )
+
+    def to_dict(self) -> dict[str, float]:
+        """Map parameter names to their current values."""
+        return dict(zip(self.names, self.values))
+
+
 class Device:
     """Device operations like getting/setting parameters."""
 
+    __slots__ = ("_client", "_param_callbacks", "_dispatcher_registered", "_meta_cache")
+
     def __init__(self, client: AbletonOSCClient):
         self._client = client
         # Listener callbacks: {(track_idx, device_idx, param_idx): callback}
         self._param_callbacks: dict[tuple[int, int, int], Callable] = {}
         self._dispatcher_registered: bool = False
+        # Memoized immutable metadata (names, class names, min/max):
+        # {(field, track_idx, device_idx, ...): value}. These are fixed
+        # while a device stays loaded; see invalidate().
+        self._meta_cache: dict[tuple, object] = {}
+
+    def _memo(self, key: tuple, fetch: Callable):
+        """Return memoized metadata, fetching over OSC only once per key."""
+        if key not in self._meta_cache:
+            self._meta_cache[key] = fetch()
+        return self._meta_cache[key]
+
+    def invalidate(
+        self, track_index: int | None = None, device_index: int | None = None
+    ) -> None:
+        """Drop memoized device metadata.
+
+        Call after loading or swapping devices so names and ranges are
+        re-fetched. With no arguments, everything is dropped; with
+        indices, only the matching device's entries are.
+
+        Args:
+            track_index: Limit the purge to this track (default: all)
+            device_index: Limit the purge to this device (default: all)
+        """
+        if track_index is None and device_index is None:
+            self._meta_cache.clear()
+            return
+        for key in [
+            k
+            for k in self._meta_cache
+            if (track_index is None or k[1] == track_index)
+            and (device_index is None or k[2] == device_index)
+        ]:
+            del self._meta_cache[key]
 
     def get_name(self, track_index: int, device_index: int) -> str:
         """Get the device name.
@@ -42,14 +142,20 @@ class Device:
             track_index: Track index (0-based)
             device_index: Device index on track (0-based)
 
+        Memoized: a device's name is fixed while it stays loaded.
+
         Returns:
             Device name
         """
-        result = self._client.query(
-            "/live/device/get/name", track_index, device_index
-        )
-        # Response format: (track_index, device_index, name)
-        return str(result[2]) if len(result) > 2 else ""
+
+        def fetch():
+            result = self._client.query(
+                "/live/device/get/name", track_index, device_index
+            )
+            # Response format: (track_index, device_index, name)
+            return tail(result, 2, str, "")
+
+        return self._memo(("name", track_index, device_index), fetch)
 
     def get_class_name(self, track_index: int, device_index: int) -> str:
         """Get the device class name (type).
@@ -58,14 +164,20 @@ class Device:
             track_index: Track index (0-based)
             device_index: Device index on track (0-based)
 
+        Memoized: a device's class never changes while it stays loaded.
+
         Returns:
             Device class name (e.g., "Compressor", "Reverb")
         """
-        result = self._client.query(
-            "/live/device/get/class_name", track_index, device_index
-        )
-        # Response format: (track_index, device_index, class_name)
-        return str(result[2]) if len(result) > 2 else ""
+
+        def fetch():
+            result = self._client.query(
+                "/live/device/get/class_name", track_index, device_index
+            )
+            # Response format: (track_index, device_index, class_name)
+            return tail(result, 2, str, "")
+
+        return self._memo(("class_name", track_index, device_index), fetch)
 
     def get_is_active(self, track_index: int, device_index: int) -> bool:
         """Check if the device is active (enabled).
@@ -81,7 +193,7 @@ class Device:
             "/live/device/get/is_active", track_index, device_index
         )
         # Response format: (track_index, device_index, is_active)
-        return bool(result[2])
+        return tail(result, 2, bool, False)
 
     def set_is_active(
         self, track_index: int, device_index: int, active: bool
@@ -111,7 +223,7 @@ class Device:
             "/live/device/get/num_parameters", track_index, device_index
         )
         # Response format: (track_index, device_index, num_parameters)
-        return int(result[2])
+        return tail(result, 2, int, 0)
 
     def get_parameter_value(
         self, track_index: int, device_index: int, parameter_index: int
@@ -133,7 +245,7 @@ class Device:
             parameter_index,
         )
         # Response format: (track_index, device_index, parameter_index, value)
-        return float(result[3])
+        return tail(result, 3, float, 0.0)
 
     def set_parameter_value(
         self,
@@ -168,17 +280,25 @@ class Device:
             device_index: Device index on track (0-based)
             parameter_index: Parameter index (0-based)
 
+        Memoized: parameter names are fixed while a device stays loaded.
+
         Returns:
             Parameter name
         """
-        result = self._client.query(
-            "/live/device/get/parameter/name",
-            track_index,
-            device_index,
-            parameter_index,
+
+        def fetch():
+            result = self._client.query(
+                "/live/device/get/parameter/name",
+                track_index,
+                device_index,
+                parameter_index,
+            )
+            # Response format: (track_index, device_index, parameter_index, name)
+            return tail(result, 3, str, "")
+
+        return self._memo(
+            ("param_name", track_index, device_index, parameter_index), fetch
         )
-        # Response format: (track_index, device_index, parameter_index, name)
-        return str(result[3]) if len(result) > 3 else ""
 
     def get_parameter_min(
         self, track_index: int, device_index: int, parameter_index: int
@@ -190,17 +310,25 @@ class Device:
             device_index: Device index on track (0-based)
             parameter_index: Parameter index (0-based)
 
+        Memoized: parameter ranges are fixed while a device stays loaded.
+
         Returns:
             Minimum parameter value
         """
-        result = self._client.query(
-            "/live/device/get/parameter/min",
-            track_index,
-            device_index,
-            parameter_index,
+
+        def fetch():
+            result = self._client.query(
+                "/live/device/get/parameter/min",
+                track_index,
+                device_index,
+                parameter_index,
+            )
+            # Response format: (track_index, device_index, parameter_index, min)
+            return tail(result, 3, float, 0.0)
+
+        return self._memo(
+            ("param_min", track_index, device_index, parameter_index), fetch
         )
-        # Response format: (track_index, device_index, parameter_index, min)
-        return float(result[3])
 
     def get_parameter_max(
         self, track_index: int, device_index: int, parameter_index: int
@@ -212,23 +340,36 @@ class Device:
             device_index: Device index on track (0-based)
             parameter_index: Parameter index (0-based)
 
+        Memoized: parameter ranges are fixed while a device stays loaded.
+
         Returns:
             Maximum parameter value
         """
-        result = self._client.query(
-            "/live/device/get/parameter/max",
-            track_index,
-            device_index,
-            parameter_index,
+
+        def fetch():
+            result = self._client.query(
+                "/live/device/get/parameter/max",
+                track_index,
+                device_index,
+                parameter_index,
+            )
+            # Response format: (track_index, device_index, parameter_index, max)
+            return tail(result, 3, float, 0.0)
+
+        return self._memo(
+            ("param_max", track_index, device_index, parameter_index), fetch
         )
-        # Response format: (track_index, device_index, parameter_index, max)
-        return float(result[3])
 
     def get_parameters(
         self, track_index: int, device_index: int
     ) -> list[Parameter]:
         """Get all parameters for a device.
 
+        Uses the bulk /live/device/get/parameters/* endpoints, so the
+        whole table costs four round trips regardless of parameter
+        count instead of 1 + 4 per parameter. Names and ranges are
+        memoized, so repeat calls only re-query the values.
+
         Args:
             track_index: Track index (0-based)
             device_index: Device index on track (0-based)
@@ -236,19 +377,124 @@ class Device:
         Returns:
             List of Parameter objects
         """
-        num_params = self.get_num_parameters(track_index, device_index)
-        parameters = []
-
-        for i in range(num_params):
-            name = self.get_parameter_name(track_index, device_index, i)
-            value = self.get_parameter_value(track_index, device_index, i)
-            min_val = self.get_parameter_min(track_index, device_index, i)
-            max_val = self.get_parameter_max(track_index, device_index, i)
-            parameters.append(
-                Parameter(index=i, name=name, value=value, min=min_val, max=max_val)
+        names = self.get_parameters_names(track_index, device_index)
+        values = self.get_parameters_values(track_index, device_index)
+        mins = self.get_parameters_mins(track_index, device_index)
+        maxs = self.get_parameters_maxs(track_index, device_index)
+        return [
+            Parameter(
+                index=i, name=str(n), value=float(v), min=float(lo), max=float(hi)
+            )
+            for i, (n, v, lo, hi) in enumerate(zip(names, values, mins, maxs))
+        ]
+
+    def get_parameters_bulk(
+        self, track_index: int, device_indices: list[int]
+    ) -> dict[int, list[Parameter]]:
+        """Get parameters for several devices in overlapped round trips.
+
+        Builds one query_many() batch covering all devices, so the
+        four bulk endpoints per device are pipelined instead of
+        serializing 4 x N sequential round trips when scanning a whole
+        rack. Fetched names and ranges are fed into the metadata memo,
+        so later per-device calls skip those queries too.
+
+        Args:
+            track_index: Track index (0-based)
+            device_indices: Device indices on the track (0-based)
+
+        Returns:
+            {device_index: [Parameter, ...]} for each requested device
+        """
+        endpoints = (
+            "/live/device/get/parameters/name",
+            "/live/device/get/parameters/value",
+            "/live/device/get/parameters/min",
+            "/live/device/get/parameters/max",
+        )
+        queries = [
+            (address, (track_index, device_index))
+            for device_index in device_indices
+            for address in endpoints
+        ]
+        results = self._client.query_many(queries)
+
+        tables: dict[int, list[Parameter]] = {}
+        for slot, device_index in enumerate(device_indices):
+            names, values, mins, maxs = (
+                r[2:] for r in results[4 * slot : 4 * slot + 4]
             )
+            for memo_tag, column in (
+                ("params_names", names),
+                ("params_mins", mins),
+                ("params_maxs", maxs),
+            ):
+                self._meta_cache[(memo_tag, track_index, device_index)] = column
+            tables[device_index] = [
+                Parameter(
+                    index=i, name=str(n), value=float(v), min=float(lo), max=float(hi)
+                )
+                for i, (n, v, lo, hi) in enumerate(zip(names, values, mins, maxs))
+            ]
+        return tables
+
+    # Properties fetched by snapshot(), with their result casts
+    _SNAPSHOT_FIELDS = (
+        ("name", str),
+        ("class_name", str),
+        ("type", int),
+        ("num_parameters", int),
+        ("is_active", bool),
+    )
+
+    def snapshot(self, track_index: int, device_index: int) -> dict:
+        """Fetch the common device properties in one pipelined round trip.
+
+        Uses the client's query_many(), so the per-property queries go
+        out back-to-back instead of serializing one RTT each.
+
+        Args:
+            track_index: Track index (0-based)
+            device_index: Device index on track (0-based)
+
+        Returns:
+            Dict mapping property name to its value (name, class_name,
+            type, num_parameters, is_active)
+        """
+        responses = self._client.query_many(
+            [
+                (f"/live/device/get/{prop}", (track_index, device_index))
+                for prop, _ in self._SNAPSHOT_FIELDS
+            ]
+        )
+        return {
+            prop: cast(response[2])
+            for (prop, cast), response in zip(self._SNAPSHOT_FIELDS, responses)
+        }
 
-        return parameters
+    def get_parameter_table(
+        self, track_index: int, device_index: int
+    ) -> ParameterTable:
+        """Get all parameters as a column-wise ParameterTable.
+
+        Fast path for bulk work: the four bulk responses become the
+        table's columns directly, with no per-parameter objects. Names
+        and ranges come from the metadata memo, so repeat calls only
+        re-query the values.
+
+        Args:
+            track_index: Track index (0-based)
+            device_index: Device index on track (0-based)
+
+        Returns:
+            ParameterTable for the device
+        """
+        return ParameterTable(
+            self.get_parameters_names(track_index, device_index),
+            self.get_parameters_values(track_index, device_index),
+            self.get_parameters_mins(track_index, device_index),
+            self.get_parameters_maxs(track_index, device_index),
+        )
 
     # Device type
 
@@ -265,7 +511,7 @@ class Device:
         result = self._client.query(
             "/live/device/get/type", track_index, device_index
         )
-        return int(result[2]) if len(result) > 2 else 0
+        return tail(result, 2, int, 0)
 
     # Bulk parameter operations
 
@@ -276,14 +522,20 @@ class Device:
             track_index: Track index (0-based)
             device_index: Device index on track (0-based)
 
+        Memoized: parameter names are fixed while a device stays loaded.
+
         Returns:
             Tuple of parameter names
         """
-        result = self._client.query(
-            "/live/device/get/parameters/name", track_index, device_index
-        )
-        # Response format: (track_index, device_index, name1, name2, ...)
-        return result[2:] if len(result) > 2 else ()
+
+        def fetch():
+            result = self._client.query(
+                "/live/device/get/parameters/name", track_index, device_index
+            )
+            # Response format: (track_index, device_index, name1, name2, ...)
+            return result[2:] if len(result) > 2 else ()
+
+        return self._memo(("params_names", track_index, device_index), fetch)
 
     def get_parameters_values(self, track_index: int, device_index: int) -> tuple:
         """Get all parameter values for a device in a single query.
@@ -324,13 +576,19 @@ class Device:
             track_index: Track index (0-based)
             device_index: Device index on track (0-based)
 
+        Memoized: parameter ranges are fixed while a device stays loaded.
+
         Returns:
             Tuple of minimum values
         """
-        result = self._client.query(
-            "/live/device/get/parameters/min", track_index, device_index
-        )
-        return result[2:] if len(result) > 2 else ()
+
+        def fetch():
+            result = self._client.query(
+                "/live/device/get/parameters/min", track_index, device_index
+            )
+            return result[2:] if len(result) > 2 else ()
+
+        return self._memo(("params_mins", track_index, device_index), fetch)
 
     def get_parameters_maxs(self, track_index: int, device_index: int) -> tuple:
         """Get all parameter maximum values for a device.
@@ -339,13 +597,19 @@ class Device:
             track_index: Track index (0-based)
             device_index: Device index on track (0-based)
 
+        Memoized: parameter ranges are fixed while a device stays loaded.
+
         Returns:
             Tuple of maximum values
         """
-        result = self._client.query(
-            "/live/device/get/parameters/max", track_index, device_index
-        )
-        return result[2:] if len(result) > 2 else ()
+
+        def fetch():
+            result = self._client.query(
+                "/live/device/get/parameters/max", track_index, device_index
+            )
+            return result[2:] if len(result) > 2 else ()
+
+        return self._memo(("params_maxs", track_index, device_index), fetch)
 
     def get_parameters_is_quantized(
         self, track_index: int, device_index: int
@@ -385,7 +649,7 @@ class Device:
             device_index,
             parameter_index,
         )
-        return str(result[3]) if len(result) > 3 else ""
+        return tail(result, 3, str, "")
 
     # Parameter listener
 
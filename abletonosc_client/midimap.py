@@ -9,6 +9,8 @@ from abletonosc_client.client import AbletonOSCClient
 class MidiMap:
     """MIDI mapping operations for controlling Live parameters via MIDI CC."""
 
+    __slots__ = ("_client",)
+
     def __init__(self, client: AbletonOSCClient):
         self._client = client
 
@@ -3,16 +3,49 @@
 Covers /live/song/* endpoints for global song properties and transport.
 """
 
-from typing import Callable
-
-from abletonosc_client.client import AbletonOSCClient
+import struct
+from typing import Any, Callable
+
+from abletonosc_client.client import (
+    AbletonOSCClient,
+    encode_message,
+    message_template,
+    tail,
+)
+
+# Hot transport/tempo messages, encoded once at import. The zero-arg
+# commands are fully constant datagrams; set_tempo appends a packed
+# float to its precomputed address+typetag header, and the boolean
+# setters index an (off, on) pair of constant datagrams.
+_SET_TEMPO_HEADER = message_template("/live/song/set/tempo", "f")
+_START_PLAYING = encode_message("/live/song/start_playing")
+_STOP_PLAYING = encode_message("/live/song/stop_playing")
+_CONTINUE_PLAYING = encode_message("/live/song/continue_playing")
+_STOP_ALL_CLIPS = encode_message("/live/song/stop_all_clips")
+_CAPTURE_MIDI = encode_message("/live/song/capture_midi")
+_UNDO = encode_message("/live/song/undo")
+_REDO = encode_message("/live/song/redo")
+_CREATE_RETURN_TRACK = encode_message("/live/song/create_return_track")
+_TAP_TEMPO = encode_message("/live/song/tap_tempo")
+_SET_METRONOME = (
+    encode_message("/live/song/set/metronome", 0),
+    encode_message("/live/song/set/metronome", 1),
+)
+_SET_RECORD_MODE = (
+    encode_message("/live/song/set/record_mode", 0),
+    encode_message("/live/song/set/record_mode", 1),
+)
 
 
 class Song:
     """Song-level operations like tempo, transport, and song structure."""
 
+    __slots__ = ("_client", "_tempo_sub", "_is_playing_sub")
+
     def __init__(self, client: AbletonOSCClient):
         self._client = client
+        self._tempo_sub = None
+        self._is_playing_sub = None
 
     # Tempo
 
@@ -22,8 +55,10 @@ class Song:
         Returns:
             Tempo in beats per minute (20-999)
         """
-        result = self._client.query("/live/song/get/tempo")
-        return float(result[0])
+        cached = self._client.peek("/live/song/get/tempo")
+        if cached is not None:
+            return tail(cached, 0, float, 0.0)
+        return self._client.query_scalar("/live/song/get/tempo", index=0)
 
     def set_tempo(self, bpm: float) -> None:
         """Set the song tempo.
@@ -31,7 +66,7 @@ class Song:
         Args:
             bpm: Tempo in beats per minute (20-999)
         """
-        self._client.send("/live/song/set/tempo", float(bpm))
+        self._client.send_raw(_SET_TEMPO_HEADER + struct.pack(">f", bpm))
 
     # Transport
 
@@ -41,20 +76,20 @@ class Song:
         Returns:
             True if playing, False if stopped
         """
-        result = self._client.query("/live/song/get/is_playing")
-        return bool(result[0])
+        result = self._client.query_fresh("/live/song/get/is_playing", max_age=None)
+        return tail(result, 0, bool, False)
 
     def start_playing(self) -> None:
         """Start playback."""
-        self._client.send("/live/song/start_playing")
+        self._client.send_raw(_START_PLAYING)
 
     def stop_playing(self) -> None:
         """Stop playback."""
-        self._client.send("/live/song/stop_playing")
+        self._client.send_raw(_STOP_PLAYING)
 
     def continue_playing(self) -> None:
         """Continue playback from current position."""
-        self._client.send("/live/song/continue_playing")
+        self._client.send_raw(_CONTINUE_PLAYING)
 
     # Time signature
 
@@ -64,8 +99,8 @@ class Song:
         Returns:
             Time signature numerator (e.g., 4 for 4/4)
         """
-        result = self._client.query("/live/song/get/signature_numerator")
-        return int(result[0])
+        result = self._client.query_fresh("/live/song/get/signature_numerator", max_age=None)
+        return tail(result, 0, int, 0)
 
     def get_signature_denominator(self) -> int:
         """Get the time signature denominator.
@@ -73,8 +108,8 @@ class Song:
         Returns:
             Time signature denominator (e.g., 4 for 4/4)
         """
-        result = self._client.query("/live/song/get/signature_denominator")
-        return int(result[0])
+        result = self._client.query_fresh("/live/song/get/signature_denominator", max_age=None)
+        return tail(result, 0, int, 0)
 
     def set_signature_numerator(self, numerator: int) -> None:
         """Set the time signature numerator.
@@ -82,7 +117,8 @@ class Song:
         Args:
             numerator: Time signature numerator
         """
-        self._client.send("/live/song/set/signature_numerator", int(numerator))
+        self._client.send("/live/song/set/signature_numerator",
+                          numerator if type(numerator) is int else int(numerator))
 
     def set_signature_denominator(self, denominator: int) -> None:
         """Set the time signature denominator.
@@ -90,7 +126,85 @@ class Song:
         Args:
             denominator: Time signature denominator (must be power of 2)
         """
-        self._client.send("/live/song/set/signature_denominator", int(denominator))
+        self._client.send("/live/song/set/signature_denominator",
+                          denominator if type(denominator) is int else int(denominator))
+
+    def set_signature(self, numerator: int, denominator: int) -> None:
+        """Set the full time signature as one bundle.
+
+        Both halves arrive in a single datagram, so Live applies them
+        in the same tick - no window where 7/8 briefly reads as 7/4.
+
+        Args:
+            numerator: Time signature numerator
+            denominator: Time signature denominator (must be power of 2)
+        """
+        with self._client.bundle():
+            self.set_signature_numerator(numerator)
+            self.set_signature_denominator(denominator)
+
+    def apply(self, actions: list[tuple[str, tuple]]) -> None:
+        """Send several commands as one immediate OSC bundle.
+
+        Composite sequences (stop, reposition, re-arm, ...) otherwise
+        pay per-message send overhead and risk interleaving with other
+        senders; bundled, they ship in one datagram and Live processes
+        them together.
+
+        Args:
+            actions: (address, args) pairs, sent in order
+
+        Example:
+            song.apply([
+                ("/live/song/stop_playing", ()),
+                ("/live/song/set/current_song_time", (0.0,)),
+            ])
+        """
+        with self._client.bundle():
+            for address, args in actions:
+                self._client.send(address, *args)
+
+    def batch_get(self, names: list[str]) -> tuple:
+        """Read several song properties over one round trip.
+
+        The positional counterpart to get_state(): same pipelined
+        fetch and per-field casts, but returns values in request order
+        for tuple unpacking. Handy for save-and-restore patterns that
+        snapshot a few properties before mutating them.
+
+        Args:
+            names: Property names from _STATE_FIELDS
+
+        Returns:
+            Property values in the same order as names
+
+        Raises:
+            ValueError: If a requested name is not supported
+
+        Example:
+            num, denom = song.batch_get(
+                ["signature_numerator", "signature_denominator"]
+            )
+        """
+        state = self.get_state(names)
+        return tuple(state[name] for name in names)
+
+    def batch_set(self, pairs: list[tuple[str, Any]]) -> None:
+        """Write several song properties as one immediate OSC bundle.
+
+        The counterpart to batch_get() for restoring a snapshot: all
+        writes ship in a single datagram and Live applies them in the
+        same tick.
+
+        Args:
+            pairs: (property name, value) pairs, applied in order
+
+        Example:
+            song.batch_set([("signature_numerator", 4), ("loop", 0)])
+        """
+        with self._client.bundle():
+            for name, value in pairs:
+                self._client.send(f"/live/song/set/{name}", value)
 
     # Song structure
 
@@ -100,8 +214,8 @@ class Song:
         Returns:
             Number of tracks (including return tracks and master)
         """
-        result = self._client.query("/live/song/get/num_tracks")
-        return int(result[0])
+        result = self._client.query_fresh("/live/song/get/num_tracks", max_age=None)
+        return tail(result, 0, int, 0)
 
     def get_num_scenes(self) -> int:
         """Get the number of scenes in the song.
@@ -109,8 +223,8 @@ class Song:
         Returns:
             Number of scenes
         """
-        result = self._client.query("/live/song/get/num_scenes")
-        return int(result[0])
+        result = self._client.query_fresh("/live/song/get/num_scenes", max_age=None)
+        return tail(result, 0, int, 0)
 
     # Position
 
@@ -121,7 +235,7 @@ class Song:
             Current position in beats
         """
         result = self._client.query("/live/song/get/current_song_time")
-        return float(result[0])
+        return tail(result, 0, float, 0.0)
 
     def set_current_song_time(self, beats: float) -> None:
         """Set the playback position.
@@ -129,7 +243,8 @@ class Song:
         Args:
             beats: Position in beats
         """
-        self._client.send("/live/song/set/current_song_time", float(beats))
+        self._client.send("/live/song/set/current_song_time",
+                          beats if type(beats) is float else float(beats))
 
     # Metronome
 
@@ -139,8 +254,8 @@ class Song:
         Returns:
             True if metronome is on
         """
-        result = self._client.query("/live/song/get/metronome")
-        return bool(result[0])
+        result = self._client.query_fresh("/live/song/get/metronome", max_age=None)
+        return tail(result, 0, bool, False)
 
     def set_metronome(self, enabled: bool) -> None:
         """Enable or disable the metronome.
@@ -148,7 +263,7 @@ class Song:
         Args:
             enabled: True to enable metronome
         """
-        self._client.send("/live/song/set/metronome", int(enabled))
+        self._client.send_raw(_SET_METRONOME[bool(enabled)])
 
     # Record
 
@@ -158,8 +273,8 @@ class Song:
         Returns:
             True if record mode is on
         """
-        result = self._client.query("/live/song/get/record_mode")
-        return bool(result[0])
+        result = self._client.query_fresh("/live/song/get/record_mode", max_age=None)
+        return tail(result, 0, bool, False)
 
     def set_record_mode(self, enabled: bool) -> None:
         """Enable or disable record mode.
@@ -167,7 +282,96 @@ class Song:
         Args:
             enabled: True to enable record mode
         """
-        self._client.send("/live/song/set/record_mode", int(enabled))
+        self._client.send_raw(_SET_RECORD_MODE[bool(enabled)])
+
+    # Watched state: these properties change rarely but are read every
+    # UI refresh, so their getters read through query_fresh()/peek().
+    # After watch(), Live pushes each change once and every read is a
+    # dict lookup; unwatched, the getters query as before.
+
+    _WATCHED_PROPS = (
+        "tempo",
+        "is_playing",
+        "signature_numerator",
+        "signature_denominator",
+        "num_tracks",
+        "num_scenes",
+        "metronome",
+        "record_mode",
+    )
+
+    def watch(self) -> None:
+        """Subscribe to pushes for the frequently polled song properties.
+
+        One start_listen per property at subscription time buys
+        round-trip-free reads for get_tempo(), get_is_playing(),
+        get_num_tracks(), get_num_scenes(), the signature getters,
+        get_metronome(), and get_record_mode() - each pushed value
+        stays valid until Live pushes the next change.
+        """
+        for prop in self._WATCHED_PROPS:
+            self._client.watch(f"/live/song/get/{prop}")
+
+    def unwatch(self) -> None:
+        """Cancel the song property subscriptions from watch()."""
+        for prop in self._WATCHED_PROPS:
+            self._client.unwatch(f"/live/song/get/{prop}")
+
+    # Song state snapshot
+
+    # Fields fetched by get_state(), with their result casts
+    _STATE_FIELDS = {
+        "tempo": float,
+        "is_playing": bool,
+        "signature_numerator": int,
+        "signature_denominator": int,
+        "num_tracks": int,
+        "num_scenes": int,
+        "current_song_time": float,
+        "metronome": bool,
+        "record_mode": bool,
+        "groove_amount": float,
+        "can_undo": bool,
+        "can_redo": bool,
+        "song_length": float,
+        "loop": bool,
+        "loop_start": float,
+        "loop_length": float,
+    }
+
+    def get_state(self, fields: "list[str] | None" = None) -> dict:
+        """Fetch several song properties in one pipelined round trip.
+
+        Uses the client's query_many(), so the per-property queries go
+        out back-to-back and a dashboard-style poll costs roughly one
+        RTT instead of one per field.
+
+        Args:
+            fields: Property names to fetch (default: all supported;
+                see _STATE_FIELDS)
+
+        Returns:
+            {field: value} with values cast per field
+
+        Raises:
+            ValueError: If a requested field is not supported
+        """
+        if fields is None:
+            fields = list(self._STATE_FIELDS)
+        else:
+            unknown = [f for f in fields if f not in self._STATE_FIELDS]
+            if unknown:
+                raise ValueError(
+                    f"Unknown song state field(s) {unknown}. "
+                    f"Available: {', '.join(sorted(self._STATE_FIELDS))}"
+                )
+        results = self._client.query_many(
+            [(f"/live/song/get/{field}", ()) for field in fields]
+        )
+        return {
+            field: tail(result, 0, self._STATE_FIELDS[field], None)
+            for field, result in zip(fields, results)
+        }
 
     # Listeners
 
@@ -177,15 +381,21 @@ class Song:
         Args:
             callback: Function(tempo) called when tempo changes
         """
-        self._client.send("/live/song/start_listen/tempo")
-        self._client.start_listener(
-            "/live/song/get/tempo", lambda addr, *args: callback(float(args[0]))
+        # subscribe() registers the callback before start_listen goes
+        # out, so the initial push can't arrive unhandled; the scalar
+        # cast path keeps up when Live floods accumulated updates
+        self._tempo_sub = self._client.subscribe(
+            "/live/song/start_listen/tempo",
+            "/live/song/get/tempo",
+            callback,
+            cast=float,
         )
 
     def stop_tempo_listener(self) -> None:
         """Stop listening for tempo changes."""
-        self._client.send("/live/song/stop_listen/tempo")
-        self._client.stop_listener("/live/song/get/tempo")
+        if self._tempo_sub is not None:
+            self._tempo_sub.unsubscribe()
+            self._tempo_sub = None
 
     def on_is_playing_change(self, callback: Callable[[bool], None]) -> None:
         """Register a callback for play state changes.
@@ -193,15 +403,18 @@ class Song:
         Args:
             callback: Function(is_playing) called when play state changes
         """
-        self._client.send("/live/song/start_listen/is_playing")
-        self._client.start_listener(
-            "/live/song/get/is_playing", lambda addr, *args: callback(bool(args[0]))
+        self._is_playing_sub = self._client.subscribe(
+            "/live/song/start_listen/is_playing",
+            "/live/song/get/is_playing",
+            callback,
+            cast=bool,
         )
 
     def stop_is_playing_listener(self) -> None:
         """Stop listening for play state changes."""
-        self._client.send("/live/song/stop_listen/is_playing")
-        self._client.stop_listener("/live/song/get/is_playing")
+        if self._is_playing_sub is not None:
+            self._is_playing_sub.unsubscribe()
+            self._is_playing_sub = None
 
     # Track management
 
@@ -213,6 +426,61 @@ class Song:
         """
         self._client.send("/live/song/create_midi_track", index)
 
+    def create_midi_track_with(
+        self,
+        index: int = -1,
+        name: str | None = None,
+        device: str | None = None,
+        clip_length: float | None = None,
+        timeout: float = 5.0,
+    ) -> int:
+        """Create a MIDI track and set it up with minimal round trips.
+
+        Client-side fusion of create_midi_track + set_name +
+        insert_device + create_clip: the create is confirmed via
+        num_tracks (no fixed sleep), then the remaining setup goes out
+        as one bundle. AbletonOSC has no atomic server-side op for
+        this, so this is the fewest-packet equivalent.
+
+        Args:
+            index: Position to insert track (-1 appends to end)
+            name: Track name to set (skipped if None)
+            device: Device name to insert (skipped if None)
+            clip_length: Length in beats of a clip to create in scene 0
+                         (skipped if None)
+            timeout: How long to wait for the track to appear
+
+        Returns:
+            Index of the newly created track
+        """
+        before = self.get_num_tracks()
+        track_index = before if index == -1 else index
+        self._client.send_and_wait(
+            "/live/song/create_midi_track",
+            (index,),
+            "/live/song/get/num_tracks",
+            predicate=lambda r: int(r[0]) > before,
+            timeout=timeout,
+        )
+        if device is not None:
+            # insert_device responds with the device index, so it can't
+            # ride in the bundle
+            self._client.query(
+                "/live/track/insert_device", track_index, device, -1,
+                timeout=timeout,
+            )
+        if name is not None or clip_length is not None:
+            with self._client.bundle():
+                if name is not None:
+                    self._client.send("/live/track/set/name", track_index, name)
+                if clip_length is not None:
+                    self._client.send(
+                        "/live/clip_slot/create_clip",
+                        track_index, 0,
+                        clip_length if type(clip_length) is float else float(clip_length),
+                    )
+        return track_index
+
     def create_audio_track(self, index: int = -1) -> None:
         """Create a new audio track.
 
@@ -223,7 +491,7 @@ class Song:
 
     def create_return_track(self) -> None:
         """Create a new return track."""
-        self._client.send("/live/song/create_return_track")
+        self._client.send_raw(_CREATE_RETURN_TRACK)
 
     def delete_track(self, index: int) -> None:
         """Delete track at index.
@@ -258,7 +526,7 @@ class Song:
             Groove amount (0.0-1.0)
         """
         result = self._client.query("/live/song/get/groove_amount")
-        return float(result[0])
+        return tail(result, 0, float, 0.0)
 
     def set_groove_amount(self, amount: float) -> None:
         """Set the global groove amount.
@@ -266,17 +534,18 @@ class Song:
         Args:
             amount: Groove amount (0.0-1.0)
         """
-        self._client.send("/live/song/set/groove_amount", float(amount))
+        self._client.send("/live/song/set/groove_amount",
+                          amount if type(amount) is float else float(amount))
 
     # Undo/Redo
 
     def undo(self) -> None:
         """Undo the last action."""
-        self._client.send("/live/song/undo")
+        self._client.send_raw(_UNDO)
 
     def redo(self) -> None:
         """Redo the last undone action."""
-        self._client.send("/live/song/redo")
+        self._client.send_raw(_REDO)
 
     def can_undo(self) -> bool:
         """Check if undo is available.
@@ -285,7 +554,7 @@ class Song:
             True if undo is possible
         """
         result = self._client.query("/live/song/get/can_undo")
-        return bool(result[0])
+        return tail(result, 0, bool, False)
 
     def can_redo(self) -> bool:
         """Check if redo is available.
@@ -294,13 +563,13 @@ class Song:
             True if redo is possible
         """
         result = self._client.query("/live/song/get/can_redo")
-        return bool(result[0])
+        return tail(result, 0, bool, False)
 
     # Clip control
 
     def stop_all_clips(self) -> None:
         """Stop all playing clips in the session."""
-        self._client.send("/live/song/stop_all_clips")
+        self._client.send_raw(_STOP_ALL_CLIPS)
 
     # MIDI capture
 
@@ -310,7 +579,7 @@ class Song:
         Creates a new clip from MIDI notes that were played
         while not recording (requires armed track).
         """
-        self._client.send("/live/song/capture_midi")
+        self._client.send_raw(_CAPTURE_MIDI)
 
     # Scene management
 
@@ -345,7 +614,7 @@ class Song:
             Song length in beats
         """
         result = self._client.query("/live/song/get/song_length")
-        return float(result[0])
+        return tail(result, 0, float, 0.0)
 
     # Loop control
 
@@ -356,7 +625,7 @@ class Song:
             True if loop is enabled
         """
         result = self._client.query("/live/song/get/loop")
-        return bool(result[0])
+        return tail(result, 0, bool, False)
 
     def set_loop(self, enabled: bool) -> None:
         """Enable or disable loop.
@@ -373,7 +642,7 @@ class Song:
             Loop start position in beats
         """
         result = self._client.query("/live/song/get/loop_start")
-        return float(result[0])
+        return tail(result, 0, float, 0.0)
 
     def set_loop_start(self, beats: float) -> None:
         """Set the loop start position.
@@ -381,7 +650,8 @@ class Song:
         Args:
             beats: Loop start position in beats
         """
-        self._client.send("/live/song/set/loop_start", float(beats))
+        self._client.send("/live/song/set/loop_start",
+                          beats if type(beats) is float else float(beats))
 
     def get_loop_length(self) -> float:
         """Get the loop length in beats.
@@ -390,7 +660,7 @@ class Song:
             Loop length in beats
         """
         result = self._client.query("/live/song/get/loop_length")
-        return float(result[0])
+        return tail(result, 0, float, 0.0)
 
     def set_loop_length(self, beats: float) -> None:
         """Set the loop length.
@@ -398,7 +668,8 @@ class Song:
         Args:
             beats: Loop length in beats
         """
-        self._client.send("/live/song/set/loop_length", float(beats))
+        self._client.send("/live/song/set/loop_length",
+                          beats if type(beats) is float else float(beats))
 
     # Quantization
 
@@ -410,7 +681,7 @@ class Song:
             5=1/16, 6=1/16T, 7=1/16+1/16T, 8=1/32)
         """
         result = self._client.query("/live/song/get/midi_recording_quantization")
-        return int(result[0])
+        return tail(result, 0, int, 0)
 
     def set_midi_recording_quantization(self, value: int) -> None:
         """Set the MIDI recording quantization.
@@ -419,7 +690,8 @@ class Song:
             value: Quantization value (0=None, 1=1/4, 2=1/8, 3=1/8T, 4=1/8+1/8T,
                    5=1/16, 6=1/16T, 7=1/16+1/16T, 8=1/32)
         """
-        self._client.send("/live/song/set/midi_recording_quantization", int(value))
+        self._client.send("/live/song/set/midi_recording_quantization",
+                          value if type(value) is int else int(value))
 
     def get_clip_trigger_quantization(self) -> int:
         """Get the clip trigger quantization setting.
@@ -430,7 +702,7 @@ class Song:
             11=1/16, 12=1/16T, 13=1/32)
         """
         result = self._client.query("/live/song/get/clip_trigger_quantization")
-        return int(result[0])
+        return tail(result, 0, int, 0)
 
     def set_clip_trigger_quantization(self, value: int) -> None:
         """Set the clip trigger quantization.
@@ -440,7 +712,8 @@ class Song:
                    4=1 bar, 5=1/2, 6=1/2T, 7=1/4, 8=1/4T, 9=1/8, 10=1/8T,
                    11=1/16, 12=1/16T, 13=1/32)
         """
-        self._client.send("/live/song/set/clip_trigger_quantization", int(value))
+        self._client.send("/live/song/set/clip_trigger_quantization",
+                          value if type(value) is int else int(value))
 
     # Session recording
 
@@ -458,7 +731,7 @@ class Song:
             True if session recording is enabled
         """
         result = self._client.query("/live/song/get/session_record")
-        return bool(result[0])
+        return tail(result, 0, bool, False)
 
     def set_session_record(self, enabled: bool) -> None:
         """Enable or disable session recording.
@@ -477,7 +750,7 @@ class Song:
             True if arrangement overdub is enabled
         """
         result = self._client.query("/live/song/get/arrangement_overdub")
-        return bool(result[0])
+        return tail(result, 0, bool, False)
 
     def set_arrangement_overdub(self, enabled: bool) -> None:
         """Enable or disable arrangement overdub.
@@ -496,7 +769,7 @@ class Song:
             True if punch-in is enabled
         """
         result = self._client.query("/live/song/get/punch_in")
-        return bool(result[0])
+        return tail(result, 0, bool, False)
 
     def set_punch_in(self, enabled: bool) -> None:
         """Enable or disable punch-in.
@@ -513,7 +786,7 @@ class Song:
             True if punch-out is enabled
         """
         result = self._client.query("/live/song/get/punch_out")
-        return bool(result[0])
+        return tail(result, 0, bool, False)
 
     def set_punch_out(self, enabled: bool) -> None:
         """Enable or disable punch-out.
@@ -527,7 +800,7 @@ class Song:
 
     def tap_tempo(self) -> None:
         """Tap tempo - call repeatedly to set tempo by tapping."""
-        self._client.send("/live/song/tap_tempo")
+        self._client.send_raw(_TAP_TEMPO)
 
     def jump_by(self, beats: float) -> None:
         """Jump forward or backward by a number of beats.
@@ -535,7 +808,8 @@ class Song:
         Args:
             beats: Number of beats to jump (negative to go backward)
         """
-        self._client.send("/live/song/jump_by", float(beats))
+        self._client.send("/live/song/jump_by",
+                          beats if type(beats) is float else float(beats))
 
     def jump_to_next_cue(self) -> None:
         """Jump to the next cue point."""
@@ -590,7 +864,7 @@ class Song:
             Root note as MIDI note number (0-11, where 0=C, 1=C#, etc.)
         """
         result = self._client.query("/live/song/get/root_note")
-        return int(result[0])
+        return tail(result, 0, int, 0)
 
     def set_root_note(self, note: int) -> None:
         """Set the root note of the song's key.
@@ -598,7 +872,8 @@ class Song:
         Args:
             note: Root note as MIDI note number (0-11, where 0=C, 1=C#, etc.)
         """
-        self._client.send("/live/song/set/root_note", int(note))
+        self._client.send("/live/song/set/root_note",
+                          note if type(note) is int else int(note))
 
     def get_scale_name(self) -> str:
         """Get the scale name of the song.
@@ -607,7 +882,7 @@ class Song:
             Scale name (e.g., "Major", "Minor", "Dorian")
         """
         result = self._client.query("/live/song/get/scale_name")
-        return str(result[0])
+        return tail(result, 0, str, "")
 
     def set_scale_name(self, name: str) -> None:
         """Set the scale name of the song.
@@ -641,7 +916,7 @@ class Song:
             True if back-to-arranger is active (session changes pending)
         """
         result = self._client.query("/live/song/get/back_to_arranger")
-        return bool(result[0])
+        return tail(result, 0, bool, False)
 
     def set_back_to_arranger(self, enabled: bool) -> None:
         """Trigger back-to-arranger.
@@ -0,0 +1,137 @@
+"""Polling helper for integration tests.
+
+Fixed settle sleeps always pay their full duration even though most
+changes in Live land within a few milliseconds. wait_until() polls the
+relevant getter with exponential backoff instead, so each test waits
+only as long as the change actually takes.
+"""
+
+import queue
+import threading
+import time
+from contextlib import contextmanager
+
+
+def verify_set(client, get_address, setter, expected, timeout=0.5, tolerance=None):
+    """Apply a setter and wait for Live to confirm the value via a push.
+
+    Subscribes to the property before calling the setter, so the
+    assertion fires on Live's own confirmation - no readback query and
+    no settle sleep. The initial on-subscribe push may carry the old
+    value; only a push matching expected completes the wait.
+
+    Args:
+        client: The AbletonOSCClient to subscribe through
+        get_address: /get/ address of the property
+        setter: Zero-argument callable that performs the write
+        expected: Value the property must reach
+        timeout: Give-up point in seconds
+        tolerance: Accept values within this distance (floats)
+
+    Raises:
+        TimeoutError: If no matching push arrives within timeout
+    """
+    confirmed = threading.Event()
+
+    def on_push(value):
+        if tolerance is not None:
+            if abs(value - expected) <= tolerance:
+                confirmed.set()
+        elif value == expected:
+            confirmed.set()
+
+    subscription = client.subscribe(
+        get_address.replace("/get/", "/start_listen/"),
+        get_address,
+        on_push,
+        cast=type(expected),
+    )
+    try:
+        setter()
+        if not confirmed.wait(timeout):
+            raise TimeoutError(f"{get_address} never confirmed {expected!r}")
+    finally:
+        subscription.unsubscribe()
+
+
+def wait_until(fn, timeout=0.5, initial=0.005):
+    """Poll fn until it returns truthy.
+
+    Args:
+        fn: Zero-argument predicate, usually a lambda over a getter
+        timeout: Give-up point in seconds
+        initial: First poll delay in seconds; doubles up to 50 ms
+
+    Raises:
+        TimeoutError: If fn never returned truthy within timeout
+    """
+    deadline = time.monotonic() + timeout
+    delay = initial
+    while not fn():
+        if time.monotonic() >= deadline:
+            raise TimeoutError(f"Condition not met within {timeout}s")
+        time.sleep(delay)
+        delay = min(delay * 2, 0.05)
+
+
+@contextmanager
+def pushes(client, get_address, cast=None):
+    """Subscribe to a property and yield a queue of its pushed values.
+
+    A push-based alternative to polling: tests drain the queue instead
+    of re-querying the getter. The initial on-subscribe push (current
+    value) lands in the queue too; use wait_for_push() to skip past it.
+
+    Args:
+        client: The AbletonOSCClient to subscribe through
+        get_address: /get/ address of the property
+        cast: Type applied to each pushed value; without it, each
+            queue item is the push's full args tuple
+
+    Yields:
+        queue.Queue receiving each pushed value
+    """
+    q = queue.Queue()
+    if cast is not None:
+        callback = q.put
+    else:
+        # The varargs path calls callback(address, *args); queue just
+        # the args, and never hand q.put a stray positional argument
+        def callback(_address, *args):
+            q.put(args)
+
+    subscription = client.subscribe(
+        get_address.replace("/get/", "/start_listen/"),
+        get_address,
+        callback,
+        cast=cast,
+    )
+    try:
+        yield q
+    finally:
+        subscription.unsubscribe()
+
+
+def wait_for_push(q, expected, timeout=2.0):
+    """Drain pushes from q until expected arrives.
+
+    Args:
+        q: Queue from pushes()
+        expected: Value to wait for
+        timeout: Give-up point in seconds
+
+    Raises:
+        TimeoutError: If expected never arrives within timeout
+    """
+    deadline = time.monotonic() + timeout
+    while True:
+        remaining = deadline - time.monotonic()
+        if remaining <= 0:
+            raise TimeoutError(f"Push {expected!r} not received within {timeout}s")
+        try:
+            if q.get(timeout=remaining) == expected:
+                return
+        except queue.Empty:
+            raise TimeoutError(
+                f"Push {expected!r} not received within {timeout}s"
+            ) from None
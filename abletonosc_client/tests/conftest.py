@@ -4,11 +4,13 @@ These are integration tests that require a running Ableton Live instance
 with AbletonOSC enabled.
 """
 
+import os
 import time
 
 import pytest
 
 from abletonosc_client.client import AbletonOSCClient
+from abletonosc_client.tests._wait import wait_until
 
 
 # Global to track if we've already checked for Ableton
@@ -36,18 +38,56 @@ def _detect_wsl2_host() -> tuple[str, str | None]:
     return ("127.0.0.1", None)
 
 
+def _worker_backend() -> tuple[str, int, int] | None:
+    """Map this xdist worker to one of several Ableton backends.
+
+    ABLETON_OSC_URLS is a comma-separated list of backends, each
+    "host", "host:send_port" or "host:send_port:receive_port". Under
+    pytest-xdist each worker (gw0, gw1, ...) picks its own entry, so
+    test groups run against separate Live instances in parallel.
+    Returns None when the env var is unset (single-backend default).
+    """
+    urls = os.environ.get("ABLETON_OSC_URLS")
+    if not urls:
+        return None
+    entries = [u.strip() for u in urls.split(",") if u.strip()]
+    worker = os.environ.get("PYTEST_XDIST_WORKER", "gw0")
+    index = int(worker[2:]) if worker[2:].isdigit() else 0
+    parts = entries[index % len(entries)].split(":")
+    host = parts[0]
+    send_port = int(parts[1]) if len(parts) > 1 else 11000
+    receive_port = int(parts[2]) if len(parts) > 2 else 11001
+    return host, send_port, receive_port
+
+
 @pytest.fixture(scope="session")
 def client():
     """Provide a connected AbletonOSC client.
 
     Skips the test if Ableton is not running or AbletonOSC is not responding.
     Session-scoped to avoid port binding issues.
-    Auto-detects WSL2 and configures host accordingly.
+    Auto-detects WSL2 and configures host accordingly; under
+    pytest-xdist with ABLETON_OSC_URLS set, each worker connects to
+    its own backend (see _worker_backend).
+
+    The short cache TTL absorbs back-to-back duplicate getter reads
+    within a test (each saves one RTT) while writes still invalidate
+    immediately, and wait_until() polls see fresh values within one
+    TTL - unlike an unbounded memoizing proxy, which would serve stale
+    reads to a poll loop forever.
     """
     global _ableton_available
 
-    host, listen_host = _detect_wsl2_host()
-    c = AbletonOSCClient(host=host, listen_host=listen_host)
+    backend = _worker_backend()
+    if backend is not None:
+        host, send_port, receive_port = backend
+        c = AbletonOSCClient(
+            host=host, send_port=send_port, receive_port=receive_port,
+            cache_ttl=0.05,
+        )
+    else:
+        host, listen_host = _detect_wsl2_host()
+        c = AbletonOSCClient(host=host, listen_host=listen_host, cache_ttl=0.05)
     try:
         c.query("/live/test", timeout=1.0)
         _ableton_available = True
@@ -68,6 +108,38 @@ def song(client):
     return Song(client)
 
 
+# Mutable song properties covered by the module-level snapshot fixture.
+# All are valid batch_get/batch_set names (see Song._STATE_FIELDS).
+_SONG_SNAPSHOT_FIELDS = [
+    "tempo",
+    "signature_numerator",
+    "signature_denominator",
+    "metronome",
+    "record_mode",
+    "groove_amount",
+    "loop",
+    "loop_start",
+    "loop_length",
+]
+
+
+@pytest.fixture(scope="module")
+def song_snapshot(song):
+    """Snapshot mutable song properties once per module, restore at end.
+
+    Mutation tests that opt in via usefixtures can skip their own
+    save/restore dance - one batched read up front and one bundled
+    write at teardown replace two extra round trips per test.
+    """
+    values = song.batch_get(_SONG_SNAPSHOT_FIELDS)
+    yield
+    song.batch_set([
+        # bools go back as ints so the wire typetag stays ,i
+        (name, int(value) if isinstance(value, bool) else value)
+        for name, value in zip(_SONG_SNAPSHOT_FIELDS, values)
+    ])
+
+
 @pytest.fixture(scope="session")
 def track(client):
     """Provide a Track instance."""
@@ -132,6 +204,53 @@ def midimap(client):
     return MidiMap(client)
 
 
+@pytest.fixture(scope="session")
+def return_track(song):
+    """Create one return track for send tests, shared session-wide.
+
+    Creating and deleting the return track once instead of per test
+    drops two settle sleeps and two Live mutations from every test
+    that needs a send target. Yields the send index to use.
+    """
+    song.create_return_track()
+    time.sleep(0.2)  # No getter reflects the return-track count
+    yield 0
+    song.delete_return_track(0)
+
+
+@pytest.fixture(scope="session")
+def scratch_midi_track(song):
+    """Create one disposable MIDI track at the end of the set.
+
+    Shared by every test that mutates track state. Session scope means
+    each pytest-xdist worker creates its own, so workers never write to
+    the same track, and tests only make relative or self-contained
+    assertions - state accumulating across tests is fine because the
+    whole track goes away at teardown. Yields the track index.
+    """
+    index = song.get_num_tracks()
+    song.create_midi_track(-1)
+    wait_until(lambda: song.get_num_tracks() == index + 1, timeout=2.0)
+    yield index
+    song.delete_track(index)
+    wait_until(lambda: song.get_num_tracks() == index, timeout=2.0)
+
+
+@pytest.fixture(scope="session")
+def scratch_audio_track(song):
+    """Create one disposable audio track at the end of the set.
+
+    Same contract as scratch_midi_track, for audio-effect tests.
+    Yields the track index.
+    """
+    index = song.get_num_tracks()
+    song.create_audio_track(-1)
+    wait_until(lambda: song.get_num_tracks() == index + 1, timeout=2.0)
+    yield index
+    song.delete_track(index)
+    wait_until(lambda: song.get_num_tracks() == index, timeout=2.0)
+
+
 @pytest.fixture
 def test_clip_with_notes(client, song, clip_slot, clip):
     """Create a temporary MIDI track with an audible clip for testing.
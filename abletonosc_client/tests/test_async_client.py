@@ -0,0 +1,112 @@
+"""Tests for the asyncio AbletonOSC client.
+
+These run against a local loopback socket and do not require Ableton.
+"""
+
+import asyncio
+
+import pytest
+
+from abletonosc_client.async_client import AsyncAbletonOSCClient
+
+# Run this module's event loops under uvloop when it happens to be
+# installed. The loopback round-trips here are IO-bound, so a faster
+# loop shaves their wall time; uvloop is deliberately not a dependency
+# (python-osc stays the only one) and the default loop is fully
+# supported.
+try:
+    import uvloop
+    asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())
+except ImportError:
+    pass
+
+
+def test_query_loopback():
+    """Test that query() resolves when a response arrives."""
+
+    async def run():
+        # Send to our own receive port so the message loops back as the response
+        c = AsyncAbletonOSCClient(send_port=19994, receive_port=19994)
+        await c.start()
+        try:
+            result = await c.query("/test/echo", 42, "hello")
+            assert result == (42, "hello")
+        finally:
+            c.close()
+
+    asyncio.run(run())
+
+
+def test_query_timeout():
+    """Test that query() raises TimeoutError when nothing responds."""
+
+    async def run():
+        # Send to a port nothing is listening on
+        c = AsyncAbletonOSCClient(send_port=19993, receive_port=19992)
+        await c.start()
+        try:
+            with pytest.raises(TimeoutError):
+                await c.query("/test/nothing", timeout=0.3)
+        finally:
+            c.close()
+
+    asyncio.run(run())
+
+
+def test_gather_pipelines_queries():
+    """Test that independent queries can run concurrently."""
+
+    async def run():
+        c = AsyncAbletonOSCClient(send_port=19991, receive_port=19991)
+        await c.start()
+        try:
+            results = await asyncio.gather(
+                c.query("/test/a", 1),
+                c.query("/test/b", 2),
+                c.query("/test/c", 3),
+            )
+            assert results == [(1,), (2,), (3,)]
+        finally:
+            c.close()
+
+    asyncio.run(run())
+
+
+def test_listener_loopback():
+    """Test that registered listeners receive messages."""
+
+    async def run():
+        c = AsyncAbletonOSCClient(send_port=19990, receive_port=19990)
+        await c.start()
+        received = asyncio.get_running_loop().create_future()
+        c.start_listener(
+            "/test/listen", lambda addr, *args: received.set_result(args)
+        )
+        try:
+            c.send("/test/listen", 7)
+            assert await asyncio.wait_for(received, timeout=2.0) == (7,)
+        finally:
+            c.close()
+
+    asyncio.run(run())
+
+
+def test_query_many_same_address():
+    """Test that duplicate-address queries resolve in send order."""
+
+    async def run():
+        c = AsyncAbletonOSCClient(send_port=19969, receive_port=19969)
+        await c.start()
+        try:
+            results = await c.query_many(
+                [
+                    ("/live/song/get/tempo", (120.0,)),
+                    ("/live/song/get/num_tracks", (5,)),
+                    ("/live/song/get/tempo", (96.0,)),
+                ]
+            )
+            assert results == [(120.0,), (5,), (96.0,)]
+        finally:
+            c.close()
+
+    asyncio.run(run())
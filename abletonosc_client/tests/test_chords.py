@@ -41,6 +41,13 @@ class TestGetChord:
         chord = get_chord('D', 'sus4', 4)
         assert chord == [62, 67, 69]  # D G A
 
+    def test_result_is_a_fresh_list(self):
+        # get_chord memoizes internally, so mutating one result must
+        # not bleed into later calls with the same arguments
+        first = get_chord('C', 'major', 4)
+        first.append(99)
+        assert get_chord('C', 'major', 4) == [60, 64, 67]
+
     def test_invalid_chord_type(self):
         with pytest.raises(ValueError) as exc:
             get_chord('C', 'nonexistent')
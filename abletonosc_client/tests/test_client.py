@@ -22,6 +22,318 @@ def test_query_timeout_without_ableton():
         c.close()
 
 
+def test_bundle_send():
+    """Test that messages buffered in a bundle() block are delivered."""
+    import threading
+
+    from abletonosc_client.client import AbletonOSCClient
+
+    # Loop back to our own receive port so the bundle lands on this client
+    c = AbletonOSCClient(send_port=19996, receive_port=19996)
+    received = []
+    done = threading.Event()
+
+    def on_message(address, *args):
+        received.append((address, args))
+        if len(received) == 2:
+            done.set()
+
+    c.start_listener("/test/one", on_message)
+    c.start_listener("/test/two", on_message)
+    try:
+        with c.bundle():
+            c.send("/test/one", 1)
+            c.send("/test/two", "x")
+        assert done.wait(timeout=2.0), "Bundled messages not received"
+        assert ("/test/one", (1,)) in received
+        assert ("/test/two", ("x",)) in received
+    finally:
+        c.close()
+
+
+def test_send_raw():
+    """Test that pre-encoded messages are delivered, also inside bundles."""
+    import threading
+
+    from abletonosc_client.client import AbletonOSCClient, encode_message
+
+    c = AbletonOSCClient(send_port=19986, receive_port=19986)
+    received = []
+    done = threading.Event()
+
+    def on_message(address, *args):
+        received.append((address, args))
+        if len(received) == 2:
+            done.set()
+
+    c.start_listener("/test/raw", on_message)
+    try:
+        msg = encode_message("/test/raw", 7, "x")
+        c.send_raw(msg)
+        with c.bundle():
+            c.send_raw(msg)
+        assert done.wait(timeout=2.0), "Raw messages not received"
+        assert received == [("/test/raw", (7, "x"))] * 2
+    finally:
+        c.close()
+
+
+def test_stage_flush():
+    """Test that staged messages are delivered on flush()."""
+    import threading
+
+    from abletonosc_client.client import AbletonOSCClient
+
+    c = AbletonOSCClient(send_port=19987, receive_port=19987)
+    received = []
+    done = threading.Event()
+
+    def on_message(address, *args):
+        received.append((address, args))
+        if len(received) == 2:
+            done.set()
+
+    c.start_listener("/test/one", on_message)
+    c.start_listener("/test/two", on_message)
+    try:
+        c.stage("/test/one", 1)
+        c.stage("/test/two", "x")
+        assert not received  # Nothing on the wire until flush
+        c.flush()
+        assert done.wait(timeout=2.0), "Staged messages not received"
+        assert ("/test/one", (1,)) in received
+        assert ("/test/two", ("x",)) in received
+    finally:
+        c.close()
+
+
+def test_wrappers_share_one_client():
+    """Test that wrapper classes are facades over a single client."""
+    from abletonosc_client import Clip, ClipSlot, Device, Scene, Song, Track, View
+    from abletonosc_client.client import AbletonOSCClient
+
+    c = AbletonOSCClient(send_port=19988, receive_port=19988)
+    try:
+        for wrapper_cls in (Song, Track, Clip, ClipSlot, Device, Scene, View):
+            assert wrapper_cls(c)._client is c
+
+        # The lazy wrapper properties cache one instance per client
+        assert c.song is c.song
+        assert isinstance(c.song, Song)
+        assert c.song._client is c
+        assert c.track is c.track
+        assert c.clip is c.clip
+        assert c.clip_slot is c.clip_slot
+        assert c.scene is c.scene
+    finally:
+        c.close()
+
+
+def test_wait_until():
+    """Test ack-based waiting against the loopback echo."""
+    import pytest
+
+    from abletonosc_client.client import AbletonOSCClient
+
+    c = AbletonOSCClient(send_port=19989, receive_port=19989)
+    try:
+        # Loopback echoes our args, so the predicate holds immediately
+        result = c.wait_until(
+            "/live/song/get/num_tracks", 5, predicate=lambda r: int(r[0]) == 5
+        )
+        assert result == (5,)
+
+        # A predicate that never holds should time out
+        with pytest.raises(TimeoutError):
+            c.wait_until(
+                "/live/song/get/num_tracks",
+                5,
+                predicate=lambda r: False,
+                timeout=0.2,
+            )
+    finally:
+        c.close()
+
+
+def test_fast_encoder_matches_builder():
+    """Test that the fast encoder emits builder-identical bytes."""
+    from abletonosc_client.client import _build_message, _encode_fast
+
+    cases = [
+        ("/live/song/set/tempo", (120.0,)),
+        ("/live/clip/set/name", (0, 1, "Drums")),
+        ("/live/test", ()),
+        ("/live/song/get/track_names", (0, 5)),
+    ]
+    for address, args in cases:
+        assert _encode_fast(address, args) == _build_message(address, args).dgram
+
+    # Outside the fast set: caller falls back to the builder
+    assert _encode_fast("/x", (True,)) is None
+    assert _encode_fast("/x", (2**40,)) is None
+
+
+def test_fixed_shape_templates():
+    """Test that template-packed fire messages decode correctly."""
+    import threading
+
+    from abletonosc_client import ClipSlot, Scene
+    from abletonosc_client.client import AbletonOSCClient
+
+    c = AbletonOSCClient(send_port=19979, receive_port=19979)
+    received = []
+    done = threading.Event()
+
+    def on_message(address, *args):
+        received.append((address, args))
+        if len(received) == 2:
+            done.set()
+
+    c.start_listener("/live/scene/fire", on_message)
+    c.start_listener("/live/clip_slot/fire", on_message)
+    try:
+        Scene(c).fire(3)
+        ClipSlot(c).fire(1, 2)
+        assert done.wait(timeout=2.0), "Template messages not received"
+        assert ("/live/scene/fire", (3,)) in received
+        assert ("/live/clip_slot/fire", (1, 2)) in received
+    finally:
+        c.close()
+
+
+def test_query_many():
+    """Test pipelined queries against the loopback echo."""
+    from abletonosc_client.client import AbletonOSCClient
+
+    c = AbletonOSCClient(send_port=19983, receive_port=19983)
+    try:
+        # The whole batch goes out in one burst; the duplicate address
+        # resolves FIFO and still lands in order
+        results = c.query_many(
+            [
+                ("/live/song/get/tempo", (120.0,)),
+                ("/live/song/get/num_tracks", (5,)),
+                ("/live/song/get/tempo", (96.0,)),
+            ]
+        )
+        assert results == [(120.0,), (5,), (96.0,)]
+    finally:
+        c.close()
+
+
+def test_query_scalar():
+    """Test raw-buffer scalar extraction against the loopback echo."""
+    from abletonosc_client.client import AbletonOSCClient, encode_message
+
+    c = AbletonOSCClient(send_port=19977, receive_port=19977)
+    try:
+        # Loopback echoes our own datagram back as the "response"
+        raw = c.query_raw("/live/song/get/tempo", 120.0)
+        assert isinstance(raw, memoryview)
+        assert bytes(raw) == encode_message("/live/song/get/tempo", 120.0)
+
+        assert c.query_scalar("/live/song/get/tempo", 120.0, index=0) == 120.0
+        assert c.query_scalar(
+            "/live/clip/get/length", 0, 7, index=-1, cast=int
+        ) == 7
+        # A string before the wanted position forces the parsed path
+        assert c.query_scalar(
+            "/live/clip/get/name", "x", 5, index=1, cast=int
+        ) == 5
+        # Out-of-range positions fall back to the default
+        assert c.query_scalar("/live/song/get/tempo", 1, index=5, default=-1) == -1
+    finally:
+        c.close()
+
+
+def test_query_raw_concurrent_same_address():
+    """Test that concurrent raw queries to one address all resolve."""
+    import threading
+
+    from abletonosc_client.client import AbletonOSCClient
+
+    c = AbletonOSCClient(send_port=19953, receive_port=19953)
+    results = []
+    errors = []
+
+    def worker(value):
+        try:
+            results.append(
+                c.query_scalar("/live/clip/get/length", value, cast=int)
+            )
+        except Exception as e:  # pragma: no cover - failure detail
+            errors.append(e)
+
+    try:
+        threads = [
+            threading.Thread(target=worker, args=(v,)) for v in (1, 2, 3)
+        ]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+
+        # FIFO waiters hand each echoed response to exactly one query;
+        # the old single-slot capture dropped all but the last waiter
+        assert not errors, errors
+        assert sorted(results) == [1, 2, 3]
+    finally:
+        c.close()
+
+
+def test_tail_skips_redundant_cast():
+    """Test that tail() passes already-typed values through untouched."""
+    from abletonosc_client.client import tail
+
+    # pythonosc decodes per the typetag, so a float response needs no
+    # float() call - the exact object comes back
+    value = 120.5
+    assert tail((0, 1, value), -1, float, 0.0) is value
+
+    # Real boundaries still coerce: int 1 from the wire -> bool
+    assert tail((1,), 0, bool, False) is True
+    assert tail((0, "Drums"), 1, str, "") == "Drums"
+
+    # Missing / None positions fall back to the default
+    assert tail((), 0, float, -1.0) == -1.0
+    assert tail((None,), 0, int, 7) == 7
+
+
+def test_query_cache():
+    """Test that cached queries skip the wire and writes invalidate."""
+    import threading
+
+    from abletonosc_client.client import AbletonOSCClient
+
+    # Loop back to our own receive port; count how often the getter
+    # actually hits the wire
+    c = AbletonOSCClient(send_port=19995, receive_port=19995, cache=True)
+    wire_hits = []
+    arrived = threading.Event()
+
+    def on_message(address, *args):
+        wire_hits.append(args)
+        arrived.set()
+
+    c.start_listener("/live/song/get/tempo", on_message)
+    try:
+        assert c.query("/live/song/get/tempo", 120.0) == (120.0,)
+        arrived.wait(timeout=2.0)
+
+        # Second identical query is served from cache - no new packet
+        assert c.query("/live/song/get/tempo", 120.0) == (120.0,)
+        assert len(wire_hits) == 1
+
+        # A write to the same property invalidates the cached entry
+        arrived.clear()
+        c.send("/live/song/set/tempo", 130.0)
+        assert c.query("/live/song/get/tempo", 120.0) == (120.0,)
+        arrived.wait(timeout=2.0)
+        assert len(wire_hits) == 2
+    finally:
+        c.close()
+
+
 def test_application_test(application):
     """Test that Application.test() returns True."""
     assert application.test() is True
@@ -32,3 +344,167 @@ def test_application_get_version(application):
     version = application.get_version()
     assert version  # Non-empty string
     assert isinstance(version, str)
+
+
+def test_query_cache_ttl():
+    """Test that TTL-stamped cache entries expire and re-query."""
+    import threading
+    import time
+
+    from abletonosc_client.client import AbletonOSCClient
+
+    # cache_ttl implies caching; count actual wire hits via loopback
+    c = AbletonOSCClient(send_port=19971, receive_port=19971, cache_ttl=0.2)
+    wire_hits = []
+    arrived = threading.Event()
+
+    def on_message(address, *args):
+        wire_hits.append(args)
+        arrived.set()
+
+    c.start_listener("/live/song/get/tempo", on_message)
+    try:
+        assert c.query("/live/song/get/tempo", 120.0) == (120.0,)
+        arrived.wait(timeout=2.0)
+
+        # Within the TTL: served from cache, no new packet
+        assert c.query("/live/song/get/tempo", 120.0) == (120.0,)
+        assert len(wire_hits) == 1
+
+        # Past the TTL: the entry is a miss and the query re-fires
+        time.sleep(0.25)
+        arrived.clear()
+        assert c.query("/live/song/get/tempo", 120.0) == (120.0,)
+        arrived.wait(timeout=2.0)
+        assert len(wire_hits) == 2
+    finally:
+        c.close()
+
+
+def test_context_manager_closes():
+    """Test that the client works as a context manager."""
+    from abletonosc_client.client import AbletonOSCClient
+
+    with AbletonOSCClient(send_port=19970, receive_port=19970) as c:
+        assert c.query("/live/song/get/num_tracks", 5) == (5,)
+    # The shared socket is released on exit
+    assert c._server.socket.fileno() == -1
+
+
+def test_burst_dispatch_in_order():
+    """Test that a burst of datagrams dispatches completely and in order."""
+    import threading
+
+    from abletonosc_client.client import AbletonOSCClient
+
+    c = AbletonOSCClient(send_port=19965, receive_port=19965)
+    received = []
+    done = threading.Event()
+
+    def on_message(address, *args):
+        received.append(args[0])
+        if len(received) == 50:
+            done.set()
+
+    c.start_listener("/test/burst", on_message)
+    try:
+        # Flood the receive socket; the queued single-worker dispatch
+        # must deliver every message in arrival order
+        for i in range(50):
+            c.send("/test/burst", i)
+        assert done.wait(timeout=5.0), f"Only {len(received)}/50 dispatched"
+        assert received == list(range(50))
+    finally:
+        c.close()
+
+
+def test_concurrent_same_address_queries():
+    """Test that threads querying one address don't collide or time out."""
+    import threading
+
+    from abletonosc_client.client import AbletonOSCClient
+
+    c = AbletonOSCClient(send_port=19962, receive_port=19962)
+    results = []
+    errors = []
+
+    def worker(value):
+        try:
+            results.append(c.query("/live/song/get/tempo", value, timeout=2.0))
+        except Exception as exc:  # pragma: no cover - failure path
+            errors.append(exc)
+
+    try:
+        threads = [threading.Thread(target=worker, args=(i,)) for i in range(8)]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+        # Every waiter got exactly one echoed response - none lost to
+        # a shared per-address slot, none timed out
+        assert not errors
+        assert sorted(results) == [(i,) for i in range(8)]
+    finally:
+        c.close()
+
+
+def test_pipeline_offline():
+    """Test that a pipeline bursts sends and collects replies in order."""
+    from abletonosc_client.client import AbletonOSCClient
+
+    c = AbletonOSCClient(send_port=19956, receive_port=19956)
+    try:
+        # Loopback echoes queries; sends produce no reply
+        with c.pipeline() as p:
+            p.send("/live/track/set/volume", 0, 0.5)
+            p.query("/live/track/get/volume", 0, 1)
+            p.send("/live/track/set/volume", 0, 0.85)
+            p.query("/live/track/get/volume", 0, 2)
+
+        assert p.results == [(0, 1), (0, 2)]
+    finally:
+        c.close()
+
+
+def test_subscribe_unsubscribe():
+    """Test that subscribe() pairs registration with the listen send."""
+    import threading
+
+    from abletonosc_client.client import AbletonOSCClient
+
+    c = AbletonOSCClient(send_port=19961, receive_port=19961)
+    seen = []
+    listens = []
+    got = threading.Event()
+    listened = threading.Event()
+
+    def on_listen(address, *args):
+        listens.append(address)
+        listened.set()
+
+    c.start_listener("/live/song/start_listen/tempo", on_listen)
+    c.start_listener("/live/song/stop_listen/tempo", on_listen)
+    try:
+        sub = c.subscribe(
+            "/live/song/start_listen/tempo",
+            "/live/song/get/tempo",
+            lambda value: (seen.append(value), got.set()),
+            cast=float,
+        )
+        assert listened.wait(timeout=2.0), "start_listen never sent"
+
+        # Loopback stands in for Live's push
+        c.send("/live/song/get/tempo", 132)
+        assert got.wait(timeout=2.0), "Push not dispatched"
+        assert seen == [132.0]
+
+        listened.clear()
+        sub.unsubscribe()
+        assert listened.wait(timeout=2.0), "stop_listen never sent"
+        sub.unsubscribe()  # Idempotent
+        assert listens == [
+            "/live/song/start_listen/tempo",
+            "/live/song/stop_listen/tempo",
+        ]
+    finally:
+        c.close()
@@ -81,14 +81,205 @@ def test_get_loop_end(clip, test_clip_with_notes):
 def test_get_notes(clip, test_clip_with_notes):
     """Test getting notes from a clip."""
     t, s = test_clip_with_notes["track"], test_clip_with_notes["scene"]
-    notes = clip.get_notes(t, s)
-    assert len(notes) == 3  # C major chord (C, E, G)
-    pitches = [n.pitch for n in notes]
+    # One bulk query; the pitch column comes back directly, with no
+    # per-note Note objects to build and walk
+    pitches = clip.get_notes_columns(t, s)[0]
+    assert len(pitches) == 3  # C major chord (C, E, G)
     assert 60 in pitches  # C4
     assert 64 in pitches  # E4
     assert 67 in pitches  # G4
 
 
+def test_add_notes_columns(clip, test_clip_with_notes):
+    """Test adding notes from parallel columns."""
+    t, s = test_clip_with_notes["track"], test_clip_with_notes["scene"]
+    clip.add_notes_columns(
+        t, s, [48, 50], [2.0, 2.5], [0.5, 0.5], [90, 90]
+    )
+    pitches = clip.get_notes_columns(t, s)[0]
+    assert 48 in pitches
+    assert 50 in pitches
+
+
+def test_add_notes_batch_offline():
+    """Test that a note batch lands as one bundle, per-clip messages intact."""
+    from abletonosc_client.client import AbletonOSCClient
+    from abletonosc_client.clip import Clip
+    from abletonosc_client.tests._wait import wait_until
+
+    received = []
+    c = AbletonOSCClient(send_port=19955, receive_port=19955)
+    c.start_listener(
+        "/live/clip/add/notes", lambda addr, *args: received.append(args)
+    )
+    try:
+        clip = Clip(c)
+        clip.add_notes_batch([
+            (0, 0, [Note(60, 0.0, 1.0, 100)]),
+            (1, 0, [Note(62, 0.0, 1.0, 90)]),
+        ])
+        # The dispatcher unpacks the single bundle into both messages
+        wait_until(lambda: len(received) == 2, timeout=2.0)
+        assert received[0][:2] == (0, 0) and received[0][2] == 60
+        assert received[1][:2] == (1, 0) and received[1][2] == 62
+    finally:
+        c.close()
+
+
+def test_fire_many_offline():
+    """Test that fire_many lands all fires as one bundled datagram."""
+    from abletonosc_client.client import AbletonOSCClient
+    from abletonosc_client.clip import Clip
+    from abletonosc_client.tests._wait import wait_until
+
+    received = []
+    c = AbletonOSCClient(send_port=19954, receive_port=19954)
+    c.start_listener("/live/clip/fire", lambda addr, *args: received.append(args))
+    try:
+        Clip(c).fire_many([(0, 0), (1, 0), (2, 0)])
+        wait_until(lambda: len(received) == 3, timeout=2.0)
+        assert received == [(0, 0), (1, 0), (2, 0)]
+    finally:
+        c.close()
+
+
+def test_add_pattern(clip, test_clip_with_notes):
+    """Test adding a periodic pattern with alternating velocities."""
+    t, s = test_clip_with_notes["track"], test_clip_with_notes["scene"]
+    clip.add_pattern(t, s, 42, 0.0, 0.5, 4, 0.25, 80, 60)
+    notes = [n for n in clip.get_notes(t, s) if n.pitch == 42]
+    assert len(notes) == 4
+    assert sorted(n.start_time for n in notes) == [0.0, 0.5, 1.0, 1.5]
+    assert sorted(n.velocity for n in notes) == [60, 60, 80, 80]
+
+
+def test_configure_bundles_setters():
+    """Test that configure() sends all fields as one bundle (offline)."""
+    import threading
+
+    import pytest
+
+    from abletonosc_client import Clip
+    from abletonosc_client.client import AbletonOSCClient
+
+    c = AbletonOSCClient(send_port=19980, receive_port=19980)
+    received = []
+    done = threading.Event()
+
+    def on_message(address, *args):
+        received.append((address, args))
+        if len(received) == 2:
+            done.set()
+
+    c.start_listener("/live/clip/set/looping", on_message)
+    c.start_listener("/live/clip/set/loop_end", on_message)
+    try:
+        clip = Clip(c)
+        clip.configure(0, 0, looping=True, loop_end=8.0)
+        assert done.wait(timeout=2.0), "Configured fields not received"
+        assert ("/live/clip/set/looping", (0, 0, 1)) in received
+        assert ("/live/clip/set/loop_end", (0, 0, 8.0)) in received
+
+        with pytest.raises(ValueError):
+            clip.configure(0, 0, nonsense=1)
+    finally:
+        c.close()
+
+
+def test_add_notes_encoding():
+    """Test the hand-packed add_notes datagram round-trips (offline)."""
+    import threading
+
+    from abletonosc_client import Clip
+    from abletonosc_client.client import AbletonOSCClient
+    from abletonosc_client.clip import Note
+
+    c = AbletonOSCClient(send_port=19981, receive_port=19981)
+    received = []
+    done = threading.Event()
+
+    def on_message(address, *args):
+        received.append(args)
+        done.set()
+
+    c.start_listener("/live/clip/add/notes", on_message)
+    try:
+        Clip(c).add_notes(
+            1, 2, [Note(60, 0.0, 1.0, 100), Note(62, 1.5, 0.5, 90, True)]
+        )
+        assert done.wait(timeout=2.0), "Encoded message not received"
+        assert received[0] == (1, 2, 60, 0.0, 1.0, 100, 0, 62, 1.5, 0.5, 90, 1)
+    finally:
+        c.close()
+
+
+def test_get_notes_columns_parsing():
+    """Test the column parsing of the notes response (offline)."""
+    from abletonosc_client import Clip
+    from abletonosc_client.client import AbletonOSCClient
+    from abletonosc_client.clip import Note
+
+    c = AbletonOSCClient(send_port=19985, receive_port=19985, cache=True)
+    try:
+        # Serve a canned response from the cache so no Ableton is needed
+        c.prime_cache(
+            "/live/clip/get/notes",
+            (0, 0),
+            (0, 0, 60, 0.0, 1.0, 100, 0, 62, 1.0, 0.5, 90, 1),
+        )
+        clip = Clip(c)
+        assert clip.get_notes_columns(0, 0) == (
+            (60, 62),
+            (0.0, 1.0),
+            (1.0, 0.5),
+            (100, 90),
+            (False, True),
+        )
+        assert clip.get_notes(0, 0) == [
+            Note(60, 0.0, 1.0, 100, False),
+            Note(62, 1.0, 0.5, 90, True),
+        ]
+
+        # Lazy sequence materializes the same rows on demand
+        seq = clip.get_note_sequence(0, 0)
+        assert len(seq) == 2
+        assert seq[1] == Note(62, 1.0, 0.5, 90, True)
+        assert list(seq) == clip.get_notes(0, 0)
+    finally:
+        c.close()
+
+
+def test_remove_pitches_coalesces_runs():
+    """Test that the pitch bitmap collapses into run messages (offline)."""
+    import threading
+
+    from abletonosc_client import Clip
+    from abletonosc_client.client import AbletonOSCClient
+
+    c = AbletonOSCClient(send_port=19978, receive_port=19978)
+    received = []
+    done = threading.Event()
+
+    def on_message(address, *args):
+        received.append(args)
+        if len(received) == 3:
+            done.set()
+
+    c.start_listener("/live/clip/remove/notes", on_message)
+    try:
+        # Pitches 1-3 form one run; 60 and 62 are isolated
+        Clip(c).remove_pitches(0, 0, 0b1110 | (1 << 60) | (1 << 62))
+        assert done.wait(timeout=2.0), "Remove messages not received"
+        # Each message carries (pitch_start, pitch_span) at indices 3 and 5
+        assert sorted((args[3], args[5]) for args in received) == [
+            (1, 3),
+            (60, 1),
+            (62, 1),
+        ]
+    finally:
+        c.close()
+
+
 def test_is_midi_clip(clip, test_clip_with_notes):
     """Test checking if clip is a MIDI clip."""
     t, s = test_clip_with_notes["track"], test_clip_with_notes["scene"]
@@ -263,3 +454,99 @@ def test_get_has_groove(clip, test_clip_with_notes):
     t, s = test_clip_with_notes["track"], test_clip_with_notes["scene"]
     has_groove = clip.get_has_groove(t, s)
     assert isinstance(has_groove, bool)
+
+
+def test_watch_notes_offline():
+    """Test that pushed note lists feed the cache and callback."""
+    import threading
+    import time
+
+    from abletonosc_client import Clip
+    from abletonosc_client.client import AbletonOSCClient
+    from abletonosc_client.clip import Note
+
+    c = AbletonOSCClient(send_port=19974, receive_port=19974)
+    pushed = []
+    done = threading.Event()
+
+    def on_notes(track_index, clip_index, notes):
+        pushed.append((track_index, clip_index, list(notes)))
+        done.set()
+
+    try:
+        clip = Clip(c)
+        clip.watch_notes(0, 1, on_notes)
+
+        # Loopback stands in for Live's push after start_listen
+        c.send("/live/clip/get/notes", 0, 1, 60, 0.0, 1.0, 100, 0)
+        assert done.wait(timeout=2.0), "Note push not dispatched"
+        assert pushed == [(0, 1, [Note(60, 0.0, 1.0, 100, False)])]
+
+        deadline = time.monotonic() + 2.0
+        while clip.get_notes_cached(0, 1) is None:
+            assert time.monotonic() < deadline, "Push never landed in store"
+            time.sleep(0.01)
+        cached = clip.get_notes_cached(0, 1)
+        assert list(cached) == [Note(60, 0.0, 1.0, 100, False)]
+
+        clip.unwatch_notes(0, 1)
+        assert clip.get_notes_cached(0, 1) is None
+    finally:
+        c.close()
+
+
+def test_add_notes_columns_encoding_matches_rows():
+    """Test that column-fed encoding produces row-identical bytes."""
+    import array
+
+    from abletonosc_client.clip import _encode_add_notes
+
+    rows = [(60, 0.0, 1.0, 100, 0), (62, 1.5, 0.5, 90, 1)]
+    columns = (
+        array.array("i", [60, 62]),
+        array.array("f", [0.0, 1.5]),
+        array.array("f", [1.0, 0.5]),
+        array.array("i", [100, 90]),
+        array.array("i", [0, 1]),
+    )
+    assert _encode_add_notes(1, 2, zip(*columns), n=2) == _encode_add_notes(
+        1, 2, rows
+    )
+
+
+def test_get_notes_array_and_transforms():
+    """Test typed-array note columns and bulk transforms (offline)."""
+    from array import array
+
+    from abletonosc_client import Clip
+    from abletonosc_client.client import AbletonOSCClient
+
+    c = AbletonOSCClient(send_port=19964, receive_port=19964, cache=True)
+    try:
+        c.prime_cache(
+            "/live/clip/get/notes",
+            (0, 0),
+            (0, 0, 60, 0.0, 1.0, 100, 0, 62, 1.0, 0.5, 90, 1),
+        )
+        notes = Clip(c).get_notes_array(0, 0)
+        assert len(notes) == 2
+        assert isinstance(notes.pitches, array)
+        assert notes.pitches.typecode == "b"
+        assert tuple(notes.pitches) == (60, 62)
+        assert tuple(notes.velocities) == (100, 90)
+
+        up = notes.transposed(12)
+        assert tuple(up.pitches) == (72, 74)
+        assert up.pitches.typecode == "b"  # Storage type preserved
+        assert up.start_times is notes.start_times  # Untouched columns shared
+
+        # Out-of-range shifts clamp to MIDI bounds instead of
+        # overflowing the signed-byte column
+        assert tuple(notes.transposed(70).pitches) == (127, 127)
+        assert tuple(notes.transposed(-70).pitches) == (0, 0)
+
+        quiet = notes.scaled_velocities(0.5)
+        assert tuple(quiet.velocities) == (50, 45)
+        assert quiet.pitches is notes.pitches
+    finally:
+        c.close()
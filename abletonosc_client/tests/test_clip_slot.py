@@ -85,3 +85,37 @@ def test_set_has_stop_button(clip_slot):
         assert clip_slot.get_has_stop_button(0, 0) is True
     finally:
         clip_slot.set_has_stop_button(0, 0, original)
+
+
+def test_watch_serves_polled_state_offline():
+    """Test that pushed state answers polled getters without queries."""
+    import time
+
+    from abletonosc_client import ClipSlot
+    from abletonosc_client.client import AbletonOSCClient
+
+    c = AbletonOSCClient(send_port=19976, receive_port=19976)
+    try:
+        slot = ClipSlot(c)
+        c.watch("/live/clip_slot/get/is_playing", 0, 1)
+
+        # Loopback stands in for Live's push after start_listen
+        c.send("/live/clip_slot/get/is_playing", 0, 1, 1)
+        deadline = time.monotonic() + 2.0
+        while c.peek("/live/clip_slot/get/is_playing", 0, 1) is None:
+            assert time.monotonic() < deadline, "Push never landed"
+            time.sleep(0.01)
+
+        assert c.peek("/live/clip_slot/get/is_playing", 0, 1) == (0, 1, 1)
+        assert c.query_fresh("/live/clip_slot/get/is_playing", 0, 1) == (0, 1, 1)
+        assert slot.get_is_playing(0, 1) is True
+
+        # An expired entry is a miss; unwatched keys always are
+        time.sleep(0.02)
+        assert c.peek("/live/clip_slot/get/is_playing", 0, 1, max_age=0.001) is None
+        assert c.peek("/live/clip_slot/get/is_playing", 5, 5) is None
+
+        c.unwatch("/live/clip_slot/get/is_playing", 0, 1)
+        assert c.peek("/live/clip_slot/get/is_playing", 0, 1) is None
+    finally:
+        c.close()
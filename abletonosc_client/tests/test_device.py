@@ -98,6 +98,87 @@ def test_get_type(device, device_exists):
     assert 0 <= device_type <= 2
 
 
+def test_get_parameters_offline():
+    """Test assembling the parameter table from bulk responses (offline)."""
+    from abletonosc_client import Device
+    from abletonosc_client.client import AbletonOSCClient
+    from abletonosc_client.device import Parameter
+
+    c = AbletonOSCClient(send_port=19984, receive_port=19984, cache=True)
+    try:
+        # Serve canned bulk responses from the cache so no Ableton is needed
+        c.prime_cache(
+            "/live/device/get/parameters/name", (0, 0), (0, 0, "Volume", "Pan")
+        )
+        c.prime_cache(
+            "/live/device/get/parameters/value", (0, 0), (0, 0, 0.5, 0.0)
+        )
+        c.prime_cache(
+            "/live/device/get/parameters/min", (0, 0), (0, 0, 0.0, -1.0)
+        )
+        c.prime_cache(
+            "/live/device/get/parameters/max", (0, 0), (0, 0, 1.0, 1.0)
+        )
+        assert Device(c).get_parameters(0, 0) == [
+            Parameter(index=0, name="Volume", value=0.5, min=0.0, max=1.0),
+            Parameter(index=1, name="Pan", value=0.0, min=-1.0, max=1.0),
+        ]
+    finally:
+        c.close()
+
+
+def test_parameter_table():
+    """Test the column-wise ParameterTable (offline)."""
+    from abletonosc_client.device import Parameter, ParameterTable
+
+    table = ParameterTable(
+        names=("Volume", "Pan"),
+        values=(0.5, 0.0),
+        mins=(0.0, -1.0),
+        maxs=(1.0, 1.0),
+    )
+    assert len(table) == 2
+    assert table[1] == Parameter(index=1, name="Pan", value=0.0, min=-1.0, max=1.0)
+    assert table.normalized_values() == (0.5, 0.5)
+    assert table.changed_mask((0.5, 0.25)) == (False, True)
+    assert table.to_dict() == {"Volume": 0.5, "Pan": 0.0}
+
+
+def test_metadata_memoized_offline():
+    """Test that immutable metadata is memoized until invalidate()."""
+    from abletonosc_client import Device
+    from abletonosc_client.client import AbletonOSCClient
+
+    c = AbletonOSCClient(send_port=19982, receive_port=19982, cache=True)
+    try:
+        c.prime_cache(
+            "/live/device/get/parameter/name", (0, 0, 0), (0, 0, 0, "Volume")
+        )
+        d = Device(c)
+        assert d.get_parameter_name(0, 0, 0) == "Volume"
+
+        # Second call is served by the Device memo even after the
+        # client-level cache is gone
+        c.prime_cache("/live/device/get/parameter/name", (0, 0, 0), ())
+        assert d.get_parameter_name(0, 0, 0) == "Volume"
+
+        # Selective purge keeps other devices' entries
+        d._meta_cache[("name", 1, 0)] = "Other"
+        d.invalidate(track_index=0)
+        assert ("param_name", 0, 0, 0) not in d._meta_cache
+        assert ("name", 1, 0) in d._meta_cache
+
+        # device_index alone filters that device slot on every track
+        d._meta_cache[("name", 2, 1)] = "Kept"
+        d.invalidate(device_index=0)
+        assert ("name", 1, 0) not in d._meta_cache
+        assert ("name", 2, 1) in d._meta_cache
+        d.invalidate()
+        assert not d._meta_cache
+    finally:
+        c.close()
+
+
 def test_get_parameters_names(device, device_exists):
     """Test getting all parameter names in bulk."""
     names = device.get_parameters_names(0, 0)
@@ -136,3 +217,37 @@ def test_get_parameter_value_string(device, device_exists):
 
     value_string = device.get_parameter_value_string(0, 0, 0)
     assert isinstance(value_string, str)
+
+
+def test_get_parameters_bulk_offline():
+    """Test the batched multi-device parameter scan."""
+    from abletonosc_client import Device
+    from abletonosc_client.client import AbletonOSCClient
+    from abletonosc_client.device import Parameter
+
+    c = AbletonOSCClient(send_port=19973, receive_port=19973, cache=True)
+    try:
+        canned = {
+            "name": ("Freq", "Res"),
+            "value": (440.0, 0.5),
+            "min": (20.0, 0.0),
+            "max": (20000.0, 1.0),
+        }
+        for device_index in (0, 1):
+            for prop, values in canned.items():
+                c.prime_cache(
+                    f"/live/device/get/parameters/{prop}",
+                    (0, device_index),
+                    (0, device_index) + values,
+                )
+
+        device = Device(c)
+        tables = device.get_parameters_bulk(0, [0, 1])
+        assert set(tables) == {0, 1}
+        assert tables[1][0] == Parameter(0, "Freq", 440.0, 20.0, 20000.0)
+        assert tables[1][1] == Parameter(1, "Res", 0.5, 0.0, 1.0)
+
+        # The scan also fills the metadata memo for per-device calls
+        assert device.get_parameters_names(0, 0) == ("Freq", "Res")
+    finally:
+        c.close()
@@ -1,8 +1,6 @@
 """Tests for Scene operations."""
 
-import time
-
-SETTLE_TIME = 0.1  # Time for Ableton to process changes
+from abletonosc_client.tests._wait import wait_until
 
 
 def test_get_name(scene):
@@ -16,8 +14,7 @@ def test_set_name(scene):
     original = scene.get_name(0)
     try:
         scene.set_name(0, "Test Scene")
-        time.sleep(SETTLE_TIME)
-        assert scene.get_name(0) == "Test Scene"
+        wait_until(lambda: scene.get_name(0) == "Test Scene")
     finally:
         scene.set_name(0, original)
 
@@ -74,3 +71,37 @@ def test_get_time_signature_enabled(scene):
     """Test getting scene time signature enabled state."""
     enabled = scene.get_time_signature_enabled(0)
     assert isinstance(enabled, bool)
+
+
+def test_generated_properties_offline():
+    """Test the osc_properties-generated accessors end to end."""
+    import threading
+
+    from abletonosc_client import Scene
+    from abletonosc_client.client import AbletonOSCClient
+
+    c = AbletonOSCClient(send_port=19975, receive_port=19975, cache=True)
+    received = []
+    done = threading.Event()
+
+    def on_message(address, *args):
+        received.append((address, args))
+        done.set()
+
+    c.start_listener("/live/scene/set/tempo_enabled", on_message)
+    try:
+        scene = Scene(c)
+        # Generated methods carry real names and docstrings
+        assert Scene.get_color_index.__name__ == "get_color_index"
+        assert "color_index" in Scene.get_color_index.__doc__
+
+        # Generated getter reads through the normal query path
+        c.prime_cache("/live/scene/get/color_index", (3,), (3, 12))
+        assert scene.get_color_index(3) == 12
+
+        # Generated setter casts bools to wire ints
+        scene.set_tempo_enabled(2, True)
+        assert done.wait(timeout=2.0), "Setter message not received"
+        assert received == [("/live/scene/set/tempo_enabled", (2, 1))]
+    finally:
+        c.close()
@@ -3,7 +3,16 @@
 import threading
 import time
 
-SETTLE_TIME = 0.1  # Time for Ableton to process changes
+import pytest
+
+from abletonosc_client.tests._wait import (
+    pushes,
+    verify_set,
+    wait_for_push,
+    wait_until,
+)
+
+SETTLE_TIME = 0.1  # Settle for actions with no getter to poll
 
 
 def test_get_tempo(song):
@@ -12,17 +21,13 @@ def test_get_tempo(song):
     assert 20 <= tempo <= 999  # Valid BPM range
 
 
+@pytest.mark.xdist_group("transport")
+@pytest.mark.usefixtures("song_snapshot")
 def test_set_tempo(song):
-    """Test setting tempo."""
-    original = song.get_tempo()
-    try:
-        song.set_tempo(120.0)
-        assert song.get_tempo() == 120.0
-
-        song.set_tempo(140.5)
-        assert song.get_tempo() == 140.5
-    finally:
-        song.set_tempo(original)  # Restore
+    """Test setting tempo, verified by Live's own push."""
+    c = song._client
+    verify_set(c, "/live/song/get/tempo", lambda: song.set_tempo(120.0), 120.0)
+    verify_set(c, "/live/song/get/tempo", lambda: song.set_tempo(140.5), 140.5)
 
 
 def test_get_is_playing(song):
@@ -31,21 +36,19 @@ def test_get_is_playing(song):
     assert isinstance(is_playing, bool)
 
 
+@pytest.mark.xdist_group("transport")
 def test_start_stop_playing(song):
     """Test transport controls."""
     original_playing = song.get_is_playing()
     try:
         song.stop_playing()
-        time.sleep(SETTLE_TIME)
-        assert song.get_is_playing() is False
+        wait_until(lambda: song.get_is_playing() is False)
 
         song.start_playing()
-        time.sleep(SETTLE_TIME)
-        assert song.get_is_playing() is True
+        wait_until(lambda: song.get_is_playing() is True)
 
         song.stop_playing()
-        time.sleep(SETTLE_TIME)
-        assert song.get_is_playing() is False
+        wait_until(lambda: song.get_is_playing() is False)
     finally:
         if original_playing:
             song.start_playing()
@@ -66,27 +69,31 @@ def test_get_num_scenes(song):
 
 
 def test_get_signature(song):
-    """Test getting time signature."""
-    numerator = song.get_signature_numerator()
-    denominator = song.get_signature_denominator()
+    """Test getting time signature in one batched round trip."""
+    numerator, denominator = song.batch_get(
+        ["signature_numerator", "signature_denominator"]
+    )
 
     assert 1 <= numerator <= 99
     assert denominator in [1, 2, 4, 8, 16]  # Powers of 2
 
 
+@pytest.mark.usefixtures("song_snapshot")
 def test_set_signature(song):
-    """Test setting time signature."""
-    original_num = song.get_signature_numerator()
-    original_denom = song.get_signature_denominator()
-    try:
-        song.set_signature_numerator(3)
-        song.set_signature_denominator(4)
-
-        assert song.get_signature_numerator() == 3
-        assert song.get_signature_denominator() == 4
-    finally:
-        song.set_signature_numerator(original_num)
-        song.set_signature_denominator(original_denom)
+    """Test setting the full time signature as one bundled write.
+
+    One batched set, one batched verify - the module snapshot handles
+    the restore, so the whole test costs three round trips.
+    """
+    song.batch_set([
+        ("signature_numerator", 3),
+        ("signature_denominator", 4),
+    ])
+    wait_until(
+        lambda: song.batch_get(
+            ["signature_numerator", "signature_denominator"]
+        ) == (3, 4)
+    )
 
 
 def test_get_metronome(song):
@@ -95,17 +102,13 @@ def test_get_metronome(song):
     assert isinstance(metronome, bool)
 
 
+@pytest.mark.usefixtures("song_snapshot")
 def test_set_metronome(song):
-    """Test toggling metronome."""
-    original = song.get_metronome()
-    try:
-        song.set_metronome(True)
-        assert song.get_metronome() is True
-
-        song.set_metronome(False)
-        assert song.get_metronome() is False
-    finally:
-        song.set_metronome(original)
+    """Test toggling metronome, verified by Live's own push."""
+    c = song._client
+    address = "/live/song/get/metronome"
+    verify_set(c, address, lambda: song.set_metronome(True), True)
+    verify_set(c, address, lambda: song.set_metronome(False), False)
 
 
 def test_get_current_song_time(song):
@@ -116,48 +119,62 @@ def test_get_current_song_time(song):
 
 
 def test_create_and_delete_midi_track(song):
-    """Test creating and deleting a MIDI track."""
+    """Test creating and deleting a MIDI track, driven by Live's pushes."""
     original_count = song.get_num_tracks()
 
-    # Create MIDI track at end
-    song.create_midi_track(-1)
-    time.sleep(SETTLE_TIME)
-    assert song.get_num_tracks() == original_count + 1
+    with pushes(song._client, "/live/song/get/num_tracks", cast=int) as q:
+        # Create MIDI track at end
+        song.create_midi_track(-1)
+        wait_for_push(q, original_count + 1)
 
-    # Delete the new track
-    song.delete_track(original_count)
-    time.sleep(SETTLE_TIME)
-    assert song.get_num_tracks() == original_count
+        # Delete the new track
+        song.delete_track(original_count)
+        wait_for_push(q, original_count)
+
+
+def test_create_midi_track_with(song, track, clip_slot):
+    """Test fused track creation with name and clip."""
+    original_count = song.get_num_tracks()
+
+    track_index = song.create_midi_track_with(
+        -1, name="Fused Track", clip_length=4.0
+    )
+    wait_until(lambda: song.get_num_tracks() == original_count + 1)
+    try:
+        assert track_index == original_count
+        assert track.get_name(track_index) == "Fused Track"
+        assert clip_slot.has_clip(track_index, 0) is True
+    finally:
+        song.delete_track(track_index)
+        wait_until(lambda: song.get_num_tracks() == original_count)
 
 
 def test_create_and_delete_audio_track(song):
-    """Test creating and deleting an audio track."""
+    """Test creating and deleting an audio track, driven by Live's pushes."""
     original_count = song.get_num_tracks()
 
-    # Create audio track at end
-    song.create_audio_track(-1)
-    time.sleep(SETTLE_TIME)
-    assert song.get_num_tracks() == original_count + 1
+    with pushes(song._client, "/live/song/get/num_tracks", cast=int) as q:
+        # Create audio track at end
+        song.create_audio_track(-1)
+        wait_for_push(q, original_count + 1)
 
-    # Delete the new track
-    song.delete_track(original_count)
-    time.sleep(SETTLE_TIME)
-    assert song.get_num_tracks() == original_count
+        # Delete the new track
+        song.delete_track(original_count)
+        wait_for_push(q, original_count)
 
 
 def test_duplicate_track(song):
-    """Test duplicating a track."""
+    """Test duplicating a track, driven by Live's pushes."""
     original_count = song.get_num_tracks()
 
-    # Duplicate track 0
-    song.duplicate_track(0)
-    time.sleep(SETTLE_TIME)
-    assert song.get_num_tracks() == original_count + 1
+    with pushes(song._client, "/live/song/get/num_tracks", cast=int) as q:
+        # Duplicate track 0
+        song.duplicate_track(0)
+        wait_for_push(q, original_count + 1)
 
-    # Delete the duplicate (it appears at index 1)
-    song.delete_track(1)
-    time.sleep(SETTLE_TIME)
-    assert song.get_num_tracks() == original_count
+        # Delete the duplicate (it appears at index 1)
+        song.delete_track(1)
+        wait_for_push(q, original_count)
 
 
 def test_get_groove_amount(song):
@@ -166,19 +183,13 @@ def test_get_groove_amount(song):
     assert 0.0 <= groove <= 1.0
 
 
+@pytest.mark.usefixtures("song_snapshot")
 def test_set_groove_amount(song):
-    """Test setting groove amount."""
-    original = song.get_groove_amount()
-    try:
-        song.set_groove_amount(0.5)
-        time.sleep(SETTLE_TIME)
-        assert abs(song.get_groove_amount() - 0.5) < 0.01
-
-        song.set_groove_amount(0.0)
-        time.sleep(SETTLE_TIME)
-        assert abs(song.get_groove_amount()) < 0.01
-    finally:
-        song.set_groove_amount(original)
+    """Test setting groove amount, verified by Live's own push."""
+    c = song._client
+    address = "/live/song/get/groove_amount"
+    verify_set(c, address, lambda: song.set_groove_amount(0.5), 0.5, tolerance=0.01)
+    verify_set(c, address, lambda: song.set_groove_amount(0.0), 0.0, tolerance=0.01)
 
 
 def test_can_undo_redo(song):
@@ -191,6 +202,7 @@ def test_can_undo_redo(song):
     assert isinstance(can_redo, bool)
 
 
+@pytest.mark.xdist_group("transport")
 def test_undo_redo(song):
     """Test undo and redo functionality."""
     # Make a change we can undo
@@ -198,25 +210,22 @@ def test_undo_redo(song):
     new_tempo = 130.0 if original_tempo != 130.0 else 125.0
 
     song.set_tempo(new_tempo)
-    time.sleep(SETTLE_TIME)
-    assert song.get_tempo() == new_tempo
+    wait_until(lambda: song.get_tempo() == new_tempo)
 
     # Undo should revert
     if song.can_undo():
         song.undo()
-        time.sleep(SETTLE_TIME)
         # Tempo should be back to original
-        assert song.get_tempo() == original_tempo
+        wait_until(lambda: song.get_tempo() == original_tempo)
 
         # Redo should reapply
         if song.can_redo():
             song.redo()
-            time.sleep(SETTLE_TIME)
-            assert song.get_tempo() == new_tempo
+            wait_until(lambda: song.get_tempo() == new_tempo)
 
             # Clean up - undo back to original
             song.undo()
-            time.sleep(SETTLE_TIME)
+            wait_until(lambda: song.get_tempo() == original_tempo)
 
 
 def test_stop_all_clips(song):
@@ -237,33 +246,31 @@ def test_capture_midi(song):
 
 
 def test_create_and_delete_scene(song):
-    """Test creating and deleting a scene."""
+    """Test creating and deleting a scene, driven by Live's pushes."""
     original_count = song.get_num_scenes()
 
-    # Create scene at end
-    song.create_scene(-1)
-    time.sleep(SETTLE_TIME)
-    assert song.get_num_scenes() == original_count + 1
+    with pushes(song._client, "/live/song/get/num_scenes", cast=int) as q:
+        # Create scene at end
+        song.create_scene(-1)
+        wait_for_push(q, original_count + 1)
 
-    # Delete the new scene
-    song.delete_scene(original_count)
-    time.sleep(SETTLE_TIME)
-    assert song.get_num_scenes() == original_count
+        # Delete the new scene
+        song.delete_scene(original_count)
+        wait_for_push(q, original_count)
 
 
 def test_duplicate_scene(song):
-    """Test duplicating a scene."""
+    """Test duplicating a scene, driven by Live's pushes."""
     original_count = song.get_num_scenes()
 
-    # Duplicate scene 0
-    song.duplicate_scene(0)
-    time.sleep(SETTLE_TIME)
-    assert song.get_num_scenes() == original_count + 1
+    with pushes(song._client, "/live/song/get/num_scenes", cast=int) as q:
+        # Duplicate scene 0
+        song.duplicate_scene(0)
+        wait_for_push(q, original_count + 1)
 
-    # Delete the duplicate (it appears at index 1)
-    song.delete_scene(1)
-    time.sleep(SETTLE_TIME)
-    assert song.get_num_scenes() == original_count
+        # Delete the duplicate (it appears at index 1)
+        song.delete_scene(1)
+        wait_for_push(q, original_count)
 
 
 def test_get_song_length(song):
@@ -282,21 +289,6 @@ def test_get_loop(song):
     assert isinstance(loop, bool)
 
 
-def test_set_loop(song):
-    """Test setting loop state."""
-    original = song.get_loop()
-    try:
-        song.set_loop(True)
-        time.sleep(SETTLE_TIME)
-        assert song.get_loop() is True
-
-        song.set_loop(False)
-        time.sleep(SETTLE_TIME)
-        assert song.get_loop() is False
-    finally:
-        song.set_loop(original)
-
-
 def test_get_loop_start(song):
     """Test getting loop start."""
     start = song.get_loop_start()
@@ -304,17 +296,6 @@ def test_get_loop_start(song):
     assert start >= 0
 
 
-def test_set_loop_start(song):
-    """Test setting loop start."""
-    original = song.get_loop_start()
-    try:
-        song.set_loop_start(4.0)
-        time.sleep(SETTLE_TIME)
-        assert abs(song.get_loop_start() - 4.0) < 0.01
-    finally:
-        song.set_loop_start(original)
-
-
 def test_get_loop_length(song):
     """Test getting loop length."""
     length = song.get_loop_length()
@@ -322,15 +303,29 @@ def test_get_loop_length(song):
     assert length > 0
 
 
-def test_set_loop_length(song):
-    """Test setting loop length."""
-    original = song.get_loop_length()
-    try:
-        song.set_loop_length(8.0)
-        time.sleep(SETTLE_TIME)
-        assert abs(song.get_loop_length() - 8.0) < 0.01
-    finally:
-        song.set_loop_length(original)
+@pytest.mark.usefixtures("song_snapshot")
+def test_set_loop_region(song):
+    """Test setting the whole loop region as one bundled write.
+
+    Folds the former per-property loop/loop_start/loop_length tests
+    into one batched set and one batched verify.
+    """
+    song.batch_set([
+        ("loop", 1),
+        ("loop_start", 4.0),
+        ("loop_length", 8.0),
+    ])
+
+    def region_set():
+        loop, start, length = song.batch_get(
+            ["loop", "loop_start", "loop_length"]
+        )
+        return loop is True and abs(start - 4.0) < 0.01 and abs(length - 8.0) < 0.01
+
+    wait_until(region_set)
+
+    song.set_loop(False)
+    wait_until(lambda: song.get_loop() is False)
 
 
 # Quantization tests
@@ -348,8 +343,7 @@ def test_set_midi_recording_quantization(song):
     original = song.get_midi_recording_quantization()
     try:
         song.set_midi_recording_quantization(2)  # 1/8
-        time.sleep(SETTLE_TIME)
-        assert song.get_midi_recording_quantization() == 2
+        wait_until(lambda: song.get_midi_recording_quantization() == 2)
     finally:
         song.set_midi_recording_quantization(original)
 
@@ -366,8 +360,7 @@ def test_set_clip_trigger_quantization(song):
     original = song.get_clip_trigger_quantization()
     try:
         song.set_clip_trigger_quantization(4)  # 1 bar
-        time.sleep(SETTLE_TIME)
-        assert song.get_clip_trigger_quantization() == 4
+        wait_until(lambda: song.get_clip_trigger_quantization() == 4)
     finally:
         song.set_clip_trigger_quantization(original)
 
@@ -386,8 +379,7 @@ def test_set_session_record(song):
     original = song.get_session_record()
     try:
         song.set_session_record(False)
-        time.sleep(SETTLE_TIME)
-        assert song.get_session_record() is False
+        wait_until(lambda: song.get_session_record() is False)
     finally:
         song.set_session_record(original)
 
@@ -397,8 +389,7 @@ def test_trigger_session_record(song):
     # Just verify method executes without error
     # Actual recording behavior depends on track state
     song.trigger_session_record()
-    time.sleep(SETTLE_TIME)
-    # Turn it off to clean up
+    # Turn it off to clean up - fire-and-forget, no settle needed
     song.set_session_record(False)
 
 
@@ -416,12 +407,10 @@ def test_set_arrangement_overdub(song):
     original = song.get_arrangement_overdub()
     try:
         song.set_arrangement_overdub(True)
-        time.sleep(SETTLE_TIME)
-        assert song.get_arrangement_overdub() is True
+        wait_until(lambda: song.get_arrangement_overdub() is True)
 
         song.set_arrangement_overdub(False)
-        time.sleep(SETTLE_TIME)
-        assert song.get_arrangement_overdub() is False
+        wait_until(lambda: song.get_arrangement_overdub() is False)
     finally:
         song.set_arrangement_overdub(original)
 
@@ -440,12 +429,10 @@ def test_set_punch_in(song):
     original = song.get_punch_in()
     try:
         song.set_punch_in(True)
-        time.sleep(SETTLE_TIME)
-        assert song.get_punch_in() is True
+        wait_until(lambda: song.get_punch_in() is True)
 
         song.set_punch_in(False)
-        time.sleep(SETTLE_TIME)
-        assert song.get_punch_in() is False
+        wait_until(lambda: song.get_punch_in() is False)
     finally:
         song.set_punch_in(original)
 
@@ -461,12 +448,10 @@ def test_set_punch_out(song):
     original = song.get_punch_out()
     try:
         song.set_punch_out(True)
-        time.sleep(SETTLE_TIME)
-        assert song.get_punch_out() is True
+        wait_until(lambda: song.get_punch_out() is True)
 
         song.set_punch_out(False)
-        time.sleep(SETTLE_TIME)
-        assert song.get_punch_out() is False
+        wait_until(lambda: song.get_punch_out() is False)
     finally:
         song.set_punch_out(original)
 
@@ -499,26 +484,28 @@ def test_jump_to_cues(song):
 # Cue point tests
 
 
+@pytest.mark.xdist_group("cues")
 def test_get_cue_points(song):
     """Test getting cue points."""
     cue_points = song.get_cue_points()
     assert isinstance(cue_points, tuple)
 
 
+@pytest.mark.xdist_group("cues")
 def test_cue_point_add_and_delete(song):
     """Test adding and deleting cue points."""
     # Get initial cue points
     initial_cues = song.get_cue_points()
 
-    # Set position and add a cue point
+    # Set position and add a cue point; a barrier read on the
+    # position replaces the settle sleep (1 RTT, and UDP from
+    # localhost arrives in send order)
     song.set_current_song_time(8.0)
-    time.sleep(SETTLE_TIME)
+    wait_until(lambda: abs(song.get_current_song_time() - 8.0) < 0.01)
     song.cue_point_add_or_delete()
-    time.sleep(SETTLE_TIME)
 
     # Delete it (calling again at same position deletes)
     song.cue_point_add_or_delete()
-    time.sleep(SETTLE_TIME)
 
 
 # Key and scale tests
@@ -531,17 +518,16 @@ def test_get_root_note(song):
     assert 0 <= root <= 11
 
 
+@pytest.mark.xdist_group("key")
 def test_set_root_note(song):
     """Test setting root note."""
     original = song.get_root_note()
     try:
         song.set_root_note(2)  # D
-        time.sleep(SETTLE_TIME)
-        assert song.get_root_note() == 2
+        wait_until(lambda: song.get_root_note() == 2)
 
         song.set_root_note(0)  # C
-        time.sleep(SETTLE_TIME)
-        assert song.get_root_note() == 0
+        wait_until(lambda: song.get_root_note() == 0)
     finally:
         song.set_root_note(original)
 
@@ -552,17 +538,16 @@ def test_get_scale_name(song):
     assert isinstance(scale, str)
 
 
+@pytest.mark.xdist_group("key")
 def test_set_scale_name(song):
     """Test setting scale name."""
     original = song.get_scale_name()
     try:
         song.set_scale_name("Minor")
-        time.sleep(SETTLE_TIME)
-        assert song.get_scale_name() == "Minor"
+        wait_until(lambda: song.get_scale_name() == "Minor")
 
         song.set_scale_name("Major")
-        time.sleep(SETTLE_TIME)
-        assert song.get_scale_name() == "Major"
+        wait_until(lambda: song.get_scale_name() == "Major")
     finally:
         song.set_scale_name(original)
 
@@ -600,7 +585,6 @@ def test_set_back_to_arranger(song):
     # Just verify the method executes without error
     # Setting to True triggers the back-to-arranger action
     song.set_back_to_arranger(True)
-    time.sleep(SETTLE_TIME)
     # State should be False after triggering (it's a one-shot action)
 
 
@@ -787,3 +771,240 @@ def test_get_beat(song):
     """Test getting current beat."""
     beat = song.get_beat()
     assert isinstance(beat, float)
+
+
+def test_get_state_offline():
+    """Test the pipelined song state snapshot."""
+    import pytest
+
+    from abletonosc_client import Song
+    from abletonosc_client.client import AbletonOSCClient
+
+    c = AbletonOSCClient(send_port=19972, receive_port=19972, cache=True)
+    try:
+        c.prime_cache("/live/song/get/tempo", (), (120.0,))
+        c.prime_cache("/live/song/get/num_tracks", (), (5,))
+        c.prime_cache("/live/song/get/is_playing", (), (1,))
+
+        song = Song(c)
+        state = song.get_state(["tempo", "num_tracks", "is_playing"])
+        assert state == {"tempo": 120.0, "num_tracks": 5, "is_playing": True}
+
+        with pytest.raises(ValueError):
+            song.get_state(["tempo", "nonsense"])
+    finally:
+        c.close()
+
+
+def test_batch_get_set_offline():
+    """Test positional batch_get and bundled batch_set."""
+    import pytest
+
+    from abletonosc_client import Song
+    from abletonosc_client.client import AbletonOSCClient
+
+    c = AbletonOSCClient(send_port=19959, receive_port=19959, cache=True)
+    try:
+        c.prime_cache("/live/song/get/signature_numerator", (), (7,))
+        c.prime_cache("/live/song/get/signature_denominator", (), (8,))
+        c.prime_cache("/live/song/get/loop_start", (), (4.0,))
+
+        song = Song(c)
+        # Values come back in request order, cast per field
+        num, denom, start = song.batch_get(
+            ["signature_numerator", "signature_denominator", "loop_start"]
+        )
+        assert (num, denom, start) == (7, 8, 4.0)
+        assert isinstance(start, float)
+
+        with pytest.raises(ValueError):
+            song.batch_get(["signature_numerator", "nonsense"])
+
+        # batch_set invalidates the cached reads it touches: the next
+        # batch_get goes to the wire, and the loopback echo carries no
+        # value, so the cast falls back to the field default
+        song.batch_set([("signature_numerator", 4)])
+        assert song.batch_get(["signature_numerator"]) == (None,)
+    finally:
+        c.close()
+
+
+def test_pushes_helper_offline():
+    """Test the push-queue test helper over loopback."""
+    import pytest as _pytest
+
+    from abletonosc_client.client import AbletonOSCClient
+
+    c = AbletonOSCClient(send_port=19958, receive_port=19958)
+    try:
+        with pushes(c, "/live/song/get/num_tracks", cast=int) as q:
+            # Loopback stands in for Live's push after create/delete
+            c.send("/live/song/get/num_tracks", 4)
+            c.send("/live/song/get/num_tracks", 5)
+            wait_for_push(q, 5)
+
+        with _pytest.raises(TimeoutError):
+            wait_for_push(q, 6, timeout=0.05)
+
+        # Without cast, each queue item is the push's full args tuple
+        with pushes(c, "/live/song/get/loop") as q:
+            c.send("/live/song/get/loop", 1)
+            wait_for_push(q, (1,))
+    finally:
+        c.close()
+
+
+def test_scalar_listener_offline():
+    """Test that scalar listeners cast values dispatched from raw bytes."""
+    import threading
+
+    from abletonosc_client import Song
+    from abletonosc_client.client import AbletonOSCClient
+
+    c = AbletonOSCClient(send_port=19968, receive_port=19968)
+    seen = []
+    done = threading.Event()
+
+    def on_tempo(tempo):
+        seen.append(tempo)
+        done.set()
+
+    try:
+        Song(c).on_tempo_change(on_tempo)
+        # Loopback stands in for Live's push after start_listen
+        c.send("/live/song/get/tempo", 128)
+        assert done.wait(timeout=2.0), "Tempo push not dispatched"
+        assert seen == [128.0]
+        assert isinstance(seen[0], float)
+    finally:
+        c.close()
+
+
+def test_apply_and_set_signature_bundle_offline():
+    """Test that composite song commands ship as one bundle."""
+    import threading
+
+    from abletonosc_client import Song
+    from abletonosc_client.client import AbletonOSCClient
+
+    c = AbletonOSCClient(send_port=19967, receive_port=19967)
+    received = []
+    done = threading.Event()
+
+    def on_message(address, *args):
+        received.append((address, args))
+        if len(received) == 4:
+            done.set()
+
+    for address in (
+        "/live/song/set/signature_numerator",
+        "/live/song/set/signature_denominator",
+        "/live/song/stop_playing",
+        "/live/song/set/current_song_time",
+    ):
+        c.start_listener(address, on_message)
+    try:
+        song = Song(c)
+        song.set_signature(7, 8)
+        song.apply(
+            [
+                ("/live/song/stop_playing", ()),
+                ("/live/song/set/current_song_time", (0.0,)),
+            ]
+        )
+        assert done.wait(timeout=2.0), "Bundled commands not received"
+        assert ("/live/song/set/signature_numerator", (7,)) in received
+        assert ("/live/song/set/signature_denominator", (8,)) in received
+        assert ("/live/song/stop_playing", ()) in received
+        assert ("/live/song/set/current_song_time", (0.0,)) in received
+    finally:
+        c.close()
+
+
+def test_precomputed_transport_messages_offline():
+    """Test that template-packed tempo/transport messages decode correctly."""
+    import threading
+
+    from abletonosc_client import Song
+    from abletonosc_client.client import AbletonOSCClient
+
+    c = AbletonOSCClient(send_port=19966, receive_port=19966)
+    received = []
+    done = threading.Event()
+
+    def on_message(address, *args):
+        received.append((address, args))
+        if len(received) == 3:
+            done.set()
+
+    for address in (
+        "/live/song/set/tempo",
+        "/live/song/start_playing",
+        "/live/song/stop_playing",
+    ):
+        c.start_listener(address, on_message)
+    try:
+        song = Song(c)
+        song.set_tempo(128.0)
+        song.start_playing()
+        song.stop_playing()
+        assert done.wait(timeout=2.0), "Precomputed messages not received"
+        assert ("/live/song/set/tempo", (128.0,)) in received
+        assert ("/live/song/start_playing", ()) in received
+        assert ("/live/song/stop_playing", ()) in received
+    finally:
+        c.close()
+
+
+def test_watch_serves_song_state_offline():
+    """Test that pushed song state answers polled getters without queries."""
+    from abletonosc_client import Song
+    from abletonosc_client.client import AbletonOSCClient
+
+    c = AbletonOSCClient(send_port=19963, receive_port=19963)
+    try:
+        song = Song(c)
+        song.watch()
+
+        # Loopback stands in for Live's pushes after start_listen
+        c.send("/live/song/get/num_tracks", 7)
+        c.send("/live/song/get/tempo", 98.5)
+        wait_until(lambda: c.peek("/live/song/get/tempo") is not None)
+        wait_until(lambda: c.peek("/live/song/get/num_tracks") is not None)
+
+        assert song.get_num_tracks() == 7
+        assert song.get_tempo() == 98.5
+
+        song.unwatch()
+        assert c.peek("/live/song/get/num_tracks") is None
+    finally:
+        c.close()
+
+
+def test_verify_set_offline():
+    """Test the push-confirmed set helper against the loopback echo."""
+    import pytest
+
+    from abletonosc_client.client import AbletonOSCClient
+
+    c = AbletonOSCClient(send_port=19960, receive_port=19960)
+    try:
+        # The "setter" loops a push back to us, standing in for Live's
+        # confirmation after a real set
+        verify_set(
+            c,
+            "/live/song/get/tempo",
+            lambda: c.send("/live/song/get/tempo", 120.0),
+            120.0,
+        )
+        # No matching push within the timeout raises
+        with pytest.raises(TimeoutError):
+            verify_set(
+                c,
+                "/live/song/get/tempo",
+                lambda: c.send("/live/song/get/tempo", 99.0),
+                120.0,
+                timeout=0.2,
+            )
+    finally:
+        c.close()
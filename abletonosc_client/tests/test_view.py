@@ -1,9 +1,8 @@
 """Tests for View operations."""
 
 import threading
-import time
 
-SETTLE_TIME = 0.1  # Time for Ableton to process changes
+from abletonosc_client.tests._wait import wait_until
 
 
 def test_get_selected_track(view):
@@ -83,27 +82,18 @@ def test_get_selected_device(view):
     assert len(result) == 2
 
 
-def test_set_selected_device(view, song, track):
+def test_set_selected_device(view, track, scratch_midi_track):
     """Test setting selected device (requires device on track)."""
-    # Create a track with a device
-    original_tracks = song.get_num_tracks()
-    track_idx = original_tracks
-
-    song.create_midi_track(-1)
-    time.sleep(SETTLE_TIME)
-
-    try:
-        # Insert a device
-        device_idx = track.insert_device(track_idx, "Wavetable")
-        time.sleep(SETTLE_TIME)
-
-        if device_idx >= 0:
-            view.set_selected_device(track_idx, device_idx)
-            result = view.get_selected_device()
-            assert isinstance(result, tuple)
-    finally:
-        song.delete_track(track_idx)
-        time.sleep(SETTLE_TIME)
+    before = track.get_num_devices(scratch_midi_track)
+    device_idx = track.insert_device(scratch_midi_track, "Wavetable")
+
+    if device_idx >= 0:
+        wait_until(
+            lambda: track.get_num_devices(scratch_midi_track) == before + 1
+        )
+        view.set_selected_device(scratch_midi_track, device_idx)
+        result = view.get_selected_device()
+        assert isinstance(result, tuple)
 
 
 # Listener tests
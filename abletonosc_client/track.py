@@ -5,12 +5,14 @@ Covers /live/track/* endpoints for individual track control.
 
 from typing import Callable
 
-from abletonosc_client.client import AbletonOSCClient
+from abletonosc_client.client import AbletonOSCClient, tail
 
 
 class Track:
     """Track operations like volume, pan, mute, solo."""
 
+    __slots__ = ("_client", "_track_callbacks", "_dispatcher_registered")
+
     def __init__(self, client: AbletonOSCClient):
         self._client = client
         # Track listener callbacks: {"property": {track_index: callback}}
@@ -31,7 +33,7 @@ class Track:
         """
         result = self._client.query("/live/track/get/name", track_index)
         # Response format: (track_index, name)
-        return str(result[1]) if len(result) > 1 else ""
+        return tail(result, 1, str, "")
 
     def set_name(self, track_index: int, name: str) -> None:
         """Set the track name.
@@ -42,6 +44,28 @@ class Track:
         """
         self._client.send("/live/track/set/name", track_index, name)
 
+    def get_names(self, indices: list[int]) -> list[str]:
+        """Get names for several tracks with a single query.
+
+        Uses the bulk /live/song/get/track_names endpoint instead of one
+        round trip per track, and primes the query cache (if enabled) so
+        subsequent get_name() calls for these tracks are free.
+
+        Args:
+            indices: Track indices to fetch (0-based)
+
+        Returns:
+            Track names in the same order as indices
+        """
+        if not indices:
+            return []
+        start, end = min(indices), max(indices) + 1
+        result = self._client.query("/live/song/get/track_names", start, end)
+        names = {i: str(name) for i, name in zip(range(start, end), result)}
+        for i, name in names.items():
+            self._client.prime_cache("/live/track/get/name", (i,), (i, name))
+        return [names[i] for i in indices]
+
     # Volume
 
     def get_volume(self, track_index: int) -> float:
@@ -55,7 +79,7 @@ class Track:
         """
         result = self._client.query("/live/track/get/volume", track_index)
         # Response format: (track_index, volume)
-        return float(result[1])
+        return tail(result, 1, float, 0.0)
 
     def set_volume(self, track_index: int, volume: float) -> None:
         """Set the track volume.
@@ -66,6 +90,20 @@ class Track:
         """
         self._client.send("/live/track/set/volume", track_index, float(volume))
 
+    def set_volumes(self, volumes: dict[int, float]) -> None:
+        """Set volume on several tracks in one OSC bundle.
+
+        A whole mix pass ships as one datagram instead of one send per
+        track, and Live applies the levels in the same message-queue
+        tick.
+
+        Args:
+            volumes: Mapping of track index to volume (0.0-1.0)
+        """
+        with self._client.bundle():
+            for track_index, volume in volumes.items():
+                self.set_volume(track_index, volume)
+
     # Pan
 
     def get_panning(self, track_index: int) -> float:
@@ -79,7 +117,7 @@ class Track:
         """
         result = self._client.query("/live/track/get/panning", track_index)
         # Response format: (track_index, panning)
-        return float(result[1])
+        return tail(result, 1, float, 0.0)
 
     def set_panning(self, track_index: int, pan: float) -> None:
         """Set the track pan position.
@@ -103,7 +141,7 @@ class Track:
         """
         result = self._client.query("/live/track/get/mute", track_index)
         # Response format: (track_index, mute)
-        return bool(result[1])
+        return tail(result, 1, bool, False)
 
     def set_mute(self, track_index: int, muted: bool) -> None:
         """Mute or unmute a track.
@@ -127,7 +165,7 @@ class Track:
         """
         result = self._client.query("/live/track/get/solo", track_index)
         # Response format: (track_index, solo)
-        return bool(result[1])
+        return tail(result, 1, bool, False)
 
     def set_solo(self, track_index: int, soloed: bool) -> None:
         """Solo or unsolo a track.
@@ -151,7 +189,7 @@ class Track:
         """
         result = self._client.query("/live/track/get/arm", track_index)
         # Response format: (track_index, arm)
-        return bool(result[1])
+        return tail(result, 1, bool, False)
 
     def set_arm(self, track_index: int, armed: bool) -> None:
         """Arm or disarm a track for recording.
@@ -175,7 +213,7 @@ class Track:
         """
         result = self._client.query("/live/track/get/color", track_index)
         # Response format: (track_index, color)
-        return int(result[1])
+        return tail(result, 1, int, 0)
 
     def set_color(self, track_index: int, color: int) -> None:
         """Set the track color.
@@ -197,7 +235,7 @@ class Track:
         """
         result = self._client.query("/live/track/get/is_foldable", track_index)
         # Response format: (track_index, is_foldable)
-        return bool(result[1])
+        return tail(result, 1, bool, False)
 
     def get_is_grouped(self, track_index: int) -> bool:
         """Check if track is inside a group.
@@ -210,7 +248,7 @@ class Track:
         """
         result = self._client.query("/live/track/get/is_grouped", track_index)
         # Response format: (track_index, is_grouped)
-        return bool(result[1])
+        return tail(result, 1, bool, False)
 
     # Devices
 
@@ -225,7 +263,7 @@ class Track:
         """
         result = self._client.query("/live/track/get/num_devices", track_index)
         # Response format: (track_index, num_devices)
-        return int(result[1])
+        return tail(result, 1, int, 0)
 
     # Sends
 
@@ -243,7 +281,7 @@ class Track:
             "/live/track/get/send", track_index, send_index
         )
         # Response format: (track_index, send_index, level)
-        return float(result[2])
+        return tail(result, 2, float, 0.0)
 
     def set_send(self, track_index: int, send_index: int, level: float) -> None:
         """Set the send level for a track.
@@ -257,6 +295,72 @@ class Track:
             "/live/track/set/send", track_index, send_index, float(level)
         )
 
+    # Bulk state
+
+    _STATE_FIELDS = {
+        "name": str,
+        "volume": float,
+        "panning": float,
+        "mute": bool,
+        "solo": bool,
+        "arm": bool,
+        "color_index": int,
+        "current_monitoring_state": int,
+    }
+
+    def get_state(self, track_index: int, fields: "list[str] | None" = None) -> dict:
+        """Fetch several track properties in one pipelined round trip.
+
+        The per-property queries go out back-to-back through the
+        client's query_many(), so snapshotting a track costs roughly
+        one RTT instead of one per field.
+
+        Args:
+            track_index: Track index (0-based)
+            fields: Property names to fetch (default: all supported;
+                see _STATE_FIELDS)
+
+        Returns:
+            {field: value} with values cast per field
+
+        Raises:
+            ValueError: If a requested field is not supported
+        """
+        if fields is None:
+            fields = list(self._STATE_FIELDS)
+        else:
+            unknown = [f for f in fields if f not in self._STATE_FIELDS]
+            if unknown:
+                raise ValueError(
+                    f"Unknown track state field(s) {unknown}. "
+                    f"Available: {', '.join(sorted(self._STATE_FIELDS))}"
+                )
+        results = self._client.query_many(
+            [(f"/live/track/get/{field}", (track_index,)) for field in fields]
+        )
+        # Responses echo (track_index, value)
+        return {
+            field: tail(result, 1, self._STATE_FIELDS[field], None)
+            for field, result in zip(fields, results)
+        }
+
+    def set_state(self, track_index: int, state: dict) -> None:
+        """Write several track properties as one immediate OSC bundle.
+
+        The counterpart to get_state() for restoring a snapshot: all
+        writes ship in a single datagram.
+
+        Args:
+            track_index: Track index (0-based)
+            state: {field: value} pairs to apply
+        """
+        with self._client.bundle():
+            for field, value in state.items():
+                if isinstance(value, bool):
+                    # Keep the wire typetag ,i rather than ,T/,F
+                    value = int(value)
+                self._client.send(f"/live/track/set/{field}", track_index, value)
+
     # Clip control
 
     def stop_all_clips(self, track_index: int) -> None:
@@ -289,7 +393,7 @@ class Track:
             "/live/track/insert_device", track_index, device_name, device_index
         )
         # Response format: (track_index, device_index)
-        return int(result[1]) if len(result) > 1 else -1
+        return tail(result, 1, int, -1)
 
     def get_device_names(self, track_index: int) -> tuple:
         """Get names of all devices on a track.
@@ -342,7 +446,7 @@ class Track:
         result = self._client.query(
             "/live/track/get/input_routing_type", track_index
         )
-        return str(result[1]) if len(result) > 1 else ""
+        return tail(result, 1, str, "")
 
     def set_input_routing_type(self, track_index: int, routing_type: str) -> None:
         """Set the input routing type for a track.
@@ -367,7 +471,7 @@ class Track:
         result = self._client.query(
             "/live/track/get/input_routing_channel", track_index
         )
-        return str(result[1]) if len(result) > 1 else ""
+        return tail(result, 1, str, "")
 
     def set_input_routing_channel(self, track_index: int, channel: str) -> None:
         """Set the input routing channel for a track.
@@ -394,7 +498,7 @@ class Track:
         result = self._client.query(
             "/live/track/get/output_routing_type", track_index
         )
-        return str(result[1]) if len(result) > 1 else ""
+        return tail(result, 1, str, "")
 
     def set_output_routing_type(self, track_index: int, routing_type: str) -> None:
         """Set the output routing type for a track.
@@ -419,7 +523,7 @@ class Track:
         result = self._client.query(
             "/live/track/get/output_routing_channel", track_index
         )
-        return str(result[1]) if len(result) > 1 else ""
+        return tail(result, 1, str, "")
 
     def set_output_routing_channel(self, track_index: int, channel: str) -> None:
         """Set the output routing channel for a track.
@@ -556,7 +660,7 @@ class Track:
         result = self._client.query(
             "/live/track/get/current_monitoring_state", track_index
         )
-        return int(result[1])
+        return tail(result, 1, int, 0)
 
     def set_current_monitoring_state(self, track_index: int, state: int) -> None:
         """Set the current monitoring state for a track.
@@ -583,7 +687,7 @@ class Track:
         result = self._client.query(
             "/live/track/get/can_be_armed", track_index
         )
-        return bool(result[1])
+        return tail(result, 1, bool, False)
 
     def get_has_midi_input(self, track_index: int) -> bool:
         """Check if a track has MIDI input.
@@ -597,7 +701,7 @@ class Track:
         result = self._client.query(
             "/live/track/get/has_midi_input", track_index
         )
-        return bool(result[1])
+        return tail(result, 1, bool, False)
 
     def get_has_midi_output(self, track_index: int) -> bool:
         """Check if a track has MIDI output.
@@ -611,7 +715,7 @@ class Track:
         result = self._client.query(
             "/live/track/get/has_midi_output", track_index
         )
-        return bool(result[1])
+        return tail(result, 1, bool, False)
 
     def get_has_audio_input(self, track_index: int) -> bool:
         """Check if a track has audio input.
@@ -625,7 +729,7 @@ class Track:
         result = self._client.query(
             "/live/track/get/has_audio_input", track_index
         )
-        return bool(result[1])
+        return tail(result, 1, bool, False)
 
     def get_has_audio_output(self, track_index: int) -> bool:
         """Check if a track has audio output.
@@ -639,7 +743,7 @@ class Track:
         result = self._client.query(
             "/live/track/get/has_audio_output", track_index
         )
-        return bool(result[1])
+        return tail(result, 1, bool, False)
 
     # Track state
 
@@ -655,7 +759,7 @@ class Track:
         result = self._client.query(
             "/live/track/get/fired_slot_index", track_index
         )
-        return int(result[1])
+        return tail(result, 1, int, 0)
 
     def get_playing_slot_index(self, track_index: int) -> int:
         """Get the index of the currently playing clip slot.
@@ -669,7 +773,7 @@ class Track:
         result = self._client.query(
             "/live/track/get/playing_slot_index", track_index
         )
-        return int(result[1])
+        return tail(result, 1, int, 0)
 
     def get_color_index(self, track_index: int) -> int:
         """Get the color index of a track.
@@ -683,7 +787,7 @@ class Track:
         result = self._client.query(
             "/live/track/get/color_index", track_index
         )
-        return int(result[1])
+        return tail(result, 1, int, 0)
 
     def set_color_index(self, track_index: int, color_index: int) -> None:
         """Set the color index of a track.
@@ -710,7 +814,7 @@ class Track:
         result = self._client.query(
             "/live/track/get/fold_state", track_index
         )
-        return bool(result[1])
+        return tail(result, 1, bool, False)
 
     def set_fold_state(self, track_index: int, folded: bool) -> None:
         """Set the fold state of a group track.
@@ -735,7 +839,7 @@ class Track:
         result = self._client.query(
             "/live/track/get/is_visible", track_index
         )
-        return bool(result[1])
+        return tail(result, 1, bool, False)
 
     # Meters
 
@@ -751,7 +855,7 @@ class Track:
         result = self._client.query(
             "/live/track/get/output_meter_level", track_index
         )
-        return float(result[1])
+        return tail(result, 1, float, 0.0)
 
     def get_output_meter_left(self, track_index: int) -> float:
         """Get the left channel output meter level for a track.
@@ -765,7 +869,7 @@ class Track:
         result = self._client.query(
             "/live/track/get/output_meter_left", track_index
         )
-        return float(result[1]) if len(result) > 1 and result[1] is not None else 0.0
+        return tail(result, 1, float, 0.0)
 
     def get_output_meter_right(self, track_index: int) -> float:
         """Get the right channel output meter level for a track.
@@ -779,7 +883,27 @@ class Track:
         result = self._client.query(
             "/live/track/get/output_meter_right", track_index
         )
-        return float(result[1]) if len(result) > 1 and result[1] is not None else 0.0
+        return tail(result, 1, float, 0.0)
+
+    def get_output_meters(self, track_index: int) -> tuple[float, float, float]:
+        """Get the overall, left and right output meters in one burst.
+
+        The three queries go out back-to-back via query_many(), so the
+        meters are sampled at (nearly) the same instant instead of one
+        round-trip apart.
+
+        Args:
+            track_index: Track index (0-based)
+
+        Returns:
+            (level, left, right) meter levels (each 0.0-1.0)
+        """
+        results = self._client.query_many([
+            ("/live/track/get/output_meter_level", (track_index,)),
+            ("/live/track/get/output_meter_left", (track_index,)),
+            ("/live/track/get/output_meter_right", (track_index,)),
+        ])
+        return tuple(tail(result, 1, float, 0.0) for result in results)
 
     # Listener infrastructure
 
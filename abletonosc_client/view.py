@@ -5,12 +5,14 @@ Covers /live/view/* endpoints for navigation and selection.
 
 from typing import Callable
 
-from abletonosc_client.client import AbletonOSCClient
+from abletonosc_client.client import AbletonOSCClient, tail
 
 
 class View:
     """View operations like track/scene selection and navigation."""
 
+    __slots__ = ("_client",)
+
     def __init__(self, client: AbletonOSCClient):
         self._client = client
 
@@ -21,7 +23,7 @@ class View:
             Selected track index (0-based)
         """
         result = self._client.query("/live/view/get/selected_track")
-        return int(result[0])
+        return tail(result, 0, int, 0)
 
     def set_selected_track(self, track_index: int) -> None:
         """Set the selected track.
@@ -38,7 +40,7 @@ class View:
             Selected scene index (0-based)
         """
         result = self._client.query("/live/view/get/selected_scene")
-        return int(result[0])
+        return tail(result, 0, int, 0)
 
     def set_selected_scene(self, scene_index: int) -> None:
         """Set the selected scene.
@@ -76,7 +78,7 @@ class View:
             True if visible
         """
         result = self._client.query("/live/view/get/is_view_visible", view_name)
-        return bool(result[0])
+        return tail(result, 0, bool, False)
 
     def focus_view(self, view_name: str) -> None:
         """Focus a specific view.
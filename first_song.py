@@ -4,186 +4,216 @@
 Run this script with Ableton Live open and AbletonOSC enabled.
 """
 
-import time
 import abletonosc_client
+from abletonosc_client import chords
+from abletonosc_client.client import encode_message
 from abletonosc_client.clip import Note
 
+# Song data for the 8-bar loop. Each section is built by a pure
+# function (no OSC, no shared state), invoked once at import time so
+# compose_song only pays for OSC serialization. The builders stay
+# independent, so larger songs could run them concurrently.
+
+TRACK_NAMES = ["Drums", "Bass", "Lead", "Chords", "Accent"]
+CLIP_NAMES = ["Drum Loop", "Bass Line", "Melody", "Pad Chords", "Accents"]
+CLIP_LENGTH = 32.0  # 8 bars of 4/4, in beats
+
+
+# ===== DRUMS (Track 0) =====
+def _build_drum_notes(nbars=8):
+    """Kick/snare pattern: Kick C1 (36) on 1 and 3, Snare D1 (38) on 2 and 4."""
+    return tuple(
+        Note(pitch, bar * 4 + offset, 0.5, 100)
+        for bar in range(nbars)
+        for pitch, offset in ((36, 0.0), (36, 2.0), (38, 1.0), (38, 3.0))
+    )
+
+
+# Hi-hats F#1 (42) on every 8th note, accented on downbeats - a pure
+# periodic pattern, so it's described by its parameters and expanded by
+# Clip.add_pattern instead of being materialized note-by-note here
+HAT_PITCH = 42
+HAT_STRIDE = 0.5       # every 8th note
+HAT_COUNT = 8 * 8      # 8 per bar for 8 bars
+HAT_DURATION = 0.25
+HAT_VEL_EVEN = 80      # downbeat accents
+HAT_VEL_ODD = 60
+
+
+# ===== BASS (Track 1) =====
+# Chord roots following the Am - F - C - G progression, 2 bars per chord,
+# playing on beats 1, 2.5, 4 of each bar
+BASS_PATTERN = (
+    (45, 0),   # A2 for bars 1-2
+    (41, 8),   # F2 for bars 3-4
+    (48, 16),  # C3 for bars 5-6
+    (43, 24),  # G2 for bars 7-8
+)
+
+
+def _build_bass_notes():
+    return tuple(
+        Note(root_pitch, start_bar + bar_offset * 4 + beat, dur, vel)
+        for root_pitch, start_bar in BASS_PATTERN
+        for bar_offset in range(2)  # 2 bars per chord
+        for beat, dur, vel in ((0.0, 0.75, 100), (1.5, 0.5, 90), (2.5, 0.75, 95))
+    )
+
+
+DRUM_NOTES = _build_drum_notes()
+BASS_NOTES = _build_bass_notes()
+
+# ===== LEAD (Track 2) =====
+# Simple melody over the progression (Am pentatonic: A C D E G)
+MELODY_NOTES = (
+    # Bar 1-2: A minor feel
+    Note(69, 0.0, 1.0, 90),   # A4
+    Note(72, 1.0, 0.5, 85),   # C5
+    Note(74, 1.5, 1.5, 90),   # D5
+    Note(72, 4.0, 2.0, 85),   # C5
+    Note(69, 6.0, 2.0, 80),   # A4
+    # Bar 3-4: F major feel
+    Note(77, 8.0, 1.0, 90),   # F5 (from F chord)
+    Note(76, 9.0, 0.5, 85),   # E5
+    Note(74, 9.5, 1.5, 90),   # D5
+    Note(72, 12.0, 2.0, 85),  # C5
+    Note(69, 14.0, 2.0, 80),  # A4
+    # Bar 5-6: C major feel
+    Note(72, 16.0, 1.0, 95),  # C5
+    Note(76, 17.0, 1.0, 90),  # E5
+    Note(79, 18.0, 2.0, 95),  # G5
+    Note(76, 20.0, 1.0, 85),  # E5
+    Note(74, 21.0, 1.0, 80),  # D5
+    Note(72, 22.0, 2.0, 85),  # C5
+    # Bar 7-8: G major feel, building back to A
+    Note(79, 24.0, 1.0, 95),  # G5
+    Note(76, 25.0, 0.5, 90),  # E5
+    Note(74, 25.5, 1.5, 90),  # D5
+    Note(71, 28.0, 1.0, 85),  # B4 (leading tone)
+    Note(72, 29.0, 1.0, 90),  # C5
+    Note(69, 30.0, 2.0, 95),  # A4 (resolve)
+)
+
+# ===== CHORDS/PAD (Track 3) =====
+# Sustained chords: Am - F - C - G, voicings shared via chords module
+PAD_CHORDS = (
+    (chords.AM_TRIAD_VOICED, 0),   # bars 1-2
+    (chords.F_TRIAD_VOICED, 8),    # bars 3-4
+    (chords.C_TRIAD_VOICED, 16),   # bars 5-6
+    (chords.G_TRIAD_VOICED, 24),   # bars 7-8
+)
+
+
+def _build_chord_notes():
+    return tuple(
+        note
+        for voicing, start_beat in PAD_CHORDS
+        for note in chords.chord_notes_at(voicing, start_beat, 7.5, 70)
+    )
+
+
+CHORD_NOTES = _build_chord_notes()
+
+# ===== ACCENT (Track 4) =====
+# Sparse accent hits at key moments
+ACCENT_NOTES = (
+    Note(72, 7.5, 0.5, 100),   # End of bar 2 - transition marker
+    Note(74, 15.5, 0.5, 100),  # End of bar 4
+    Note(76, 23.5, 0.5, 100),  # End of bar 6
+    Note(79, 31.0, 1.0, 110),  # Downbeat before loop
+)
+
+# Messages that are byte-identical on every run, encoded once here and
+# replayed with client.send_raw()
+TEMPO_120_MSG = encode_message("/live/song/set/tempo", 120.0)
+SCENE_NAME_MSG = encode_message("/live/scene/set/name", 0, "Main Loop")
+CLIP_NAME_MSGS = tuple(
+    encode_message("/live/clip/set/name", i, 0, name)
+    for i, name in enumerate(CLIP_NAMES)
+)
+
 
 def create_tracks(client):
     """Step 1: Create 5 MIDI tracks for our song."""
-    song = abletonosc_client.Song(client)
-    track = abletonosc_client.Track(client)
+    song = client.song
+    track = client.track
 
     initial_tracks = song.get_num_tracks()
     print(f"Current track count: {initial_tracks}")
 
-    # Track names for our song
-    track_names = ["Drums", "Bass", "Lead", "Chords", "Accent"]
-
     print("\nCreating 5 MIDI tracks...")
-    for i, name in enumerate(track_names):
-        song.create_midi_track(i)
-        time.sleep(0.1)  # Small delay for Ableton to process
+    with client.bundle():
+        for i in range(len(TRACK_NAMES)):
+            song.create_midi_track(i)
+
+    # Wait until Ableton reports the new tracks instead of sleeping
+    client.wait_until(
+        "/live/song/get/num_tracks",
+        predicate=lambda r: int(r[0]) >= initial_tracks + len(TRACK_NAMES),
+    )
 
     # Name the tracks
     print("Naming tracks...")
-    for i, name in enumerate(track_names):
-        track.set_name(i, name)
-        time.sleep(0.05)
+    with client.bundle():
+        for i, name in enumerate(TRACK_NAMES):
+            track.set_name(i, name)
 
-    # Verify
+    # Verify (one bulk query instead of one RTT per track)
     print("\nCreated tracks:")
-    for i in range(5):
-        print(f"  Track {i}: {track.get_name(i)}")
+    for i, name in enumerate(track.get_names(list(range(5)))):
+        print(f"  Track {i}: {name}")
 
-    return track_names
+    return TRACK_NAMES
 
 
 def compose_song(client):
     """Step 3: Compose a simple 8-bar loop on all tracks."""
-    clip_slot = abletonosc_client.ClipSlot(client)
-    clip = abletonosc_client.Clip(client)
-    song = abletonosc_client.Song(client)
-    scene = abletonosc_client.Scene(client)
+    clip_slot = client.clip_slot
+    clip = client.clip
+    song = client.song
 
-    # Set tempo
-    song.set_tempo(120.0)
+    # Set tempo (pre-encoded; the 120 BPM message never changes)
+    client.send_raw(TEMPO_120_MSG)
     print(f"Set tempo to {song.get_tempo()} BPM")
 
-    # Create 8-bar clips (32 beats at 4/4) on scene 0
-    clip_length = 32.0  # 8 bars
-
+    # Stage 1: create all clips in one bundle (one UDP packet)
     print("\nCreating clips...")
-    for track_idx in range(5):
-        clip_slot.create_clip(track_idx, 0, clip_length)
-        time.sleep(0.1)
-
-    # Name the clips
-    clip_names = ["Drum Loop", "Bass Line", "Melody", "Pad Chords", "Accents"]
-    for i, name in enumerate(clip_names):
-        clip.set_name(i, 0, name)
+    with client.bundle():
+        for track_idx in range(5):
+            clip_slot.create_clip(track_idx, 0, CLIP_LENGTH)
 
-    # Name the scene
-    scene.set_name(0, "Main Loop")
+    # Clips must exist before we can name them or add notes
+    client.wait_until(
+        "/live/clip_slot/get/has_clip", 4, 0, predicate=lambda r: bool(r[2])
+    )
 
     print("Composing notes...")
-
-    # ===== DRUMS (Track 0) =====
-    # Standard kick/snare/hihat pattern
-    # Kick: C1 (36), Snare: D1 (38), Hi-hat: F#1 (42)
-    drum_notes = []
-    for bar in range(8):
-        bar_start = bar * 4
-        # Kick on 1 and 3
-        drum_notes.append(Note(36, bar_start + 0.0, 0.5, 100))
-        drum_notes.append(Note(36, bar_start + 2.0, 0.5, 100))
-        # Snare on 2 and 4
-        drum_notes.append(Note(38, bar_start + 1.0, 0.5, 100))
-        drum_notes.append(Note(38, bar_start + 3.0, 0.5, 100))
-        # Hi-hats on every 8th note
-        for eighth in range(8):
-            vel = 80 if eighth % 2 == 0 else 60
-            drum_notes.append(Note(42, bar_start + eighth * 0.5, 0.25, vel))
-
-    clip.add_notes(0, 0, drum_notes)
-    print(f"  Drums: {len(drum_notes)} notes")
-
-    # ===== BASS (Track 1) =====
-    # Simple chord root pattern following Am - F - C - G progression
-    # Each chord gets 2 bars
-    bass_pattern = [
-        (45, 0),   # A2 for bars 1-2
-        (41, 8),   # F2 for bars 3-4
-        (48, 16),  # C3 for bars 5-6
-        (43, 24),  # G2 for bars 7-8
-    ]
-    bass_notes = []
-    for root_pitch, start_bar in bass_pattern:
-        # Bass plays on beats 1, 2.5, 4 in each bar
-        for bar_offset in range(2):  # 2 bars per chord
-            bar_start = start_bar + bar_offset * 4
-            bass_notes.append(Note(root_pitch, bar_start + 0.0, 0.75, 100))
-            bass_notes.append(Note(root_pitch, bar_start + 1.5, 0.5, 90))
-            bass_notes.append(Note(root_pitch, bar_start + 2.5, 0.75, 95))
-
-    clip.add_notes(1, 0, bass_notes)
-    print(f"  Bass: {len(bass_notes)} notes")
-
-    # ===== LEAD (Track 2) =====
-    # Simple melody over the progression
-    # Am pentatonic: A C D E G
-    melody_notes = []
-    # Bar 1-2: A minor feel
-    melody_notes.extend([
-        Note(69, 0.0, 1.0, 90),   # A4
-        Note(72, 1.0, 0.5, 85),   # C5
-        Note(74, 1.5, 1.5, 90),   # D5
-        Note(72, 4.0, 2.0, 85),   # C5
-        Note(69, 6.0, 2.0, 80),   # A4
-    ])
-    # Bar 3-4: F major feel
-    melody_notes.extend([
-        Note(77, 8.0, 1.0, 90),   # F5 (from F chord)
-        Note(76, 9.0, 0.5, 85),   # E5
-        Note(74, 9.5, 1.5, 90),   # D5
-        Note(72, 12.0, 2.0, 85),  # C5
-        Note(69, 14.0, 2.0, 80),  # A4
-    ])
-    # Bar 5-6: C major feel
-    melody_notes.extend([
-        Note(72, 16.0, 1.0, 95),  # C5
-        Note(76, 17.0, 1.0, 90),  # E5
-        Note(79, 18.0, 2.0, 95),  # G5
-        Note(76, 20.0, 1.0, 85),  # E5
-        Note(74, 21.0, 1.0, 80),  # D5
-        Note(72, 22.0, 2.0, 85),  # C5
-    ])
-    # Bar 7-8: G major feel, building back to A
-    melody_notes.extend([
-        Note(79, 24.0, 1.0, 95),  # G5
-        Note(76, 25.0, 0.5, 90),  # E5
-        Note(74, 25.5, 1.5, 90),  # D5
-        Note(71, 28.0, 1.0, 85),  # B4 (leading tone)
-        Note(72, 29.0, 1.0, 90),  # C5
-        Note(69, 30.0, 2.0, 95),  # A4 (resolve)
-    ])
-
-    clip.add_notes(2, 0, melody_notes)
-    print(f"  Lead: {len(melody_notes)} notes")
-
-    # ===== CHORDS/PAD (Track 3) =====
-    # Sustained chords: Am - F - C - G
-    chord_notes = []
-    chords = [
-        ([57, 60, 64, 69], 0),    # Am: A3, C4, E4, A4 - bars 1-2
-        ([53, 57, 60, 65], 8),    # F: F3, A3, C4, F4 - bars 3-4
-        ([48, 55, 60, 64], 16),   # C: C3, G3, C4, E4 - bars 5-6
-        ([55, 59, 62, 67], 24),   # G: G3, B3, D4, G4 - bars 7-8
-    ]
-    for pitches, start_beat in chords:
-        for pitch in pitches:
-            chord_notes.append(Note(pitch, start_beat, 7.5, 70))
-
-    clip.add_notes(3, 0, chord_notes)
-    print(f"  Chords: {len(chord_notes)} notes")
-
-    # ===== ACCENT (Track 4) =====
-    # Sparse accent hits for interest
-    accent_notes = []
-    # Add accents at key moments
-    accent_hits = [
-        (72, 7.5, 0.5, 100),   # End of bar 2 - transition marker
-        (74, 15.5, 0.5, 100),  # End of bar 4
-        (76, 23.5, 0.5, 100),  # End of bar 6
-        (79, 31.0, 1.0, 110),  # Downbeat before loop
-    ]
-    for pitch, start, dur, vel in accent_hits:
-        accent_notes.append(Note(pitch, start, dur, vel))
-
-    clip.add_notes(4, 0, accent_notes)
-    print(f"  Accent: {len(accent_notes)} notes")
-
-    total_notes = len(drum_notes) + len(bass_notes) + len(melody_notes) + len(chord_notes) + len(accent_notes)
+    print(f"  Drums: {len(DRUM_NOTES) + HAT_COUNT} notes")
+    print(f"  Bass: {len(BASS_NOTES)} notes")
+    print(f"  Lead: {len(MELODY_NOTES)} notes")
+    print(f"  Chords: {len(CHORD_NOTES)} notes")
+    print(f"  Accent: {len(ACCENT_NOTES)} notes")
+
+    # Stage 2: clip names, scene name, and all note payloads are
+    # independent of each other, so they go out as one bundle
+    with client.bundle():
+        for msg in CLIP_NAME_MSGS:
+            client.send_raw(msg)
+        client.send_raw(SCENE_NAME_MSG)
+        clip.add_notes(0, 0, DRUM_NOTES)
+        clip.add_pattern(
+            0, 0, HAT_PITCH, 0.0, HAT_STRIDE, HAT_COUNT,
+            HAT_DURATION, HAT_VEL_EVEN, HAT_VEL_ODD,
+        )
+        clip.add_notes(1, 0, BASS_NOTES)
+        clip.add_notes(2, 0, MELODY_NOTES)
+        clip.add_notes(3, 0, CHORD_NOTES)
+        clip.add_notes(4, 0, ACCENT_NOTES)
+
+    total_notes = (
+        len(DRUM_NOTES) + HAT_COUNT + len(BASS_NOTES)
+        + len(MELODY_NOTES) + len(CHORD_NOTES) + len(ACCENT_NOTES)
+    )
     print(f"\nTotal notes composed: {total_notes}")
 
     return True
@@ -191,15 +221,18 @@ def compose_song(client):
 
 def play_song(client):
     """Step 4: Fire the scene and start playback."""
-    scene = abletonosc_client.Scene(client)
-    song = abletonosc_client.Song(client)
+    scene = client.scene
+    song = client.song
 
     print("\nFiring scene 0 (Main Loop)...")
-    scene.fire(0)
+    is_playing = song.get_is_playing()
 
-    # Start playback if not already playing
-    if not song.get_is_playing():
-        song.start_playing()
+    # Fire the whole scene (all clips launch together) and start the
+    # transport in the same packet
+    with client.bundle():
+        scene.fire(0)
+        if not is_playing:
+            song.start_playing()
 
     print("Playing! Listen to your creation in Ableton.")
     print("Press Ctrl+C to stop, or let it loop.")
@@ -207,8 +240,7 @@ def play_song(client):
 
 def stop_song(client):
     """Stop playback."""
-    song = abletonosc_client.Song(client)
-    song.stop_playing()
+    client.song.stop_playing()
     print("Playback stopped.")
 
 
@@ -220,8 +252,8 @@ def main():
 
     # Connect to Ableton
     print("\nConnecting to Ableton Live...")
-    client = abletonosc_client.connect()
-    song = abletonosc_client.Song(client)
+    client = abletonosc_client.connect(cache=True)
+    song = client.song
 
     try:
         tempo = song.get_tempo()
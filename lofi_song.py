@@ -0,0 +1,279 @@
+#!/usr/bin/env python3
+"""Lofi Song - a chill 4-bar loop built end-to-end over AbletonOSC.
+
+Run this script with Ableton Live open and AbletonOSC enabled, then
+drop instruments on the created tracks (keys/bass/melody/drums).
+"""
+
+import array
+
+import abletonosc_client
+from abletonosc_client import chords
+from abletonosc_client.client import encode_message
+from abletonosc_client.clip import Note
+
+# Song data for the 4-bar loop at 72 BPM. Pure builders run once at
+# import, so the OSC steps below only pay for serialization.
+
+TRACK_NAMES = ["Keys", "Bass", "Melody", "Drums"]
+CLIP_NAMES = ["Lofi Keys", "Lofi Bass", "Lofi Melody", "Lofi Drums"]
+CLIP_LENGTH = 16.0  # 4 bars of 4/4, in beats
+TEMPO = 72.0
+
+# Track indices are derived locally from the pre-creation count plus
+# the loop position - no re-query of num_tracks per track
+KEYS, BASS, MELODY, DRUMS = range(4)
+
+
+# ===== KEYS =====
+# Fm7 - Eb - Ab - Bbm: two bars each of the first pair would be too
+# slow for 4 bars, so one bar per chord, sustained with soft velocity
+KEYS_CHORDS = (
+    (chords.FM7_VOICED, 0),                        # bar 1: Fm7
+    (tuple(chords.get_chord("Eb", "maj7", 3)), 4),  # bar 2: Ebmaj7
+    (tuple(chords.get_chord("Ab", "maj7", 3)), 8),  # bar 3: Abmaj7
+    (tuple(chords.get_chord("Bb", "min7", 3)), 12),  # bar 4: Bbm7
+)
+
+
+def _build_keys_notes():
+    return tuple(
+        note
+        for voicing, start_beat in KEYS_CHORDS
+        for note in chords.chord_notes_at(voicing, start_beat, 3.75, 60)
+    )
+
+
+# ===== BASS =====
+# Roots an octave down, lazy off-beat pushes typical of lofi
+BASS_PATTERN = (
+    (41, 0),   # F2 for bar 1
+    (39, 4),   # Eb2 for bar 2
+    (44, 8),   # Ab2 for bar 3
+    (46, 12),  # Bb2 for bar 4
+)
+
+# The two hits every bar repeats: (offset, duration, velocity)
+BASS_HITS = ((0.0, 1.5, 85), (2.5, 1.0, 75))
+
+
+def _build_bass_columns():
+    """Bass line as parallel columns, tiled like the drum lanes.
+
+    The per-bar hit shape repeats under each root, so the duration and
+    velocity columns are straight tiles and only pitch and start vary
+    by bar.
+    """
+    nhits = len(BASS_HITS)
+    pitches = array.array(
+        "b", (pitch for pitch, _ in BASS_PATTERN for _ in range(nhits))
+    )
+    starts = array.array(
+        "f", (start + offset for _, start in BASS_PATTERN for offset, _, _ in BASS_HITS)
+    )
+    durations = array.array("f", (dur for _, dur, _ in BASS_HITS)) * len(BASS_PATTERN)
+    velocities = array.array("B", (vel for _, _, vel in BASS_HITS)) * len(BASS_PATTERN)
+    return pitches, starts, durations, velocities
+
+
+# ===== MELODY =====
+# Sparse F minor pentatonic fragments, behind the beat
+MELODY_NOTES = (
+    Note(72, 0.5, 1.0, 70),   # C5
+    Note(68, 2.0, 1.5, 65),   # Ab4
+    Note(65, 5.0, 2.0, 70),   # F4
+    Note(63, 8.5, 1.0, 65),   # Eb4
+    Note(68, 10.0, 1.5, 70),  # Ab4
+    Note(70, 13.0, 1.0, 65),  # Bb4
+    Note(72, 14.5, 1.5, 75),  # C5 (into the loop)
+)
+
+
+# ===== DRUMS =====
+# Boom-bap lanes: kick C1 (36), snare D1 (38) on 2 and 4. Each lane
+# lists its in-bar offsets and matching velocities.
+DRUM_LANES = (
+    (36, (0.0, 2.25), (95, 80)),  # kick
+    (38, (1.0, 3.0), (90, 90)),   # snare
+)
+
+
+def _build_drum_columns(nbars=4):
+    """Drum skeleton as parallel columns instead of Note objects.
+
+    Structure-of-arrays form (same typecodes as NoteSequence): each
+    lane's per-bar grid is tiled across the bars with bulk extend()
+    and the lanes concatenated, then add_notes_columns packs the OSC
+    payload straight from the columns with no per-note object in
+    between.
+    """
+    pitches = array.array("b")
+    starts = array.array("f")
+    velocities = array.array("B")
+    for pitch, offsets, vels in DRUM_LANES:
+        pitches.extend([pitch] * (len(offsets) * nbars))
+        starts.extend(
+            bar * 4.0 + offset for bar in range(nbars) for offset in offsets
+        )
+        velocities.extend(vels * nbars)
+    durations = array.array("f", [0.5] * len(pitches))
+    return pitches, starts, durations, velocities
+
+
+# Hi-hats F#1 (42) on 8ths, softer off-beats - Clip.add_pattern
+# expands these stride parameters locally into one add/notes message
+HAT_PITCH = 42
+HAT_STRIDE = 0.5
+HAT_COUNT = 8 * 4  # 8 per bar for 4 bars
+HAT_DURATION = 0.25
+HAT_VEL_EVEN = 55
+HAT_VEL_ODD = 40
+
+# Mix levels per loop position (0.85 is 0dB)
+MIX_LEVELS = {KEYS: 0.75, BASS: 0.80, MELODY: 0.65, DRUMS: 0.85}
+
+KEYS_NOTES = _build_keys_notes()
+BASS_COLUMNS = _build_bass_columns()
+DRUM_COLUMNS = _build_drum_columns()
+
+# Messages that are byte-identical on every run, encoded once and
+# replayed with client.send_raw()
+TEMPO_MSG = encode_message("/live/song/set/tempo", TEMPO)
+SCENE_NAME_MSG = encode_message("/live/scene/set/name", 0, "Lofi Loop")
+
+
+def create_tracks(client):
+    """Step 1: Create the four MIDI tracks in one burst.
+
+    AbletonOSC has no bulk create endpoint, so the four creates ship
+    in one bundle and a single poll waits for Live to report them -
+    one packet plus one settle instead of a create/sleep cycle each.
+    """
+    song = client.song
+    track = client.track
+
+    base_index = song.get_num_tracks()
+    print(f"Current track count: {base_index}")
+
+    print("\nCreating 4 MIDI tracks...")
+    with client.bundle():
+        for i in range(len(TRACK_NAMES)):
+            song.create_midi_track(base_index + i)
+
+    client.wait_until(
+        "/live/song/get/num_tracks",
+        predicate=lambda r: int(r[0]) >= base_index + len(TRACK_NAMES),
+    )
+
+    # Name the tracks; indices derive from base_index, not re-queries
+    with client.bundle():
+        for i, name in enumerate(TRACK_NAMES):
+            track.set_name(base_index + i, name)
+
+    print("\nCreated tracks:")
+    indices = [base_index + i for i in range(len(TRACK_NAMES))]
+    for i, name in zip(indices, track.get_names(indices)):
+        print(f"  Track {i}: {name}")
+
+    return base_index
+
+
+def compose_song(client, base_index):
+    """Step 2: Compose the 4-bar loop onto the new tracks."""
+    clip_slot = client.clip_slot
+    clip = client.clip
+    song = client.song
+    track = client.track
+
+    client.send_raw(TEMPO_MSG)
+    print(f"Set tempo to {song.get_tempo()} BPM")
+
+    # All clips in one bundle, then one poll for the last to exist
+    print("\nCreating clips...")
+    with client.bundle():
+        for i in range(len(TRACK_NAMES)):
+            clip_slot.create_clip(base_index + i, 0, CLIP_LENGTH)
+
+    client.wait_until(
+        "/live/clip_slot/get/has_clip",
+        base_index + DRUMS, 0,
+        predicate=lambda r: bool(r[2]),
+    )
+
+    print("Composing notes...")
+    print(f"  Keys: {len(KEYS_NOTES)} notes")
+    print(f"  Bass: {len(BASS_COLUMNS[0])} notes")
+    print(f"  Melody: {len(MELODY_NOTES)} notes")
+    print(f"  Drums: {len(DRUM_COLUMNS[0]) + HAT_COUNT} notes")
+
+    # Clip names, scene name, note payloads and mix levels are
+    # independent, so they ship as one bundle; add_notes_batch packs
+    # all four clips' notes into the same datagram
+    with client.bundle():
+        for i, name in enumerate(CLIP_NAMES):
+            clip.set_name(base_index + i, 0, name)
+        client.send_raw(SCENE_NAME_MSG)
+        clip.add_notes_batch([
+            (base_index + KEYS, 0, KEYS_NOTES),
+            (base_index + MELODY, 0, MELODY_NOTES),
+        ])
+        clip.add_notes_columns(base_index + BASS, 0, *BASS_COLUMNS)
+        clip.add_notes_columns(base_index + DRUMS, 0, *DRUM_COLUMNS)
+        clip.add_pattern(
+            base_index + DRUMS, 0, HAT_PITCH, 0.0, HAT_STRIDE, HAT_COUNT,
+            HAT_DURATION, HAT_VEL_EVEN, HAT_VEL_ODD,
+        )
+        track.set_volumes(
+            {base_index + i: level for i, level in MIX_LEVELS.items()}
+        )
+
+    total = len(KEYS_NOTES) + len(BASS_COLUMNS[0]) + len(MELODY_NOTES) \
+        + len(DRUM_COLUMNS[0]) + HAT_COUNT
+    print(f"\nTotal notes composed: {total}")
+
+
+def play_song(client):
+    """Step 3: Fire the scene and start playback in one packet."""
+    song = client.song
+
+    print("\nFiring scene 0 (Lofi Loop)...")
+    is_playing = song.get_is_playing()
+    with client.bundle():
+        client.scene.fire(0)
+        if not is_playing:
+            song.start_playing()
+
+    print("Playing! Press Ctrl+C or run again to stop.")
+
+
+def main():
+    print("=" * 60)
+    print("LOFI SONG")
+    print("A chill 4-bar loop: keys, bass, melody, boom-bap drums")
+    print("=" * 60)
+
+    print("\nConnecting to Ableton Live...")
+    client = abletonosc_client.connect(cache=True)
+
+    try:
+        tempo = client.song.get_tempo()
+        print(f"Connected! Current tempo: {tempo} BPM")
+    except Exception as e:
+        print("ERROR: Could not connect to Ableton. Is AbletonOSC running?")
+        print(f"Error: {e}")
+        return
+
+    base_index = create_tracks(client)
+    print("\n>>> NOW: Drag instruments onto the new tracks in Ableton!")
+    print("    - Keys: dusty electric piano")
+    print("    - Bass: soft sub bass")
+    print("    - Melody: muted lead or guitar")
+    print("    - Drums: Drum Rack with lofi kit")
+    input(">>> Press Enter when ready to compose...")
+
+    compose_song(client, base_index)
+    play_song(client)
+
+
+if __name__ == "__main__":
+    main()